@@ -20,18 +20,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from . import support
+# All public names below are resolved lazily on first access (see __getattr__),
+# so `import selene` itself does not import Selenium's webdriver stack,
+# while the imports under TYPE_CHECKING keep them visible to type checkers and IDEs
+import importlib
+import typing
 
-from selene.core.configuration import (
-    Config as _CustomConfigForCustomBrowser,
-)
+from selene.common import _lazy
 
-Config = _CustomConfigForCustomBrowser
+if typing.TYPE_CHECKING:
+    from . import support
 
-# from .core._browser import Browser as _CustomBrowser
-from .web import Browser as _CustomBrowser
+    from selene.core.configuration import (
+        Config as _CustomConfigForCustomBrowser,
+    )
 
-Browser = _CustomBrowser
+    Config = _CustomConfigForCustomBrowser
+
+    # from .core._browser import Browser as _CustomBrowser
+    from .web import Browser as _CustomBrowser
+
+    Browser = _CustomBrowser
 
 """
 Given::
@@ -60,13 +69,14 @@ AND::
 
 """
 
-from selene import _managed  # noqa
+if typing.TYPE_CHECKING:
+    from selene import _managed  # noqa
 
-browser = _managed.browser
+    browser = _managed.browser
 
-from selene.support import by as _by_style_selectors  # noqa
+    from selene.support import by as _by_style_selectors  # noqa
 
-by = _by_style_selectors
+    by = _by_style_selectors
 """
 AND::
 
@@ -88,9 +98,10 @@ AND::
 
 """
 
-from selene.support.conditions import be as _be_style_conditions  # noqa
+if typing.TYPE_CHECKING:
+    from selene.support.conditions import be as _be_style_conditions  # noqa
 
-be = _be_style_conditions
+    be = _be_style_conditions
 """
 AND (in case we need to filter collection of items by some condition like visibility)::
 
@@ -99,9 +110,10 @@ AND (in case we need to filter collection of items by some condition like visibi
     results = browser.all('.srg .g').filtered_by(be.visible)
 """
 
-from selene.support.conditions import have as _have_style_conditions  # noqa
+if typing.TYPE_CHECKING:
+    from selene.support.conditions import have as _have_style_conditions  # noqa
 
-have = _have_style_conditions
+    have = _have_style_conditions
 """
 THEN::
     from selene import have
@@ -122,9 +134,10 @@ FINALLY (if not registered "atexit" before)::
 # Advanced Helpers #
 ####################
 
-from selene.core import command as _advanced_commands  # noqa
+if typing.TYPE_CHECKING:
+    from selene.core import command as _advanced_commands  # noqa
 
-command = _advanced_commands
+    command = _advanced_commands
 """
 Sometimes you might need some extra actions on elements,
 e.g. for workaround something through js::
@@ -134,9 +147,10 @@ e.g. for workaround something through js::
     browser.element('#not-in-view').perform(command.js.scroll_into_view)
 """
 
-from selene.core import query as _advanced_queries  # noqa
+if typing.TYPE_CHECKING:
+    from selene.core import query as _advanced_queries  # noqa
 
-query = _advanced_queries
+    query = _advanced_queries
 # its = _advanced_queries  # TODO: do we really need it too? for better readability: .get(its.text)
 """
 Probably you think that will need something like::
@@ -221,11 +235,59 @@ Or, by using non-waiting versions, if "you are in a rush:)"::
 
 """
 
-from selene.core import match  # noqa
+if typing.TYPE_CHECKING:
+    from selene.core import match  # noqa
 
-# """
-# Just types...
-# """
-from selene.web import Element, Collection  # noqa
+    # """
+    # Just types...
+    # """
+    from selene.web import Element, Collection  # noqa
 
 __version__ = '2.0.0rc9'
+
+__all__ = [
+    'support',
+    'Config',
+    'Browser',
+    'browser',
+    'by',
+    'be',
+    'have',
+    'command',
+    'query',
+    'match',
+    'Element',
+    'Collection',
+]
+
+_LAZY = {
+    # name: (module to import, its attribute or None for the module itself)
+    'support': ('selene.support', None),
+    'Config': ('selene.core.configuration', 'Config'),
+    'Browser': ('selene.web', 'Browser'),
+    'browser': ('selene._managed', 'browser'),
+    'by': ('selene.support.by', None),
+    'be': ('selene.support.conditions.be', None),
+    'have': ('selene.support.conditions.have', None),
+    'command': ('selene.core.command', None),
+    'query': ('selene.core.query', None),
+    'match': ('selene.core.match', None),
+    'Element': ('selene.web', 'Element'),
+    'Collection': ('selene.web', 'Collection'),
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        return _lazy.submodule(__name__, name)
+
+    module_name, attribute = _LAZY[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # to resolve only once, so the next access will not reach __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,97 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import concurrent.futures
+
+from typing_extensions import Optional
+
+from selene import web
+from selene.aio._elements import _SearchContext
+from selene.aio._wait import _run_blocking
+from selene.core.configuration import Config
+
+
+class Browser(_SearchContext[web.Browser]):
+    """An async version of [Browser][selene.web._context.Browser],
+    to drive many browser sessions concurrently from one event loop,
+    while all blocking WebDriver calls are run in a bounded executor
+    (by default, a thread pool shared by all async browsers).
+
+    Examples:
+        ```python
+        import asyncio
+        from selene import Config, have
+        from selene.aio import Browser
+
+
+        async def search(query):
+            browser = Browser(Config(base_url='https://duckduckgo.com'))
+            await browser.open('/')
+            await browser.element('[name=q]').type(query)
+            await browser.element('[name=q]').press_enter()
+            await browser.all('[data-testid=result]').should(have.size_greater_than(5))
+            await browser.quit()
+
+
+        async def main():
+            await asyncio.gather(*(search(query) for query in ['selene', 'yashaka']))
+
+
+        asyncio.run(main())
+        ```
+
+    !!! warning
+        The `config._wait_decorator` is not applied to async waits,
+        hence also the implicit switching to frames
+        for elements built by `element.frame_context.element(selector)`.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        super().__init__(web.Browser(config or Config()), executor=executor)
+
+    def with_(self, config: Optional[Config] = None, **config_as_kwargs) -> Browser:
+        return Browser(
+            config if config else self.config.with_(**config_as_kwargs),
+            executor=self._executor,
+        )
+
+    @property
+    def sync(self) -> web.Browser:
+        """The wrapped normal (blocking) browser"""
+        return self._entity
+
+    async def open(self, relative_or_absolute_url: Optional[str] = None) -> Browser:
+        await _run_blocking(self._executor, self._entity.open, relative_or_absolute_url)
+        return self
+
+    async def quit(self) -> None:
+        await _run_blocking(self._executor, self._entity.quit)
+
+    async def close(self) -> Browser:
+        await _run_blocking(self._executor, self._entity.close)
+        return self
@@ -0,0 +1,170 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import concurrent.futures
+
+from selenium.webdriver import Keys
+from typing_extensions import Any, Generic, Optional, Self, Tuple, TypeVar, Union
+
+from selene import web
+from selene.aio._wait import Wait, _run_blocking, _shared_executor
+from selene.common._typing_functions import Command, Query
+from selene.core.condition import Condition
+from selene.core.configuration import Config
+
+E = TypeVar('E', web.Element, web.Collection, web.Browser)
+R = TypeVar('R')
+
+
+class _AsyncEntity(Generic[E]):
+    """Wraps a normal (blocking) Selene entity, to wait on it asynchronously.
+
+    Commands, queries and conditions are the same as for normal entities
+    (like `command.js.scroll_into_view`, `query.text`, `have.text('foo')`),
+    they are just applied to the wrapped entity in a bounded executor.
+    """
+
+    def __init__(
+        self,
+        entity: E,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        self._entity = entity
+        self._executor = executor or _shared_executor()
+
+    def __str__(self):
+        return str(self._entity)
+
+    @property
+    def config(self) -> Config:
+        return self._entity.config
+
+    @property
+    def wait(self) -> Wait[E]:
+        # the wait of wrapped entity, with all its options and hooks
+        return Wait(self._entity.wait, _executor=self._executor)
+
+    def _wrap(self, entity):
+        if isinstance(entity, web.Element):
+            return Element(entity, executor=self._executor)
+        if isinstance(entity, web.Collection):
+            return Collection(entity, executor=self._executor)
+        return entity
+
+    async def perform(self, command: Command[E]) -> Self:
+        await self.wait.for_(command)
+        return self
+
+    async def get(self, query: Query[E, R]) -> R:
+        return await self.wait.for_(query)
+
+    async def should(self, condition: Condition[E]) -> Self:
+        await self.wait.for_(condition)
+        return self
+
+    async def wait_until(self, condition: Condition[E]) -> bool:
+        return await self.wait.until(condition)
+
+    async def matching(self, condition: Condition[E]) -> bool:
+        return await _run_blocking(self._executor, condition.predicate, self._entity)
+
+
+class _SearchContext(_AsyncEntity[E]):
+    def element(self, selector: Union[str, Tuple[str, str]]) -> Element:
+        return Element(self._entity.element(selector), executor=self._executor)
+
+    def all(self, selector: Union[str, Tuple[str, str]]) -> Collection:
+        return Collection(self._entity.all(selector), executor=self._executor)
+
+
+class Element(_SearchContext[web.Element]):
+    """An async version of [Element][selene.web._elements.Element]
+    with the most common commands, where each command is one async wait
+    for the same command as of the normal element (including options like
+    `config.set_value_by_js`, `config.wait_for_no_overlap_found_by_js`, etc.)
+    """
+
+    async def locate(self) -> Any:
+        return await _run_blocking(self._executor, self._entity.locate)
+
+    @property
+    def cached(self) -> Element:
+        return Element(self._entity.cached, executor=self._executor)
+
+    async def click(self, *, xoffset=0, yoffset=0) -> Element:
+        return await self.perform(
+            self._entity._click_command(xoffset=xoffset, yoffset=yoffset)
+        )
+
+    async def type(self, text: Union[str, int]) -> Element:
+        return await self.perform(self._entity._type_command(text))
+
+    async def set_value(self, value: Union[str, int]) -> Element:
+        return await self.perform(self._entity._set_value_command(value))
+
+    async def clear(self) -> Element:
+        return await self.perform(self._entity._clear_command())
+
+    async def send_keys(self, *value) -> Element:
+        return await self.perform(self._entity._send_keys_command(*value))
+
+    async def press(self, *keys) -> Element:
+        return await self.perform(self._entity._press_command(*keys))
+
+    async def press_enter(self) -> Element:
+        return await self.press(Keys.ENTER)
+
+
+class Collection(_AsyncEntity[web.Collection]):
+    """An async version of [Collection][selene.web._elements.Collection]"""
+
+    async def locate(self) -> Any:
+        return await _run_blocking(self._executor, self._entity.locate)
+
+    def __getitem__(self, index_or_slice: Union[int, slice]) -> Any:
+        return self._wrap(self._entity[index_or_slice])
+
+    def element(self, index: int) -> Element:
+        return Element(self._entity.element(index), executor=self._executor)
+
+    @property
+    def first(self) -> Element:
+        return Element(self._entity.first, executor=self._executor)
+
+    @property
+    def second(self) -> Element:
+        return Element(self._entity.second, executor=self._executor)
+
+    @property
+    def cached(self) -> Collection:
+        return Collection(self._entity.cached, executor=self._executor)
+
+    def by(self, condition: Condition[web.Element]) -> Collection:
+        return Collection(self._entity.by(condition), executor=self._executor)
+
+    def element_by(self, condition: Condition[web.Element]) -> Element:
+        return Element(self._entity.element_by(condition), executor=self._executor)
+
+    def all(self, selector: Union[str, Tuple[str, str]]) -> Collection:
+        return Collection(self._entity.all(selector), executor=self._executor)
@@ -0,0 +1,192 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import threading
+import time
+
+from typing_extensions import Callable, Dict, Generic, Optional, TypeVar, Any
+
+from selene.common.fp import identity
+from selene.core import wait as _wait
+from selene.core.exceptions import TimeoutException
+from selene.core.locator import _evaluation_memo
+
+E = TypeVar('E')
+R = TypeVar('R')
+
+_DEFAULT_MAX_WORKERS = 32
+
+_default_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> concurrent.futures.Executor:
+    """The bounded thread pool shared by all async entities by default,
+    to run blocking WebDriver calls in
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_DEFAULT_MAX_WORKERS,
+                thread_name_prefix='selene-aio',
+            )
+        return _default_executor
+
+
+async def _run_blocking(
+    executor: concurrent.futures.Executor, fn: Callable[..., R], *args: Any
+) -> R:
+    # like asyncio.to_thread, runs in a copy of current context
+    return await _run_blocking_in(contextvars.copy_context(), executor, fn, *args)
+
+
+async def _run_blocking_in(
+    context: contextvars.Context,
+    executor: concurrent.futures.Executor,
+    fn: Callable[..., R],
+    *args: Any,
+) -> R:
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(context.run, fn, *args)
+    )
+
+
+class Wait(Generic[E]):
+    """An async version of [Wait][selene.core.wait.Wait],
+    that runs each attempt of `fn` on the (normal, blocking) entity
+    in the `_executor`, and awaits between attempts by `asyncio.sleep`,
+    so the event loop can run other waits meanwhile,
+    without occupying a worker of the `_executor` for the whole waiting.
+
+    Reuses the options of the wrapped normal `wait`
+    (timeout, failure hook, `_poll`, `_retry`, `_on_failed_attempt`,
+    `_report` and `_pause`), except its `_decorator`,
+    that can decorate only the blocking waiting.
+    """
+
+    def __init__(
+        self,
+        wait: _wait.Wait[E],
+        *,
+        _executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        self._wait = wait
+        self._executor = _executor or _shared_executor()
+
+    @property
+    def entity(self) -> E:
+        return self._wait.entity
+
+    @property
+    def sync(self) -> _wait.Wait[E]:
+        """The wrapped normal (blocking) wait"""
+        return self._wait
+
+    def at_most(self, timeout: float) -> Wait[E]:
+        return Wait(self._wait.at_most(timeout), _executor=self._executor)
+
+    def or_fail_with(
+        self, hook_failure: Optional[Callable[[TimeoutException], Exception]]
+    ) -> Wait[E]:
+        return Wait(self._wait.or_fail_with(hook_failure), _executor=self._executor)
+
+    @property
+    def hook_failure(self) -> Optional[Callable[[TimeoutException], Exception]]:
+        return self._wait.hook_failure
+
+    async def for_(self, fn: Callable[[E], R]) -> R:
+        wait = self._wait
+        # all attempts are run in one copy of current context, so, like in
+        # normal wait, nested waits consume the budget of this one,
+        # do not reuse elements located by outer evaluation,
+        # and WebDriver calls of all attempts are counted for the report
+        context = contextvars.copy_context()
+        outer = context.run(_wait._current_deadline.get)
+        deadline = context.run(_wait._deadline_within_budget, wait._timeout)
+        context.run(_wait._current_deadline.set, deadline)
+        context.run(_evaluation_memo.set, None)
+        narrowed = deadline is outer
+
+        def run(fn: Callable[..., R], *args: Any):
+            return _run_blocking_in(context, self._executor, fn, *args)
+
+        failures: Dict[str, int] = {}
+        attempts = 0
+        started = time.monotonic()
+        calls = context.run(_wait._webdriver_calls.get)
+        succeeded = False
+        try:
+            while True:
+                attempts += 1
+                try:
+                    result = await run(fn, wait.entity)
+                    succeeded = True
+                    return result
+                except Exception as reason:
+                    if wait._report is not None:
+                        name = reason.__class__.__name__
+                        failures[name] = failures.get(name, 0) + 1
+
+                    # failure hooks may take screenshots, i.e. are blocking too
+                    delay = await run(
+                        wait._after_failed,
+                        fn,
+                        reason,
+                        attempts,
+                        started,
+                        deadline,
+                        narrowed,
+                    )
+                    remaining = deadline.remaining
+                    delay = min(delay, remaining)
+                    if wait._pause and remaining > 0:
+                        await run(wait._pause, wait.entity, delay, remaining)
+                    else:
+                        # even without polling delay, let other tasks run meanwhile
+                        await asyncio.sleep(delay)
+        finally:
+            if wait._report is not None:
+                wait._report(
+                    wait._event(
+                        fn,
+                        attempts=attempts,
+                        duration=time.monotonic() - started,
+                        succeeded=succeeded,
+                        exceptions=failures,
+                        webdriver_calls=(
+                            context.run(_wait._webdriver_calls.get) - calls
+                        ),
+                    )
+                )
+
+    async def until(self, fn: Callable[[E], R]) -> bool:
+        try:
+            await self.or_fail_with(identity).for_(fn)
+            return True
+        except TimeoutException:
+            return False
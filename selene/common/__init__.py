@@ -1 +1,9 @@
 # TODO: consider renaming this package to _common
+
+from selene.common import _lazy
+
+
+def __getattr__(name: str):
+    # submodules like selene.common.predicate are imported on first access,
+    # same as in selene/__init__.py
+    return _lazy.submodule(__name__, name)
@@ -0,0 +1,39 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for packages that import their contents lazily on first access
+(from their module level `__getattr__`), to keep `import selene` light.
+"""
+
+import importlib
+import importlib.util
+
+
+def submodule(package: str, name: str):
+    """Imports and returns the `name` submodule (or subpackage) of `package`,
+    so `import selene` followed by access like `selene.core.query`
+    keeps working the same way as when all submodules were imported eagerly.
+    Raises AttributeError, as a normal attribute access does,
+    if there is no such submodule.
+    """
+    if not name.startswith('__') and importlib.util.find_spec(f'{package}.{name}'):
+        return importlib.import_module(f'{package}.{name}')
+    raise AttributeError(f'module {package!r} has no attribute {name!r}')
@@ -27,3 +27,11 @@ def _is_mobile_element(element):
     except ImportError:
         return False
     return isinstance(element, MobileElement)
+
+
+def _is_mobile_driver(driver):
+    try:
+        from appium.webdriver.webdriver import WebDriver as MobileDriver
+    except ImportError:
+        return False
+    return isinstance(driver, MobileDriver)
@@ -21,10 +21,41 @@
 # SOFTWARE.
 from __future__ import annotations
 
-from selene.core._element import Element
-from selene.core._elements import All
-from selene.core.entity import Collection
-from selene.core._elements_context import _ElementsContext
-from selene.core._client import Client
+import importlib
+import typing
+
+from selene.common import _lazy
+
+if typing.TYPE_CHECKING:
+    from selene.core._element import Element
+    from selene.core._elements import All
+    from selene.core.entity import Collection
+    from selene.core._elements_context import _ElementsContext
+    from selene.core._client import Client
+
+# resolved lazily on first access (see __getattr__),
+# so importing some light submodule, like selene.core.locator,
+# does not import all the entities and Selenium's webdriver stack
+_LAZY = {
+    'Element': 'selene.core._element',
+    'All': 'selene.core._elements',
+    'Collection': 'selene.core.entity',
+    '_ElementsContext': 'selene.core._elements_context',
+    'Client': 'selene.core._client',
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        return _lazy.submodule(__name__, name)
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
+
 
 # TODO: should we break core.* into [core.]model.* and [core.]webdriver.*?
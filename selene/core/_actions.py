@@ -94,6 +94,10 @@ class _Actions:
 
         self._config.wait(self._chain).for_(Command(str(self.__encoded), actions))  # type: ignore
 
+    def _perform_once(self) -> None:
+        """Performs all queued actions by one W3C call, without any waiting"""
+        self._chain.perform()
+
     @property
     def __encoded(self):
         return {
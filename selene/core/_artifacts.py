@@ -0,0 +1,107 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Writing failure artifacts (screenshots, page sources) in background,
+so the failure path of waiting only captures their content from the driver,
+while compressing, deduplicating and writing to disk happens in a worker thread.
+
+Used by `config._save_screenshot_strategy` and `config._save_page_source_strategy`
+if `config._save_artifacts_in_background` is turned on.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import hashlib
+import os
+import queue
+import threading
+from typing_extensions import Dict, Optional, Tuple
+
+
+class _ArtifactWriter:
+    """Writes artifacts in one background thread through a bounded queue
+    (so the callers are blocked only if the writer can't keep up),
+    storing the same content only once per run – the duplicates are written
+    as hard links to the first written file (if supported by file system).
+    """
+
+    def __init__(self, max_queued: int = 64):
+        self._queue: queue.Queue[Tuple[str, bytes, bool]] = queue.Queue(max_queued)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._written: Dict[str, str] = {}  # content hash -> path
+
+    def submit(self, path: str, content: bytes, *, compress: bool = False) -> str:
+        """Schedules writing of content to path (appending '.gz' if compressed),
+        returns the final path at once, not waiting for the content to be written
+        """
+        self._ensure_worker()
+        final_path = path + '.gz' if compress else path
+        self._queue.put((final_path, content, compress))
+        return final_path
+
+    def flush(self) -> None:
+        """Waits till all submitted artifacts are written"""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._work, name='selene-artifact-writer', daemon=True
+            )
+            self._worker.start()
+            atexit.register(self.flush)
+
+    def _work(self) -> None:
+        while True:
+            path, content, compress = self._queue.get()
+            try:
+                self._write(path, content, compress)
+            except OSError:
+                pass  # ignored as in fp.write_silently
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, content: bytes, compress: bool) -> None:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        digest = hashlib.sha256(content).hexdigest() + ('.gz' if compress else '')
+        duplicate_of = self._written.get(digest)
+        if duplicate_of and os.path.exists(duplicate_of):
+            try:
+                os.link(duplicate_of, path)
+                return
+            except OSError:
+                pass  # e.g. hard links are not supported, let's just write
+
+        with open(path, 'wb') as file:
+            file.write(gzip.compress(content) if compress else content)
+        self._written[digest] = path
+
+
+_writer = _ArtifactWriter()
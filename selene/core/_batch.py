@@ -0,0 +1,242 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Batched command transactions, i.e. element commands queued by
+`browser._batch()` and flushed all together: by one `execute_script` call
+(setting values and clicking by JavaScript) or by one W3C actions `perform`
+(native input), instead of separate waits and 2-3 WebDriver calls per command.
+"""
+
+from __future__ import annotations
+
+from selenium.webdriver import Keys
+from typing_extensions import Any, List, Literal, NamedTuple, Union
+
+from selene.common._typing_functions import Command
+from selene.core._actions import _Actions
+from selene.core.exceptions import _SeleneError
+
+_FLUSH_SCRIPT = '''
+const steps = arguments[0];
+
+for (let index = 0; index < steps.length; index++) {
+    const [element, action, value] = steps[index];
+    try {
+        if (action === 'click') {
+            element.click();
+            continue;
+        }
+        const text = action === 'type' ? (element.value || '') + value : value;
+        const maxlength = element.getAttribute('maxlength') === null
+            ? -1
+            : parseInt(element.getAttribute('maxlength'));
+        element.value = maxlength === -1 ? text : text.substring(0, maxlength);
+    } catch (error) {
+        return [index, String(error)];
+    }
+}
+return null;
+'''
+
+
+def _select_all_key(driver) -> str:
+    """Returns the modifier key to select all text by in the browser of `driver`,
+    i.e. on the platform the browser runs at (that may differ from the local one
+    in case of remote driver)
+    """
+    return Keys.COMMAND if _is_mac(driver) else Keys.CONTROL
+
+
+def _end_of_text_keys(driver) -> tuple[str, str]:
+    """Returns the modifier and the key to move the caret by
+    to the end of text (including multiline text in textarea)
+    in the browser of `driver`
+    """
+    return (
+        (Keys.COMMAND, Keys.ARROW_DOWN) if _is_mac(driver) else (Keys.CONTROL, Keys.END)
+    )
+
+
+def _is_mac(driver) -> bool:
+    return driver.capabilities.get('platformName', '').lower().startswith('mac')
+
+
+class _Step(NamedTuple):
+    element: Any
+    action: Literal['set_value', 'type', 'click']
+    value: str
+    name: str
+
+    def __str__(self):
+        return f'{self.element}.{self.name}'
+
+
+class _Batch:
+    """Queues commands against elements to flush them all together
+    on exiting the `with` statement (or on explicit `flush()`),
+    locating all elements in one pass and then:
+
+    - either by one `execute_script` call, if `by='js'` (default),
+      setting values same way as `command.js.set_value` and `command.js.type`
+      do, and clicking by `element.click()` in JavaScript,
+    - or by one W3C actions `perform` call, if `by='actions'`,
+      i.e. by native input via [_Actions][selene.core._actions._Actions].
+
+    Locating elements and (in case of JavaScript) executing the steps
+    is waited for as one command, resuming from the failed step on next attempt.
+    The failure is reported with the step number and its element description.
+    Actions are not retried, because some of them may be already dispatched.
+
+    Examples:
+        ```python
+        from selene import browser
+
+        with browser._batch() as batch:
+            batch.set_value(browser.element('#first-name'), 'Yakiv')
+            batch.set_value(browser.element('#last-name'), 'Kramarenko')
+            batch.click(browser.element('#agree'))
+        ```
+
+    !!! warning
+        The batch does not wait for each element to be visible or interactable
+        as normal commands do. And setting value by JavaScript does not trigger
+        keyboard events like `input` or `change` in the browser.
+    """
+
+    def __init__(self, context, *, by: Literal['js', 'actions'] = 'js'):
+        self._context = context
+        self._config = context.config
+        self._by = by
+        self._steps: List[_Step] = []
+
+    def __str__(self):
+        return f'{self._context}._batch(by={self._by!r})'
+
+    def __enter__(self) -> _Batch:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._steps = []
+
+    def _by_js_or(self, name: str) -> str:
+        return f'{name} by js' if self._by == 'js' else name
+
+    def set_value(self, element, value: Union[str, int]) -> _Batch:
+        self._steps.append(
+            _Step(
+                element,
+                'set_value',
+                str(value),
+                f'{self._by_js_or("set value")}: {value}',
+            )
+        )
+        return self
+
+    def type(self, element, text: Union[str, int]) -> _Batch:
+        self._steps.append(
+            _Step(element, 'type', str(text), f'{self._by_js_or("type")}: {text}')
+        )
+        return self
+
+    def click(self, element) -> _Batch:
+        self._steps.append(_Step(element, 'click', '', self._by_js_or('click')))
+        return self
+
+    def flush(self) -> None:
+        steps, self._steps = self._steps, []
+        if not steps:
+            return
+
+        done = 0
+
+        def failure(index: int, reason: str) -> _SeleneError:
+            return _SeleneError(
+                f'failed on step {index + 1} of {len(steps)}: '
+                f'{steps[index]}: {reason}'
+            )
+
+        def locate(from_: int) -> List[Any]:
+            webelements = []
+            for index in range(from_, len(steps)):
+                try:
+                    webelements.append(steps[index].element.locate())
+                except Exception as reason:
+                    raise failure(
+                        index, f'{reason.__class__.__name__}: {reason}'
+                    ) from reason
+            return webelements
+
+        def flush_by_js(batch: _Batch) -> None:
+            nonlocal done
+            webelements = locate(done)
+            failed = self._config.driver.execute_script(
+                _FLUSH_SCRIPT,
+                [
+                    [webelement, step.action, step.value]
+                    for webelement, step in zip(webelements, steps[done:])
+                ],
+            )
+            if failed is not None:
+                index, reason = failed
+                done += index
+                raise failure(done, reason)
+            done = len(steps)
+
+        if self._by == 'js':
+            self._config.wait(self).for_(
+                Command(f'flush {len(steps)} steps', flush_by_js)
+            )
+            return
+
+        webelements: List[Any] = []
+
+        def resolve(batch: _Batch) -> None:
+            webelements[:] = locate(0)
+
+        self._config.wait(self).for_(
+            Command(f'locate elements of {len(steps)} steps', resolve)
+        )
+
+        actions = _Actions(self._config)
+        select_all_key = _select_all_key(self._config.driver)
+        end_modifier, end_key = _end_of_text_keys(self._config.driver)
+        for webelement, step in zip(webelements, steps):
+            actions.click(webelement)
+            if step.action == 'set_value':
+                actions.key_down(select_all_key).send_keys('a').key_up(select_all_key)
+                actions.send_keys(Keys.BACKSPACE)
+            if step.action == 'type':
+                # the click puts the caret where it lands,
+                # while typing should append, same as by js
+                actions.key_down(end_modifier).send_keys(end_key).key_up(end_modifier)
+            if step.value:
+                actions.send_keys(step.value)
+        try:
+            actions._perform_once()
+        except Exception as reason:
+            raise _SeleneError(
+                f'failed to perform actions of {len(steps)} steps of {self}: '
+                + '; '.join(map(str, steps))
+                + f'\nReason: {reason.__class__.__name__}: {reason}'
+            ) from reason
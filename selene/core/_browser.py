@@ -83,7 +83,9 @@ class Browser(Client):
         )
         from selene.core import query
 
+        self.config._executor.reset_frame_path()
         self.driver.switch_to.window(query.next_tab(self))
+        self.config._executor.invalidate_located_cache()
 
         # TODO: should we use waiting version here (and in other similar cases)?
         # self.perform(Command(
@@ -99,7 +101,9 @@ class Browser(Client):
         )
         from selene.core import query
 
+        self.config._executor.reset_frame_path()
         self.driver.switch_to.window(query.previous_tab(self))
+        self.config._executor.invalidate_located_cache()
         return self
 
     def switch_to_tab(self, index_or_name: Union[int, str]) -> Browser:
@@ -107,6 +111,7 @@ class Browser(Client):
             'browser.switch_to_tab is deprecated',
             DeprecationWarning,
         )
+        self.config._executor.reset_frame_path()
         if isinstance(index_or_name, int):
             index = index_or_name
             from selene.core import query
@@ -114,6 +119,7 @@ class Browser(Client):
             self.driver.switch_to.window(query.tab(index)(self))
         else:
             self.driver.switch_to.window(index_or_name)
+        self.config._executor.invalidate_located_cache()
 
         return self
 
@@ -40,6 +40,7 @@ from selene.common.helpers import (
 from selene.core.condition import Condition as Condition
 from selene.core.configuration import Config as Config
 from selene.core.exceptions import TimeoutException as TimeoutException
+from selene.core._batch import _Batch
 from selene.core.locator import Locator as Locator
 from selene.core.wait import Wait as Wait
 from selene.common._typing_functions import Query as Query, Command as Command
@@ -123,6 +124,7 @@ class Browser(_WaitingConfiguredEntity):
     def driver(self) -> WebDriver: ...
     @property
     def __raw__(self): ...
+    def _batch(self, *, by: Literal['js', 'actions'] = ...) -> _Batch: ...
     def element(
         self, css_or_xpath_or_by: Union[str, Tuple[str, str], Locator]
     ) -> Element: ...
@@ -0,0 +1,192 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Chains of selectors of elements searched one inside another, like in
+`browser.element('#form').element('.row').element('input')`,
+compiled to be searched by one driver call instead of one call per each link.
+
+If all links but the first one are relative XPath selectors
+(starting with `.`), then the chain is compiled to one XPath selector,
+where each link but the last one is limited to its first match,
+like `((//form)[1]/.//*[@class="row"])[1]/.//input`,
+so the first-match semantics of dependent `find_element` calls is kept.
+
+Otherwise, if all links are CSS or XPath selectors,
+then the chain is searched by one `execute_script` call,
+that applies `querySelector` (or `document.evaluate` for XPath)
+to the first match of the previous link, the same way as WebDriver does.
+
+In both cases, if nothing is found, the caller should fall back to
+the uncompiled search, so WebDriver reports the absent link in its own way.
+
+Used under the hood by `element.element(selector)` and `element.all(selector)`,
+if `config._compile_selector_chains` is turned on.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from selenium.common import (
+    JavascriptException,
+    NoSuchElementException,
+    UnknownMethodException,
+)
+from typing_extensions import NamedTuple, Optional, Tuple, Callable, Any, List
+
+from selene.common import appium_tools
+
+_SCRIPT = '''
+const [root, steps, all] = arguments;
+
+const byXpath = (context, selector, type) =>
+    document.evaluate(selector, context, null, type, null);
+const elementsOnly = nodes => {
+    if (nodes.some(node => node.nodeType !== Node.ELEMENT_NODE)) {
+        throw new Error('xpath result is not an element');
+    }
+    return nodes;
+};
+const findFirst = (context, [how, selector]) => {
+    if (how !== 'xpath') {
+        return context.querySelector(selector);
+    }
+    const found = byXpath(
+        context, selector, XPathResult.FIRST_ORDERED_NODE_TYPE
+    ).singleNodeValue;
+    return found && elementsOnly([found])[0];
+};
+const findAll = (context, [how, selector]) => {
+    if (how !== 'xpath') {
+        return Array.from(context.querySelectorAll(selector));
+    }
+    const found = byXpath(
+        context, selector, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE
+    );
+    return elementsOnly(
+        Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i))
+    );
+};
+
+let context = root || document;
+for (const step of steps.slice(0, -1)) {
+    context = findFirst(context, step);
+    if (!context) {
+        return null;
+    }
+}
+return all ? findAll(context, steps[steps.length - 1])
+    : findFirst(context, steps[steps.length - 1]);
+'''
+
+_COMPILABLE = ('css selector', 'xpath')
+
+
+class _Chain(NamedTuple):
+    """Selectors of elements searched one inside another,
+    starting from the search context returned by `root`,
+    or from the driver (i.e. the whole document) if `root` is None.
+
+    Each chain keeps only its last link and a pointer to its parent chain,
+    so extending a chain (on each `element.element(selector)` build) is O(1),
+    while the tuple of all links is collected only on compilation.
+    """
+
+    root: Optional[Callable[[], Any]]
+    parent: Optional[_Chain]
+    by: Tuple[str, str]
+
+    @classmethod
+    def of(
+        cls, root: Optional[Callable[[], Any]], by: Tuple[str, str]
+    ) -> Optional[_Chain]:
+        return cls(root, None, by) if by[0] in _COMPILABLE else None
+
+    def then(self, by: Tuple[str, str]) -> Optional[_Chain]:
+        """Returns the chain extended by `by`, or None if it can't be compiled"""
+        return _Chain(self.root, self, by) if by[0] in _COMPILABLE else None
+
+    @property
+    def links(self) -> Tuple[Tuple[str, str], ...]:
+        links = []
+        chain: Optional[_Chain] = self
+        while chain is not None:
+            links.append(chain.by)
+            chain = chain.parent
+        return tuple(reversed(links))
+
+    @staticmethod
+    def xpath_of(links: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+        """The links compiled to one XPath selector, or None if not possible"""
+        (first_how, first), *others = links
+        if first_how != 'xpath' or not all(
+            how == 'xpath' and selector.startswith('.') and '|' not in selector
+            for how, selector in others
+        ):
+            return None
+        return functools.reduce(
+            lambda compiled, link: f'({compiled})[1]/{link[1]}', others, first
+        )
+
+    @property
+    def xpath(self) -> Optional[str]:
+        """The chain compiled to one XPath selector, or None if not possible"""
+        return self.xpath_of(self.links)
+
+
+def _find(config, chain: _Chain, *, all=False) -> Optional[Any]:
+    """Returns the element (or all elements if `all` is True) found by the chain
+    by one driver call, or None if nothing is found (or some not last link
+    is absent in case of `all`), or the chain can't be compiled,
+    so the caller should fall back to the uncompiled search.
+    """
+    if chain.parent is None:
+        return None
+    links = chain.links
+
+    driver = config.driver
+    context = chain.root() if chain.root else driver
+
+    xpath = _Chain.xpath_of(links)
+    if xpath is not None:
+        if all:
+            # empty result may mean absent parent as well, should be checked
+            return context.find_elements('xpath', xpath) or None
+        try:
+            return context.find_element('xpath', xpath)
+        except NoSuchElementException:
+            return None
+
+    if chain.root and appium_tools._is_mobile_element(context):
+        return None
+    try:
+        return driver.execute_script(
+            _SCRIPT,
+            context if chain.root else None,
+            [list(link) for link in links],
+            all,
+        )
+    except (JavascriptException, UnknownMethodException):
+        return None
+
+
+def _find_all(config, chain: _Chain) -> Optional[List[Any]]:
+    return _find(config, chain, all=True)
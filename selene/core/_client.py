@@ -21,12 +21,13 @@
 # SOFTWARE.
 from __future__ import annotations
 
-from typing_extensions import Optional, Callable, Sequence
+from typing_extensions import Optional, Callable, Sequence, Literal
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from selene.core._actions import _Actions
+from selene.core._batch import _Batch
 from selene.core._elements import All
 from selene.core._elements_context import _ElementsContext
 from selene.core.configuration import Config
@@ -78,6 +79,13 @@ class Client(
     def _actions(self) -> _Actions:
         return _Actions(self.config)
 
+    def _batch(self, *, by: Literal['js', 'actions'] = 'js') -> _Batch:
+        """Returns a context manager to queue element commands
+        and flush them all together on exit,
+        see [_Batch][selene.core._batch._Batch] for more details.
+        """
+        return _Batch(self, by=by)
+
     # --- High Level Commands--- #
 
     # # TODO: do we need it as part of a most general search context?
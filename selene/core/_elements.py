@@ -75,12 +75,13 @@ class All(
     # --- Iterable --- #
 
     def __iter__(self):
-        i = 0
-        cached = self.cached
-        while i < len(cached.locate()):
-            element = cached[i]
-            yield element
-            i += 1
+        # iterating over one "snapshot" of located webelements
+        webelements = self.locate()
+        cached = self._build_(
+            locator=Locator(lambda: f'{self}.cached', lambda: webelements)
+        )
+        for index in range(len(webelements)):
+            yield cached[index]
 
     # todo: consider config.index_collection_from_1, disabled by default
     # todo: consider additional number param, that counts from 1
@@ -99,7 +100,7 @@ class All(
             return webelements[index]
 
         return self._Element(
-            Locator(f'{self}[{index}]', find),
+            Locator(lambda: f'{self}[{index}]', find),
             self.config,
         )
 
@@ -159,7 +160,7 @@ class All(
 
         return self._build_(
             locator=Locator(
-                f'{self}[{start or ""}'
+                lambda: f'{self}[{start or ""}'
                 f':{stop or ""}'
                 f'{":" + str(step) if step else ""}]',
                 find,
@@ -198,7 +199,7 @@ class All(
 
         return self._build_(
             locator=Locator(
-                f'{self}.filtered_by({condition})',
+                lambda: f'{self}.filtered_by({condition})',
                 lambda: [
                     element() for element in self.cached if element.matching(condition)
                 ],
@@ -346,7 +347,7 @@ class All(
             )
 
         return self._Element(
-            Locator(f'{self}.element_by({condition})', find),
+            Locator(lambda: f'{self}.element_by({condition})', find),
             self.config,
         )
 
@@ -437,7 +438,7 @@ class All(
 
         return self._build_(
             locator=Locator(
-                f'{self}.collected({finder})',
+                lambda: f'{self}.collected({finder})',
                 # TODO: consider skipping None while flattening
                 lambda: typing.cast(
                     typing.Sequence[WebElement],
@@ -479,7 +480,7 @@ class All(
 
         return self._build_(
             locator=Locator(
-                f'{self}.all({by})',
+                lambda: f'{self}.all({by})',
                 lambda: typing.cast(
                     typing.Sequence[WebElement],
                     flatten(
@@ -524,7 +525,7 @@ class All(
 
         return self._build_(
             locator=Locator(
-                f'{self}.all_first({by})',
+                lambda: f'{self}.all_first({by})',
                 lambda: [webelement.find_element(*by) for webelement in self.locate()],
             ),
             config=self.config,
@@ -107,7 +107,7 @@ class _ElementsContext(
 
         return self._Element(
             Locator(
-                f'{self}.element({by})',
+                lambda: f'{self}.element({by})',
                 lambda: self.locate().find_element(*by),
             ),
             self.config,
@@ -134,7 +134,7 @@ class _ElementsContext(
 
         return self._All(
             Locator(
-                f'{self}.all({by})',
+                lambda: f'{self}.all({by})',
                 lambda: self.locate().find_elements(*by),
             ),
             self.config,
@@ -29,8 +29,8 @@ from typing_extensions import Self, Optional, TypeVar
 from selene.common._typing_functions import Command, Query
 from selene.core.condition import Condition
 from selene.core.configuration import Config
-from selene.core.locator import Locator
-from selene.core.wait import Wait
+from selene.core.locator import Locator, _LazyCachedLocator
+from selene.core.wait import Wait, _budget
 
 
 # TODO: can we remove it? and call super().__init__() directly inside _Entity?
@@ -122,10 +122,26 @@ R = TypeVar('R')
 class _WaitingConfiguredEntity(_ConfiguredEntity, Assertable, Matchable):
     def __init__(self, config: Config, **kwargs):
         super().__init__(config=config, **kwargs)
+        self._wait_memo: Optional[typing.Tuple[int, Wait[Self]]] = None
 
     @property
     def wait(self) -> Wait[Self]:
-        return self.config._wait(self)
+        # the built wait will share the remaining budget of an outer wait if any,
+        # see selene.core.wait._budget
+        return self._memoizing_wait(lambda: self.config._wait(self))
+
+    def _memoizing_wait(self, build: typing.Callable[[], Wait[Self]]) -> Wait[Self]:
+        """Returns the Wait built by `build` on first call,
+        reusing it on next calls until any of the config options
+        it depends on is changed (see `config._memoize_waits`).
+        """
+        config = self.config
+        if not config._memoize_waits:
+            return build()
+        version = config._wait_options_version
+        if self._wait_memo is None or self._wait_memo[0] != version:
+            self._wait_memo = (version, build())
+        return self._wait_memo[1]
 
     # TODO: could we pass commands that are narrower than Self?
     def perform(self, command: Command[Self]) -> Self:
@@ -177,7 +193,11 @@ class _WaitingConfiguredEntity(_ConfiguredEntity, Assertable, Matchable):
         return self.wait.until(condition)
 
     def matching(self, condition: Condition[Self]) -> bool:
-        return condition.predicate(self)
+        # matching itself does not wait, but the condition might wait inside,
+        # then all such nested waits should fit into one timeout together
+        # (or into the remaining budget of the outer wait if matching is called inside)
+        with _budget(self.config.timeout):
+            return condition.predicate(self)
 
 
 # TODO: consider _LazyCachableLocatableEntity?
@@ -187,16 +207,13 @@ class _CachedLocatableEntity(_LocatableEntity[LR]):
 
     @property
     def cached(self) -> Self:
-        cache = None
-        error = None
-        try:
-            cache = self.locate()
-        except Exception as e:
-            error = e
-
-        def get_cache():
-            if cache:
-                return cache
-            raise error
-
-        return self._build_(locator=Locator(f'{self}.cached', get_cache))
+        # the entity is expected to be also configured, see its subclasses
+        config = getattr(self, 'config', None)
+
+        return self._build_(
+            locator=_LazyCachedLocator(
+                lambda: f'{self}.cached',
+                self.locate,
+                ttl=config._cached_entities_ttl if config else None,
+            )
+        )
@@ -0,0 +1,123 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Filling and reading all fields of a form-like element by one
+`execute_script` call, used under the hood by `element.fill(values)`
+and `query.form_values`.
+
+A field is referred by its name, id or css selector relative to the form.
+"""
+
+from __future__ import annotations
+
+_FIELDS = '''
+const fieldsOf = (container, key) => {
+    const byName = container.querySelectorAll(`[name="${CSS.escape(key)}"]`);
+    if (byName.length) return [...byName];
+    const byId = container.querySelector(`#${CSS.escape(key)}`);
+    if (byId) return [byId];
+    try {
+        return [...container.querySelectorAll(key)];
+    } catch (error) {
+        return [];
+    }
+};
+'''
+
+_FILL_SCRIPT = _FIELDS + '''
+const [form, values] = arguments;
+
+const radioOf = (found, value) => found.find(it => it.value === String(value));
+const fields = Object.entries(values).map(([key, value]) => [
+    key, fieldsOf(form, key), value
+]);
+const missing = fields.filter(([, found, value]) =>
+    !found.length || (found[0].type === 'radio' && !radioOf(found, value))
+).map(([key, found, value]) => found.length ? `${key}=${value}` : key);
+if (missing.length) return missing;
+
+const changed = field => {
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+};
+
+for (const [, found, value] of fields) {
+    const [field] = found;
+    if (field.type === 'radio') {
+        const radio = radioOf(found, value);
+        radio.checked = true;
+        changed(radio);
+    } else if (field.type === 'checkbox') {
+        field.checked = Boolean(value);
+        changed(field);
+    } else if (field.multiple && Array.isArray(value)) {
+        const selected = value.map(String);
+        [...field.options].forEach(option => {
+            option.selected = selected.includes(option.value);
+        });
+        changed(field);
+    } else {
+        const text = String(value);
+        const maxlength = field.getAttribute('maxlength') === null
+            ? -1
+            : parseInt(field.getAttribute('maxlength'));
+        field.value = maxlength === -1 ? text : text.substring(0, maxlength);
+        changed(field);
+    }
+}
+return [];
+'''
+"""Sets values of fields of the form (arguments[0]) by the mapping (arguments[1])
+of field names/ids/selectors to values, truncating text values by maxlength
+same way as `command.js.set_value` does, and dispatching `input` and `change`
+events for each changed field. If any field is not found,
+or any radio group has no radio of the given value, sets nothing
+and returns the list of such keys (as `key=value` for radio groups).
+"""
+
+_VALUES_SCRIPT = '''
+const form = arguments[0];
+const values = {};
+
+form.querySelectorAll('input, select, textarea').forEach(field => {
+    const key = field.name || field.id;
+    if (!key || ['submit', 'button', 'reset', 'image'].includes(field.type)) {
+        return;
+    }
+    if (field.type === 'radio') {
+        if (field.checked || !(key in values)) {
+            values[key] = field.checked ? field.value : null;
+        }
+    } else if (field.type === 'checkbox') {
+        values[key] = field.checked;
+    } else if (field.multiple) {
+        values[key] = [...field.selectedOptions].map(option => option.value);
+    } else {
+        values[key] = field.value;
+    }
+});
+return values;
+'''
+"""Returns values of all named (or having id) fields of the form (arguments[0]),
+as checked state for checkboxes, the value of checked radio (or null)
+for radio groups, the list of selected values for multiple selects,
+and just value for other fields.
+"""
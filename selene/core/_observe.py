@@ -0,0 +1,140 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Event-driven pauses between failed attempts of Selene waiting:
+instead of sleeping a fixed polling delay, the pause blocks inside one
+`execute_async_script` call with a `MutationObserver` installed,
+until some relevant mutation happens. So while nothing changes,
+the condition is not re-evaluated in vain, and once something changes,
+the next attempt notices the change right after it, not up to one poll later.
+Though, the attempts are still made not more often than by polling,
+so a page that mutates all the time does not make waiting a busy loop.
+
+Used under the hood by all Selene waiting
+if `config._wait_for_dom_mutations` is turned on.
+
+The observer is scoped to the located element of the waited entity,
+i.e. to any mutation inside the element or to attributes and children
+of its ancestors (e.g. hiding the element by its parent's class),
+or, if the entity is not an element or is not located yet,
+to the whole document.
+
+Changes that are not DOM mutations (like typing into input that changes
+its `value` property, or CSS transitions) are not observed,
+so the pause is limited to a slice of the remaining timeout
+and to a small multiple of the polling delay,
+after which the condition is re-evaluated anyway.
+"""
+
+from __future__ import annotations
+
+import time
+
+from selenium.common import WebDriverException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from typing_extensions import Any, Callable, Optional
+
+from selene.common import appium_tools
+
+_OBSERVE_SCRIPT = '''
+const [element, ms, done] = arguments;
+const root = element || document.documentElement;
+
+let finished = false;
+const finish = mutated => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    ['input', 'change'].forEach(type =>
+        root.removeEventListener(type, onEvent, true)
+    );
+    done(mutated);
+};
+const onEvent = () => finish(true);
+
+const observer = new MutationObserver(() => finish(true));
+observer.observe(root, {
+    subtree: true, childList: true, attributes: true, characterData: true,
+});
+for (let ancestor = root.parentNode; ancestor; ancestor = ancestor.parentNode) {
+    observer.observe(ancestor, {childList: true, attributes: true});
+}
+// property changes like input.value are not mutations, but fire events
+['input', 'change'].forEach(type => root.addEventListener(type, onEvent, true));
+const timer = setTimeout(() => finish(false), ms);
+'''
+
+
+def _element_of(entity) -> Optional[WebElement]:
+    locate = getattr(entity, 'locate', None)
+    if locate is None:
+        return None
+    try:
+        found = locate()
+    except WebDriverException:
+        return None
+    return found if isinstance(found, WebElement) else None
+
+
+def _until_mutated(
+    config, *, fraction: float = 0.25, cap: Optional[float] = None
+) -> Callable[[Any, float, float], None]:
+    """Builds a pause for [Wait][selene.core.wait.Wait] (its `_pause` param)
+    that blocks till the next DOM mutation in scope of the waited entity,
+    but not longer than `fraction` of the remaining time (or `cap` seconds,
+    by default – two polling delays or 0.1s if no polling,
+    whichever is less, though not less than the polling delay).
+    Same way, on mutation the pause still lasts at least the polling delay.
+
+    Falls back to sleeping the polling delay on mobile,
+    or when async scripts are not supported.
+    """
+
+    def pause(entity, delay: float, remaining: float) -> None:
+        limit = cap if cap is not None else (2 * delay or 0.1)
+        timeout = min(remaining, max(delay, min(limit, remaining * fraction)))
+        driver = config.driver
+        element = _element_of(entity)
+        if appium_tools._is_mobile_driver(driver) or (
+            element is not None and appium_tools._is_mobile_element(element)
+        ):
+            time.sleep(delay)
+            return
+
+        started = time.monotonic()
+        try:
+            driver.execute_async_script(_OBSERVE_SCRIPT, element, int(timeout * 1000))
+        except TimeoutException:
+            # i.e. the script timeout of driver is shorter than the slice,
+            # anyway the time has passed
+            pass
+        except WebDriverException:
+            # e.g. the element went stale in the middle, or no async scripts
+            # (including JavascriptException and UnknownMethodException)
+            pass
+
+        # a page that mutates all the time (spinners, timers, animations)
+        # resolves the observer at once, so to not re-evaluate the condition
+        # in a busy loop, the next attempt happens not earlier than by polling
+        time.sleep(max(0.0, delay - (time.monotonic() - started)))
+
+    return pause
@@ -0,0 +1,145 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Nested search of elements inside each of already located parent elements
+(or shadow roots of each of them) by one `execute_script` call,
+instead of one WebDriver call per each parent.
+
+Used under the hood by `collection.all(selector)`,
+`collection.all_first(selector)` and `collection.shadow_roots`,
+if `config._search_nested_by_js` is turned on.
+The search is the same as WebDriver does on "find element(s) from element"
+(`querySelector(All)` for css selectors and `document.evaluate` for xpath),
+so the results are the same, just fetched at once.
+Xpath selectors inside shadow roots, that browsers support differently,
+are left to WebDriver.
+"""
+
+from __future__ import annotations
+
+from selenium.common import JavascriptException, UnknownMethodException
+from typing_extensions import Optional, List, Sequence, Any, Tuple
+
+from selene.common import appium_tools
+
+_NESTED_SCRIPT = '''
+const [parents, how, selector, mode] = arguments;
+
+const elementsOnly = nodes => {
+    if (nodes.some(node => !node || node.nodeType !== Node.ELEMENT_NODE)) {
+        throw new Error('xpath result is not an element');
+    }
+    return nodes;
+};
+const byXpath = (parent, type) => {
+    if (parent.nodeType === Node.DOCUMENT_FRAGMENT_NODE) {
+        throw new Error('xpath inside shadow root is searched by WebDriver');
+    }
+    return document.evaluate(selector, parent, null, type, null);
+};
+const findAll = how === 'xpath'
+    ? parent => {
+        const found = byXpath(parent, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+        return elementsOnly(
+            Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i))
+        );
+    }
+    : parent => Array.from(parent.querySelectorAll(selector));
+const findFirst = how === 'xpath'
+    ? parent => {
+        const found = byXpath(parent, XPathResult.FIRST_ORDERED_NODE_TYPE);
+        return found.singleNodeValue && elementsOnly([found.singleNodeValue])[0];
+    }
+    : parent => parent.querySelector(selector);
+
+if (mode === 'shadow roots') {
+    return parents.map(parent => parent.shadowRoot);
+}
+if (mode === 'first') {
+    return parents.map(findFirst);
+}
+return parents.map(findAll);
+'''
+
+_SUPPORTED = ('css selector', 'xpath')
+
+
+def _search(config, parents: Sequence[Any], how, selector, mode) -> Optional[List]:
+    if not config._search_nested_by_js:
+        return None
+    if appium_tools._is_mobile_element(parents[0]):
+        return None
+
+    try:
+        found = config.driver.execute_script(
+            _NESTED_SCRIPT, list(parents), how, selector, mode
+        )
+    except (JavascriptException, UnknownMethodException):
+        return None
+
+    # the absent ones should be reported by WebDriver in its own way
+    return None if any(each is None for each in found) else found
+
+
+def _all_in_each(
+    config, parents: Sequence[Any], by: Tuple[str, str]
+) -> Optional[List[Any]]:
+    """Returns all elements found by `by` inside each of `parents` (flattened),
+    or None if searching by JavaScript is turned off or not supported,
+    so the caller should fall back to searching inside each parent one by one.
+    """
+    how, selector = by
+    if not parents:
+        return []
+    if how not in _SUPPORTED:
+        return None
+
+    found = _search(config, parents, how, selector, 'all')
+    return None if found is None else [each for inner in found for each in inner]
+
+
+def _first_in_each(
+    config, parents: Sequence[Any], by: Tuple[str, str]
+) -> Optional[List[Any]]:
+    """Returns the first element found by `by` inside each of `parents`,
+    or None if searching by JavaScript is turned off or not supported,
+    or some parent has nothing found inside,
+    so the caller should fall back to searching inside each parent one by one.
+    """
+    how, selector = by
+    if not parents:
+        return []
+    if how not in _SUPPORTED:
+        return None
+
+    return _search(config, parents, how, selector, 'first')
+
+
+def _shadow_roots_of_each(config, parents: Sequence[Any]) -> Optional[List[Any]]:
+    """Returns the shadow root of each of `parents`,
+    or None if searching by JavaScript is turned off or not supported,
+    or some parent has no (open) shadow root,
+    so the caller should fall back to getting them one by one.
+    """
+    if not parents:
+        return []
+
+    return _search(config, parents, None, None, 'shadow roots')
@@ -0,0 +1,223 @@
+# MIT License
+#
+# Copyright (c) 2015 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Batched "snapshots" of collection elements, i.e. texts, displayed-states
+and attributes of all located elements fetched by one `execute_script` call
+instead of 1-3 WebDriver calls per each element.
+
+Used under the hood by `query.texts`, `query.visible_texts`, `query.attributes`
+and hence by collection conditions like `have.texts`, `have.exact_texts`, etc.,
+if `config._snapshot_collections_by_js` is turned on.
+
+Same way, collection filtering like `collection.by(condition)`
+can be done by one `execute_script` call
+for conditions that provide a JavaScript version of their predicate,
+if `config._filter_collections_by_js` is turned on.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import pkgutil
+
+from selenium.common import JavascriptException, UnknownMethodException
+from typing_extensions import (
+    NamedTuple,
+    Optional,
+    List,
+    Sequence,
+    Dict,
+    Any,
+    Callable,
+    Tuple,
+)
+
+from selene.common import appium_tools
+
+
+class _ElementSnapshot(NamedTuple):
+    text: str
+    displayed: bool
+    attributes: Dict[str, Any]
+
+
+# TODO: should we render text exactly like WebDriver's "get element text" does?
+#       it uses not publicly available bot.dom.getVisibleText atom,
+#       so here we just normalize innerText in a close way
+#       (that's why the features are not turned on by default)
+_PRELUDE = '''
+const isDisplayed = %s;
+const getAttribute = %s;
+const normalized = text => (text || '')
+    .replace(/\\u00a0/g, ' ')
+    .split('\\n')
+    .map(line => line.trim())
+    .join('\\n')
+    .trim();
+const textOf = element =>
+    isDisplayed(element) ? normalized(element.innerText) : '';
+const attributeOf = (element, name) =>
+    ['href', 'src'].includes(name)
+        ? element.getAttribute(name)
+        : getAttribute(element, name);
+'''
+
+_SNAPSHOT_SCRIPT = '''
+const [elements, names] = arguments;
+
+return elements.map(element => {
+    const displayed = isDisplayed(element);
+    return [
+        displayed ? normalized(element.innerText) : '',
+        displayed,
+        names.map(name => attributeOf(element, name)),
+    ];
+});
+'''
+
+_FILTER_SCRIPT = '''
+const [elements, first] = arguments;
+const matching = element => (%s);
+
+return first
+    ? elements.filter(matching).slice(0, 1)
+    : elements.filter(matching);
+'''
+
+
+_FIND_INNER = {
+    'css selector': 'element.querySelector({selector})',
+    'xpath': (
+        'document.evaluate({selector}, element, null,'
+        ' XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue'
+    ),
+}
+
+
+def _js_inner(by: Tuple[str, str], matching: Optional[str]) -> Optional[str]:
+    """Transforms `matching` JavaScript expression on `element`
+    to be applied to its inner element found by `by` locator
+    (only css selector and xpath are supported, otherwise returns None).
+    If inner element is not found, the script will fail,
+    so the caller can fall back to Python version with its own error.
+    """
+    how, selector = by
+    if matching is None or how not in _FIND_INNER:
+        return None
+    find = _FIND_INNER[how].format(selector=json.dumps(selector))
+    return (
+        f'(element => {{'
+        f' if (!element) throw new Error("inner element not found");'
+        f' return ({matching}); }})({find})'
+    )
+
+
+def _atom(name: str) -> str:
+    return pkgutil.get_data('selenium.webdriver.remote', name).decode('utf8')  # type: ignore
+
+
+@functools.lru_cache(maxsize=None)
+def _prelude() -> str:
+    # reusing the same atoms that Selenium uses
+    # for webelement.is_displayed() and webelement.get_attribute(name)
+    return _PRELUDE % (_atom('isDisplayed.js'), _atom('getAttribute.js'))
+
+
+class _js_predicate:
+    """Curried JavaScript versions of some predicates from selene.common.predicate,
+    to build JavaScript expressions like `by(expected)(actual)`,
+    where expected is a Python value and actual is a JavaScript expression.
+    """
+
+    @staticmethod
+    def equals(expected) -> Callable[[str], str]:
+        return lambda actual: f'({actual}) === {json.dumps(expected)}'
+
+    @staticmethod
+    def includes(expected) -> Callable[[str], str]:
+        return lambda actual: f'({actual}).includes({json.dumps(expected)})'
+
+    @staticmethod
+    def includes_word(expected) -> Callable[[str], str]:
+        return lambda actual: (
+            f'({actual}).split(/\\s+/).includes({json.dumps(expected)})'
+        )
+
+
+def _snapshot(
+    collection, *, attributes: Sequence[str] = ()
+) -> Optional[List[_ElementSnapshot]]:
+    """Returns snapshots of all elements of the collection, located once,
+    or None if batching is turned off or not supported,
+    so the caller should fall back to the per-element queries.
+    """
+    if not collection.config._snapshot_collections_by_js:
+        return None
+
+    webelements = collection.locate()
+    if not webelements:
+        return []
+    if appium_tools._is_mobile_element(webelements[0]):
+        return None
+
+    try:
+        rows = collection.config.driver.execute_script(
+            _prelude() + _SNAPSHOT_SCRIPT, webelements, list(attributes)
+        )
+    except (JavascriptException, UnknownMethodException):
+        return None
+
+    return [
+        _ElementSnapshot(
+            text=text,
+            displayed=bool(displayed),
+            attributes=dict(zip(attributes, values)),
+        )
+        for text, displayed, values in rows
+    ]
+
+
+def _filtered(
+    collection, matching: Optional[str], *, first=False
+) -> Optional[List[Any]]:
+    """Returns webelements of the collection, that match the `matching`
+    JavaScript expression on `element` variable (like `isDisplayed(element)`),
+    filtered by one script call, or None if filtering by JavaScript
+    is turned off or not supported, including the case of no `matching`
+    expression provided, so the caller should fall back to filtering in Python.
+    If `first` is True, then returns only the first matched webelement (if any).
+    """
+    if matching is None or not collection.config._filter_collections_by_js:
+        return None
+
+    webelements = collection.locate()
+    if not webelements:
+        return []
+    if appium_tools._is_mobile_element(webelements[0]):
+        return None
+
+    try:
+        return collection.config.driver.execute_script(
+            _prelude() + _FILTER_SCRIPT % matching, webelements, first
+        )
+    except (JavascriptException, UnknownMethodException):
+        return None
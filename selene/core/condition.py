@@ -431,12 +431,18 @@ and its [`Match`][selene.core.condition.Match] subclass, allowing to build such
 """
 from __future__ import annotations
 
+import contextlib
 import functools
 import sys
 import typing
 import warnings
 
-from selenium.common import WebDriverException
+from selenium.common import (
+    WebDriverException,
+    JavascriptException,
+    UnknownMethodException,
+)
+from selenium.webdriver.remote.webelement import WebElement
 from typing_extensions import (
     List,
     TypeVar,
@@ -452,7 +458,10 @@ from typing_extensions import (
     Type,
 )
 
+from selene.core import _snapshot
 from selene.core.exceptions import ConditionMismatch
+from selene.core.locator import _evaluation_memo
+from selene.common import appium_tools
 from selene.common._typing_functions import Lambda, Predicate, E, R, Query
 
 # TODO: shouldn't we just import if from typing_extensions?
@@ -462,6 +471,107 @@ else:
     from typing import Callable
 
 
+class _Evaluation:
+    """A scope of one evaluation of a composed condition, like
+    `visible.and_(enabled)`, i.e. of one attempt of waiting for it,
+    where all sub-conditions reuse the same located elements
+    and results of the same queries (actual values) on the same entity,
+    instead of requesting them from the driver again.
+
+    Scopes are reentrant, i.e. nested composed conditions join the outer scope,
+    while nested waits suspend it (see `Wait.for_`),
+    so their attempts do not reuse anything from the outer attempt.
+    """
+
+    _SCRIPT = '''
+const element = arguments[0];
+return !!(%s);
+'''
+
+    @staticmethod
+    @contextlib.contextmanager
+    def scope():
+        if _evaluation_memo.get() is not None:
+            yield
+            return
+
+        token = _evaluation_memo.set({})
+        try:
+            yield
+        finally:
+            _evaluation_memo.reset(token)
+
+    @staticmethod
+    def memoized(query: Callable[[E], R]) -> Callable[[E], R]:
+        return _MemoizedQuery(query)
+
+    @classmethod
+    def matched_by_js(cls, entity, js: Callable[[E | None], str] | None) -> bool:
+        """Tests the JavaScript version of a composed condition on the element
+        by one script call, if `config._match_composed_conditions_by_js`
+        is turned on. Returns False if not matched or not supported,
+        so the caller should fall back to testing sub-conditions in Python,
+        that will also describe the actual mismatch.
+        """
+        config = getattr(entity, 'config', None)
+        if js is None or not getattr(config, '_match_composed_conditions_by_js', False):
+            return False
+
+        try:
+            webelement = entity.locate()
+        except Exception:
+            return False
+        if not isinstance(webelement, WebElement) or appium_tools._is_mobile_element(
+            webelement
+        ):
+            return False
+
+        try:
+            return bool(
+                config.driver.execute_script(
+                    _snapshot._prelude() + cls._SCRIPT % js(entity), webelement
+                )
+            )
+        except (JavascriptException, UnknownMethodException):
+            return False
+
+
+class _MemoizedQuery(Generic[E, R]):
+    """A query that returns the same result on the same entity
+    while an evaluation scope is active, see `_Evaluation`
+    (the query and entity are compared by identity)
+    """
+
+    def __init__(self, query: Callable[[E], R]):
+        self._query = query
+
+    def _name_for(self, entity: E | None = None) -> str | None:
+        return Query._full_name_for(self._query, entity)
+
+    def __call__(self, entity: E) -> R:
+        memo = _evaluation_memo.get()
+        if memo is None:
+            return self._query(entity)
+
+        key = (self._query, id(entity))
+        if key in memo:
+            return memo[key]
+        result = memo[key] = self._query(entity)
+        return result
+
+
+class _JoinedErrors:
+    """A message of many errors, joined only when rendered,
+    e.g. on the final failure of waiting, not on each failed attempt
+    """
+
+    def __init__(self, errors: List[Exception]):
+        self._errors = errors
+
+    def __str__(self):
+        return '; '.join(map(str, self._errors))
+
+
 # TODO: Consider renaming to Match, while keeping Condition name as functional interface
 class Condition(Generic[E]):
     """Class to build, invert and compose "callable matcher" objects,
@@ -927,27 +1037,49 @@ class Condition(Generic[E]):
     def by_and(cls, *conditions):
         # TODO: consider refactoring to be predicate-based or both-based
         #      and ensure inverted works
+        js = Condition.__js_joined(' && ', conditions)
+
         def func(entity):
-            for condition in conditions:
-                condition.__call__(entity)
+            with _Evaluation.scope():
+                if _Evaluation.matched_by_js(entity, js):
+                    return
+                for condition in conditions:
+                    condition.__call__(entity)
 
-        return cls(' and '.join(map(str, conditions)), func)
+        return cls(' and '.join(map(str, conditions)), func, _js=js)
 
     @classmethod
     def by_or(cls, *conditions):
         # TODO: consider refactoring to be predicate-based or both-based
         #      and ensure inverted works
+        js = Condition.__js_joined(' || ', conditions)
+
         def func(entity):
-            errors: List[Exception] = []
-            for condition in conditions:
-                try:
-                    condition.__call__(entity)
+            with _Evaluation.scope():
+                if _Evaluation.matched_by_js(entity, js):
                     return
-                except Exception as e:
-                    errors.append(e)
-            raise AssertionError('; '.join(map(str, errors)))
-
-        return cls(' or '.join(map(str, conditions)), func)
+                errors: List[Exception] = []
+                for condition in conditions:
+                    try:
+                        condition.__call__(entity)
+                        return
+                    except Exception as e:
+                        errors.append(e)
+                raise AssertionError(_JoinedErrors(errors))
+
+        return cls(' or '.join(map(str, conditions)), func, _js=js)
+
+    @staticmethod
+    def __js_joined(operator: str, conditions) -> Callable[[E | None], str] | None:
+        # is provided only if all conditions have their JavaScript versions
+        if not all(
+            isinstance(condition, Condition) and condition._js_for() is not None
+            for condition in conditions
+        ):
+            return None
+        return lambda entity: operator.join(
+            f'({condition._js_for(entity)})' for condition in conditions
+        )
 
     @classmethod
     def for_each(cls, condition) -> Condition[Iterable[E]]:
@@ -1004,6 +1136,7 @@ class Condition(Generic[E]):
         *,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     # @overload
@@ -1026,6 +1159,7 @@ class Condition(Generic[E]):
         _describe_actual_result: Lambda[R, str] | None = None,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     @overload
@@ -1037,6 +1171,7 @@ class Condition(Generic[E]):
         _by: Predicate[E],
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     # todo: CONSIDER: accepting tuple of three as name
@@ -1067,11 +1202,15 @@ class Condition(Generic[E]):
         _inverted=False,
         # todo: should we find more "human-readable" name? like in Wait(at_most) over Wait(timeout)
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        # a JavaScript version of the condition as an expression on `element`,
+        # to match webelements in browser (see collection.by(condition))
+        _js: str | Callable[[E | None], str] | None = None,
     ):
         # can be already stored
         self.__name = name
         self.__inverted = _inverted
         self.__falsy_exceptions = _falsy_exceptions
+        self.__js = _js
         self.__by = None
 
         if _by:  # i.e. condition is based on predicate (fn returning True/False)
@@ -1083,10 +1222,13 @@ class Condition(Generic[E]):
             self.__actual = _actual
             self.__describe_actual_result = _describe_actual_result
             self.__by = _by
+            # the same actual of sub-conditions will be queried once
+            # per evaluation of composed condition, see _Evaluation
+            actual = _Evaluation.memoized(_actual) if _actual else None
             self.__test = (
                 ConditionMismatch._to_raise_if_not(
                     self.__by,
-                    self.__actual,
+                    actual,
                     _describe_actual_result=self.__describe_actual_result,
                     _falsy_exceptions=_falsy_exceptions,
                 )
@@ -1098,7 +1240,7 @@ class Condition(Generic[E]):
             )
             self.__test_inverted = (
                 ConditionMismatch._to_raise_if_actual(
-                    self.__actual,
+                    actual,
                     self.__by,
                     _describe_actual_result=self.__describe_actual_result,
                     _falsy_exceptions=_falsy_exceptions,
@@ -1179,6 +1321,7 @@ class Condition(Generic[E]):
                 self.__test,
                 _inverted=not self.__inverted,
                 _falsy_exceptions=self.__falsy_exceptions,
+                _js=self.__js,
             )
             if not self.__by
             else (
@@ -1189,6 +1332,7 @@ class Condition(Generic[E]):
                     _describe_actual_result=self.__describe_actual_result,
                     _inverted=not self.__inverted,
                     _falsy_exceptions=self.__falsy_exceptions,
+                    _js=self.__js,
                 )
             )
         )
@@ -1236,6 +1380,17 @@ class Condition(Generic[E]):
             else self.__describe_inverted(entity)
         )
 
+    def _js_for(self, entity: E | None = None) -> str | None:
+        """Returns a JavaScript version of the condition (counting inversion)
+        as an expression on `element` variable, or None if not provided.
+        The entity, if passed, is used only to access its config,
+        the same way as in `_name_for`.
+        """
+        if self.__js is None:
+            return None
+        js = self.__js if not callable(self.__js) else self.__js(entity)
+        return js if not self.__inverted else f'!({js})'
+
     # todo: we already have entity.matching for Callable[[E], bool]
     #       is it a good idea to use same term for Callable[[E], None] raising error?
     #       but is match vs matchING distinction clear enough?
@@ -1624,6 +1779,7 @@ class Match(Condition[E]):
         _describe_actual_result: Lambda[R, str] | None = None,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     @overload
@@ -1635,6 +1791,7 @@ class Match(Condition[E]):
         by: Predicate[E] | Condition[E],
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     @overload
@@ -1646,6 +1803,7 @@ class Match(Condition[E]):
         _describe_actual_result: Lambda[R, str] | None = None,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     @overload
@@ -1655,6 +1813,7 @@ class Match(Condition[E]):
         by: Predicate[E],
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ): ...
 
     def __init__(
@@ -1666,6 +1825,7 @@ class Match(Condition[E]):
         _describe_actual_result: Lambda[R, str] | None = None,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js: str | Callable[[E | None], str] | None = None,
     ):
         """
         The only valid and stable signatures in usage:
@@ -1680,7 +1840,8 @@ class Match(Condition[E]):
 
         In addition to the examples above you can optionally add named
         `_describe_actual_result` argument whenever you pass the `actual` argument.
-        You also can optionally provide _inverted and _falsy_exceptions arguments.
+        You also can optionally provide _inverted, _falsy_exceptions
+        and _js arguments.
         But keep in mind that they are marked with `_` prefix to indicate their
         private and potentially "experimental" use, that can change in future versions.
         """
@@ -1718,6 +1879,7 @@ class Match(Condition[E]):
                 _describe_actual_result=_describe_actual_result,
                 _inverted=_inverted,
                 _falsy_exceptions=_falsy_exceptions,
+                _js=_js,
             )
 
     # TODO: provide examples of error messages
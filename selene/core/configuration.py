@@ -23,16 +23,28 @@
 from __future__ import annotations
 
 import atexit
+import contextlib
+import contextvars
 import inspect
 import itertools
 import os
+import queue
+import threading
 import time
 import warnings
+import weakref
 from types import MappingProxyType
 
 import typing_extensions as typing
-from selenium.common import WebDriverException
+from selenium.common import (
+    WebDriverException,
+    JavascriptException,
+    InvalidSessionIdException,
+    NoSuchFrameException,
+    NoSuchWindowException,
+)
 from selenium.webdriver.common.by import By
+from urllib3.exceptions import HTTPError
 from typing_extensions import (
     Callable,
     Optional,
@@ -42,6 +54,10 @@ from typing_extensions import (
     Literal,
     cast,
     Tuple,
+    Hashable,
+    NamedTuple,
+    List,
+    Iterator,
 )
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -55,7 +71,9 @@ from selene.common.helpers import on_error_return_false
 
 from selene.core.exceptions import TimeoutException
 
-from selene.core.wait import Wait
+from selene.core import _artifacts, _observe
+from selene.core.locator import _LocatedCache
+from selene.core.wait import Wait, poll, retry, _WaitEvent
 
 E = TypeVar('E')
 
@@ -274,8 +292,62 @@ class _DriverStrategiesExecutor:
     def schedule_teardown(self, get_driver: Callable[[], WebDriver]) -> None:
         self.config._schedule_driver_teardown_strategy(self.config, get_driver)
 
+    def teardown_driver(self) -> None:
+        """Tears down the driver, if it is set, by config._teardown_driver_strategy,
+        e.g. between tests
+        """
+        if self.is_driver_set and self.is_driver_managed:
+            self.teardown(typing.cast(WebDriver, self.driver_instance))
+
+    def reset_driver(self) -> None:
+        """Resets the driver session to be reused, if the driver is set and alive,
+        otherwise or if reset failed – quits the driver (if possible)
+        and unsets it, so it will be rebuilt on next access
+        """
+        if not self.is_driver_set or not self.is_driver_managed:
+            return
+
+        driver = typing.cast(WebDriver, self.driver_instance)
+        try:
+            if not self.is_driver_alive:
+                raise WebDriverException('driver is not alive')
+            self.config._reset_driver_strategy(self.config)(driver)
+        except WebDriverException:
+            on_error_return_false(driver.quit)
+            self.config.driver = ...  # type: ignore
+        else:
+            self.reset_frame_path()
+            self.invalidate_located_cache()
+
     def get_url(self, url: Optional[str] = None) -> None:
+        # navigation switches driver to the top level browsing context
+        self.reset_frame_path()
         self.config._driver_get_url_strategy(self.config)(url)
+        self.invalidate_located_cache()
+
+    def invalidate_located_cache(self) -> None:
+        if self.config._cache_located_elements:
+            _LocatedCache.invalidate(self.config.driver)
+
+    def reset_frame_path(self) -> None:
+        if self.config._track_frame_path:
+            _frame_path.reset(self.config)
+
+    def on_failed_attempt(self, reason: Exception) -> None:
+        if isinstance(reason, _DriverLiveness.DEAD_SESSION_ERRORS):
+            if self.is_driver_set and self.is_driver_managed:
+                _driver_liveness.invalidate(self.driver_instance)  # type: ignore
+            # the located elements of dead session are useless anyway
+            return
+        if self.config._track_frame_path and isinstance(
+            reason, (NoSuchFrameException, NoSuchWindowException)
+        ):
+            _frame_path.invalidate(self.config)
+        self.invalidate_located_cache()
+
+    @property
+    def driver_liveness_counters(self) -> _LivenessCounters:
+        return _driver_liveness.counters
 
     def save_screenshot(self, path: Optional[str] = None) -> Any:
         return self.config._save_screenshot_strategy(self.config, path)
@@ -284,6 +356,169 @@ class _DriverStrategiesExecutor:
         return self.config._save_page_source_strategy(self.config, path)
 
 
+class _LivenessCounters(NamedTuple):
+    checks: int
+    trusted: int
+    invalidations: int
+
+
+class _DriverLiveness:
+    """Checks drivers for being alive by `config._is_driver_alive_strategy`,
+    trusting a successful check during `config._driver_liveness_ttl` seconds
+    """
+
+    # errors that signal a dead session, not just a failed command;
+    # urllib3 errors like MaxRetryError or ProtocolError
+    # are not builtin ConnectionError subclasses, hence listed explicitly
+    DEAD_SESSION_ERRORS = (InvalidSessionIdException, ConnectionError, HTTPError)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._checks = 0
+        self._trusted = 0
+        self._invalidations = 0
+
+    def is_alive(self, config: Config, driver: WebDriver) -> bool:
+        ttl = config._driver_liveness_ttl
+        if ttl > 0:
+            checked_at = self._checked_at.get(driver)
+            if checked_at is not None and time.monotonic() - checked_at < ttl:
+                with self._lock:
+                    self._trusted += 1
+                return True
+
+        alive = config._is_driver_alive_strategy(driver)
+        with self._lock:
+            self._checks += 1
+            if alive and ttl > 0:
+                self._checked_at[driver] = time.monotonic()
+            else:
+                self._checked_at.pop(driver, None)
+        return alive
+
+    def invalidate(self, driver: WebDriver) -> None:
+        with self._lock:
+            if self._checked_at.pop(driver, None) is not None:
+                self._invalidations += 1
+
+    @property
+    def counters(self) -> _LivenessCounters:
+        with self._lock:
+            return _LivenessCounters(self._checks, self._trusted, self._invalidations)
+
+
+_driver_liveness = _DriverLiveness()
+
+
+class _Frame(NamedTuple):
+    key: str
+    """identifies the frame among other frames of the same parent"""
+    switch_into: Callable[[], None]
+    """switches driver into the frame from its parent frame"""
+
+
+class _FramePathState:
+    def __init__(self):
+        self.actual: Optional[List[_Frame]] = []
+        """frames the driver is actually switched into, None if unknown"""
+        self.expected: List[_Frame] = []
+        """frames the driver should be switched into before next command"""
+
+
+class _FramePath:
+    """Tracks the path of frames per driver, when `config._track_frame_path`
+    is turned on, so switching into a frame and back by `element.frame_context`
+    is postponed till the next access to `config.driver`,
+    and then is done by the minimal number
+    of `switch_to.parent_frame()` and `switch_to.frame(...)` calls
+    (or none, if the driver is already switched into the expected frame,
+    e.g. on consecutive commands of elements inside the same frame).
+    """
+
+    # while syncing the path, the driver is accessed "as is"
+    _suspended: contextvars.ContextVar[bool] = contextvars.ContextVar(
+        'selene_frame_path_suspended', default=False
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @contextlib.contextmanager
+    def suspended(self) -> Iterator[None]:
+        token = self._suspended.set(True)
+        try:
+            yield
+        finally:
+            self._suspended.reset(token)
+
+    def _state_of(self, config: Config) -> typing.Tuple[WebDriver, _FramePathState]:
+        with self.suspended():
+            driver = config.driver
+        with self._lock:
+            state = self._states.get(driver)
+            if state is None:
+                state = self._states[driver] = _FramePathState()
+        return driver, state
+
+    def enter(self, config: Config, frame: _Frame) -> None:
+        _, state = self._state_of(config)
+        state.expected.append(frame)
+
+    def exit(self, config: Config) -> None:
+        _, state = self._state_of(config)
+        if state.expected:
+            state.expected.pop()
+
+    def reset(self, config: Config) -> None:
+        """Should be called when the driver is switched to the top level
+        browsing context, e.g. on navigation or switching to another tab
+        """
+        _, state = self._state_of(config)
+        state.actual = []
+        state.expected = []
+
+    def invalidate(self, config: Config) -> None:
+        """Should be called when the actual frame of the driver is unknown,
+        e.g. on NoSuchFrameException, so it will be switched into
+        the expected frames from the default content on next sync
+        """
+        _, state = self._state_of(config)
+        state.actual = None
+
+    def sync(self, driver: WebDriver) -> None:
+        if self._suspended.get():
+            return
+        state = self._states.get(driver)
+        if state is None or state.actual == state.expected:
+            return
+
+        with self.suspended():
+            if state.actual is None:
+                driver.switch_to.default_content()
+                state.actual = []
+
+            expected_keys = [frame.key for frame in state.expected]
+            while [frame.key for frame in state.actual] != expected_keys[
+                : len(state.actual)
+            ]:
+                try:
+                    driver.switch_to.parent_frame()
+                    state.actual.pop()
+                except (NoSuchFrameException, NoSuchWindowException):
+                    driver.switch_to.default_content()
+                    state.actual = []
+
+            while len(state.actual) < len(state.expected):
+                frame = state.expected[len(state.actual)]
+                frame.switch_into()
+                state.actual.append(frame)
+
+
+_frame_path = _FramePath()
+
+
 # TODO: consider reusing config._executor inside this descriptor
 class _ManagedDriverDescriptor:
     def __init__(
@@ -312,9 +547,10 @@ class _ManagedDriverDescriptor:
             or (
                 # TODO: think on: if turned on, may slow down tests...
                 #       especially when running remote tests...
+                #       (partially solved by config._driver_liveness_ttl)
                 config.rebuild_not_alive_driver
                 and not callable(driver_box.value)  # TODO: consider deprecating
-                and not config._is_driver_alive_strategy(driver_box.value)
+                and not _driver_liveness.is_alive(config, driver_box.value)
             )
         ):
             driver = config.build_driver_strategy(config)
@@ -329,7 +565,10 @@ class _ManagedDriverDescriptor:
             #     'via other config.* options',
             #     FutureWarning,
             # )
-            return value()
+            value = value()
+
+        if config._track_frame_path:
+            _frame_path.sync(value)
 
         return value
 
@@ -681,28 +920,72 @@ class Config:
         [Config, Callable[[], WebDriver]],
         typing.Union[None, typing.Any],
     ] = lambda config, get_driver: atexit.register(
-        lambda: config._teardown_driver_strategy(config)(get_driver())
+        lambda: (
+            # there is no next test to reuse the reset session at exit
+            _quit_driver(config, get_driver())
+            if config._reset_driver_on_teardown
+            else config._teardown_driver_strategy(config)(get_driver())
+        )
     )
     """Defines when drier will be teardown.
     Is supposed to use config._teardown_driver_strategy under the hood.
 
-    By default, it's registered as an atexit handler.
+    By default, it's registered as an atexit handler,
+    that quits the driver (if not asked to be held at exit)
+    even if `config._reset_driver_on_teardown` is on.
     """
 
     # TODO: since it's curried, shouldn't we rename it driver_teardown_strategy?
     _teardown_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = (
-        lambda config: lambda driver: (
-            driver.quit()
-            if not config.hold_driver_at_exit
-            and config._is_driver_set_strategy(driver)
-            and config._is_driver_alive_strategy(driver)
-            else None
-        )
+        lambda config: lambda driver: _teardown_driver(config, driver)
     )
     """Defines how driver will be teardown.
 
     By default it quits the driver if it's alive and not asked to be held at exit
-    via `config.hold_driver_at_exit`.
+    via `config.hold_driver_at_exit`. Or, if `config._reset_driver_on_teardown`
+    is on, resets its session by `config._reset_driver_strategy`
+    to be reused by next test, falling back to quitting it
+    (so it will be rebuilt on next access) if the reset failed.
+
+    Is used by `config._executor.teardown_driver()` between tests,
+    and at exit by `config._schedule_driver_teardown_strategy`.
+    """
+
+    _reset_driver_on_teardown: bool = False
+    """A flag to indicate whether `config._teardown_driver_strategy`
+    should reset the driver session instead of quitting it,
+    so the next test reuses the same browser instead of starting a new one
+    (that usually takes seconds). The driver is still quit at exit.
+
+    Examples:
+        Resetting the driver between tests instead of quitting it:
+
+        >>> import pytest
+        >>> from selene import browser
+        >>>
+        >>> browser.config._reset_driver_on_teardown = True
+        >>>
+        >>> @pytest.fixture(autouse=True)
+        >>> def browser_management():
+        >>>     yield
+        >>>     browser.config._executor.teardown_driver()
+    """
+
+    _reset_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = (
+        lambda config: _reset_session
+    )
+    """Defines how driver session will be reset to be reused by next test
+    instead of quitting it and building a new one (that is much slower).
+    Should raise WebDriverException if reset failed.
+
+    By default, deletes cookies and clears local and session storages
+    of pages opened in all tabs, closes all tabs but the first,
+    then opens about:blank.
+
+    Is used by `config._executor.reset_driver()` that falls back to quitting
+    the driver (so it will be rebuilt on next access) if reset failed,
+    and so by `config._teardown_driver_strategy`
+    if `config._reset_driver_on_teardown` is on.
     """
 
     # TODO: should we make it private so far?
@@ -963,6 +1246,21 @@ class Config:
     Is a more "strong" option than `config._reset_not_alive_driver_on_get_url`,
     (enabled by default), that schedules rebuilding driver
     on next access only inside "get url" logic.
+
+    See also `config._driver_liveness_ttl` to make it not so slow.
+    """
+
+    _driver_liveness_ttl: float = 0
+    """Time in seconds, during which a successful check of driver for being alive
+    (see `config.rebuild_not_alive_driver`) is trusted,
+    so the driver is not checked again on each access to `config.driver`.
+
+    The trusted check is invalidated earlier, if some waiting attempt failed
+    with an error that signals a dead session, like `InvalidSessionIdException`.
+    Counters of checks, trusted checks and invalidations
+    are available via `config._executor.driver_liveness_counters`.
+
+    By default (0), the driver is checked on each access.
     """
 
     # # TODO: why it is not working as attribute + post init?
@@ -1049,7 +1347,129 @@ class Config:
     """
 
     poll_during_waits: int = 100
-    """A fake option, not currently used in Selene waiting:)"""
+    """A default interval in milliseconds to sleep between attempts
+    of all Selene waiting, used by the default `config._poll_strategy`.
+    """
+
+    _poll_strategy: Callable[[Config], Callable[[int], float] | None] = lambda config: (
+        poll.fixed(config.poll_during_waits / 1000)
+        if config.poll_during_waits
+        else None
+    )
+    """A strategy to build a polling schedule for all Selene waiting,
+    i.e. a function of the number of already failed attempts
+    that returns a delay in seconds to sleep before the next attempt.
+
+    By default, polls each `config.poll_during_waits` milliseconds.
+    If the latter is set to `0`, then polls without any sleeping at all
+    (the way Selene did before).
+
+    Examples:
+        Backoff exponentially with jitter, but never poll less often than each 1s:
+
+        ```python
+        from selene import browser
+        from selene.core.wait import poll
+
+        browser.config._poll_strategy = lambda config: poll.backoff(
+            config.poll_during_waits / 1000, factor=1.5, cap=1.0, jitter=0.2
+        )
+        ```
+
+        Poll fast for the first 5 attempts, then slow down:
+
+        ```python
+        browser.config._poll_strategy = lambda config: poll.fast_then_slow(
+            0.02, 0.25, fast_attempts=5
+        )
+        ```
+    """
+
+    _retry_strategy: Callable[[Config], Callable[[Exception], bool] | None] = (
+        lambda config: (
+            # the dead session will be revived by next attempts
+            retry.on_transient(*_DriverLiveness.DEAD_SESSION_ERRORS)
+            if config.rebuild_not_alive_driver
+            else retry.on_transient()
+        )
+    )
+    """A strategy to build a retry policy for all Selene waiting,
+    i.e. a predicate on the exception of a failed attempt, deciding
+    whether to make the next attempt or to fail immediately
+    (with the same failure hooks as on timeout, but without waiting for it).
+
+    By default, retries only on exceptions that usually signal a temporary
+    state of the page (stale or absent element, not interactable element,
+    intercepted click, error thrown from JavaScript, not matched condition, etc.,
+    see `retry.on_transient`),
+    and on dead session errors (if `config.rebuild_not_alive_driver` is on,
+    so the session is rebuilt before next attempt), failing fast on all others,
+    including errors in your custom conditions or queries like TypeError.
+    Return `None` to retry on any exception (the way Selene did before).
+
+    Examples:
+        Retry also on WebDriverException (the base of all WebDriver errors):
+
+        ```python
+        from selene import browser
+        from selene.core.wait import retry
+        from selenium.common import WebDriverException
+
+        browser.config._retry_strategy = lambda config: retry.on_transient(
+            WebDriverException
+        )
+        ```
+
+        Retry on all exceptions but the ones that signal a broken test
+        (like invalid selector or invalid regex pattern),
+        i.e. use a blocklist instead of allowlist:
+
+        ```python
+        browser.config._retry_strategy = lambda config: retry.unless_broken()
+        ```
+
+        Fail fast also on TypeError, while retrying on others:
+
+        ```python
+        browser.config._retry_strategy = lambda config: retry.unless_broken(
+            TypeError
+        )
+        ```
+    """
+
+    _wait_for_dom_mutations: bool = False
+    """A flag to indicate whether to pause between failed attempts
+    of all Selene waiting by blocking inside one `execute_async_script` call
+    till the next DOM mutation in scope of the waited element
+    (or of the whole page for other entities), instead of sleeping
+    a fixed polling delay, so the change is noticed right after it happens,
+    while nothing is re-evaluated in vain until it happens.
+
+    Since not all changes are DOM mutations (e.g. CSS transitions),
+    each pause is limited to a slice of the remaining timeout
+    (see `config._wait_for_dom_mutations_fraction`)
+    and to a small multiple of the polling delay
+    (see `config._wait_for_dom_mutations_cap`).
+    And in order not to re-evaluate in a busy loop on a page
+    that mutates all the time, each pause lasts at least
+    the polling delay of `config._poll_strategy`.
+
+    On mobile, or if async scripts are not supported,
+    just sleeps the polling delay, as usual.
+    """
+
+    _wait_for_dom_mutations_fraction: float = 0.25
+    """The max part of the remaining timeout to wait for a DOM mutation
+    during one pause, if `config._wait_for_dom_mutations` is turned on.
+    """
+
+    _wait_for_dom_mutations_cap: Optional[float] = None
+    """The max seconds to wait for a DOM mutation during one pause,
+    if `config._wait_for_dom_mutations` is turned on.
+    By default (if None), two polling delays (or 0.1s if no polling),
+    so changes that are not DOM mutations (like CSS transitions)
+    are still noticed not much later than by polling.
+    """
 
     # --- Web-specific options ---
     # TODO: should we pass here None?
@@ -1170,6 +1590,117 @@ class Config:
 
     It is set to False by default for backward compatibility reasons.
     """  # todo: document example
+    _snapshot_collections_by_js: bool = False
+    """A flag to indicate whether to get texts, visibility and attributes
+    of all collection elements by one JavaScript call
+    instead of 1-3 WebDriver calls per each element
+    (as `query.texts`, `query.visible_texts`, `query.attributes`
+    and so collection conditions like `have.texts` or `have.exact_texts` do).
+
+    Makes such queries and conditions much faster on big collections
+    and remote drivers. It is turned off by default, because the texts
+    are taken as normalized `innerText` of elements, that may slightly differ
+    from the text rendered by WebDriver, e.g. in case of whitespaces.
+    Mobile elements are always queried one by one.
+    """
+    _filter_collections_by_js: bool = False
+    """A flag to indicate whether to filter collection elements
+    by one JavaScript call instead of matching each element by WebDriver calls
+    (as `collection.by(condition)`, `collection.element_by(condition)`
+    and `collection.by_their(selector, condition)` do).
+
+    Works only for conditions that provide a JavaScript version of their
+    predicate, like built-in `have.text`, `have.exact_text`, `have.css_class`,
+    `have.attribute(name).value`, `be.visible`, `be.hidden`, `be.enabled`
+    and their combinations via `and_`, `or_` and `not_`.
+    Other conditions, as well as mobile elements, are matched one by one.
+    It is turned off by default for the same reasons as
+    `_snapshot_collections_by_js` option.
+    """
+    _search_nested_by_js: bool = False
+    """A flag to indicate whether to search elements inside each element
+    of a collection (as `collection.all(selector)`,
+    `collection.all_first(selector)` and `collection.shadow_roots` do)
+    by one JavaScript call instead of one WebDriver call per each element.
+
+    The search is done the same way as WebDriver does it
+    (by `querySelectorAll` for css selectors and `document.evaluate` for xpath).
+    Other types of selectors, xpath selectors inside shadow roots,
+    mobile elements, and cases like invalid selectors or absent inner elements
+    are searched one by one, to fail as WebDriver does.
+    """
+    _compile_selector_chains: bool = False
+    """A flag to indicate whether to locate chained elements,
+    like `browser.element('#form').element('.row').element('input')`
+    (or `browser.element('#form').element('.row').all('input')`),
+    by one driver call for the whole chain, instead of one call per each link.
+
+    A chain of XPath selectors, where all links but the first one are relative
+    (i.e. start with `.`), is compiled to one XPath selector, that limits each
+    link but the last one to its first match, like `((//form)[1]/.//div)[1]/./input`.
+    Other chains of CSS and XPath selectors are searched by one JavaScript call.
+    In both cases, the element is found exactly as by dependent WebDriver calls,
+    and if nothing is found, the chain is searched link by link,
+    so the absent link is reported by WebDriver as usual.
+    Other types of selectors break the chain, i.e. are searched by WebDriver
+    inside the element located by the previous part of the chain.
+    """
+    _match_composed_conditions_by_js: bool = False
+    """A flag to indicate whether to test composed conditions,
+    like `be.clickable` (i.e. `be.visible.and_(be.enabled)`)
+    or any other combination via `and_` and `or_`,
+    by one JavaScript call on the located element,
+    instead of WebDriver calls per each sub-condition.
+
+    Works only if all sub-conditions provide a JavaScript version
+    of their predicate (see `_filter_collections_by_js` option).
+    If not matched by JavaScript, the sub-conditions are tested
+    as usual to describe the actual mismatch.
+    Even when turned off, the composed condition locates the element
+    and queries the same actual value only once per its evaluation.
+    """
+    _cache_located_elements: bool = False
+    """A flag to indicate whether to cache the webelement located by an element
+    (like `browser.element('#a').element('.b')`) and reuse it on next commands,
+    instead of locating it again (with all its parents) on each command.
+
+    The cache is scoped per driver and is invalidated on any failed attempt
+    of waiting (e.g. because of `StaleElementReferenceException`
+    or `NoSuchElementException`), on opening url by `browser.open`,
+    on switching tabs by `browser.switch_to_*` and on switching frames
+    by `element.frame_context` or `element.get(query.frame_context)`.
+
+    Makes long chains of elements much faster, especially for remote drivers.
+    It is turned off by default, because a cached element will be considered
+    present (e.g. by `element.matching(be.present)`) until it's invalidated,
+    even if it was already removed from DOM.
+    """
+    _track_frame_path: bool = False
+    """A flag to indicate whether to track the path of frames
+    the driver is switched into by `element.frame_context`
+    (in `with` statement, or implicitly for elements found
+    by `element.frame_context.element(selector)`), so switching
+    is postponed till the next access to the driver (e.g. by next command),
+    and then is done by the minimal number
+    of `switch_to.frame(...)` and `switch_to.parent_frame()` calls.
+    E.g. consecutive commands of elements inside the same frame
+    will not switch into the frame and back at all.
+
+    The tracked path is reset on opening url by `browser.open`
+    and on switching tabs by `browser.switch_to_*`,
+    and is restored from the default content on `NoSuchFrameException`.
+
+    It is turned off by default, because switching frames directly
+    via `browser.driver.switch_to` is not tracked,
+    and so will break the tracked path.
+    """
+    _cached_entities_ttl: Optional[float] = None
+    """Time in seconds, during which an entity built by `entity.cached`
+    (like `element.cached` or `collection.cached`) reuses its located result,
+    after which it will be located again on next use.
+    By default (None), the located result is reused "forever".
+    In any case the entity is located lazily, i.e. on first use.
+    """
     # todo: decide on naming: ignore_case vs match_ignoring_case?
     #       ignore_case conciser but
     #       - not consistent with other match_* options
@@ -1292,6 +1823,13 @@ class Config:
     ```
     """
 
+    def _located_cache_scope(self) -> Optional[Callable[[], Hashable]]:
+        return (
+            (lambda: _LocatedCache.scope_of(self.driver))
+            if self._cache_located_elements
+            else None
+        )
+
     def _selector_or_by_to_by(
         self,
         selector_or_by: str | Tuple[str, str],
@@ -1340,6 +1878,44 @@ class Config:
         >>> )
     """
 
+    _wait_metrics_hook: Optional[Callable[[_WaitEvent], None]] = None
+    """A hook to be called with metrics of each finished wait,
+    like entity and command/query description, number of attempts,
+    total wall time, names of exceptions of failed attempts, etc.
+    (see [_WaitEvent][selene.core.wait._WaitEvent]).
+
+    By default is None, so no metrics are collected at all.
+
+    Examples:
+        Collecting metrics into the default in-memory aggregator:
+
+        >>> from selene import browser, support
+        >>>
+        >>> browser.config._wait_metrics_hook = support._metrics.wait_metrics
+        >>> ...
+        >>> print(support._metrics.wait_metrics.report(top=10))
+
+        Or just run pytest with the Selene metrics plugin
+        to print such report at the end of the session:
+
+        ```bash
+        pytest -p selene.support._pytest_metrics --selene-metrics=10
+        ```
+    """
+
+    _memoize_waits: bool = True
+    """A flag to indicate whether to reuse the Wait object built for an entity
+    by `config._build_wait_strategy` (including its composed failure hooks)
+    on next commands and assertions of the same entity,
+    instead of building it from scratch on each `entity.wait` access.
+
+    The memoized Wait is rebuilt once any option it depends on
+    (like `config.timeout`, `config.hook_wait_failure`,
+    `config._wait_decorator`, etc., see `_WAIT_OPTIONS`) is changed.
+    Turn it off if your custom `config._build_wait_strategy`
+    depends on other options.
+    """
+
     _disable_wait_decorator_on_get_query: bool = True
     """A flag controlling whether to disable wait decorator on calls
     like entity.get(query.*), turned on by default,
@@ -1377,6 +1953,19 @@ class Config:
     """A flag to indicate whether to save page source on failure or not.
     If saved, will be also logged to the console on failure.
     """
+    _save_artifacts_in_background: bool = False
+    """A flag to indicate whether to only capture screenshot and page source
+    from the driver on failure, while writing them to disk in background thread,
+    so the failure path (e.g. of expected failures with retries) is not blocked
+    by disk IO. The files with same content are written once per run
+    (others are hard links to the first one, if supported by file system).
+    All scheduled files are flushed to disk at exit.
+    """
+    _compress_saved_page_sources: bool = False
+    """A flag to indicate whether to gzip page sources saved in background
+    (see `config._save_artifacts_in_background`),
+    in such case their file names get additional `.gz` extension.
+    """
     # TODO: consider making public
     _counter: itertools.count = itertools.count(start=int(round(time.time() * 1000)))
     """A counter, currently used for incrementing screenshot and page source names"""
@@ -1418,7 +2007,11 @@ class Config:
                     else ...
                 )
             ),
-            lambda path: (path if config.driver.get_screenshot_as_file(path) else None),
+            lambda path: (
+                _artifacts._writer.submit(path, config.driver.get_screenshot_as_png())
+                if config._save_artifacts_in_background
+                else (path if config.driver.get_screenshot_as_file(path) else None)
+            ),
             fp.do(
                 lambda path: setattr(config, 'last_screenshot', path)
             ),  # On refactor>rename, we may miss it here :( better would be like:
@@ -1466,8 +2059,22 @@ class Config:
                 )
             ),
             lambda path: (path, config.driver.page_source),
-            fp.do(lambda path_and_source: fp.write_silently(*path_and_source)),
-            lambda path_and_source: path_and_source[0],
+            fp.do(
+                lambda path_and_source: (
+                    fp.write_silently(*path_and_source)
+                    if not config._save_artifacts_in_background
+                    else ...
+                )
+            ),
+            lambda path_and_source: (
+                _artifacts._writer.submit(
+                    path_and_source[0],
+                    path_and_source[1].encode('utf-8'),
+                    compress=config._compress_saved_page_sources,
+                )
+                if config._save_artifacts_in_background
+                else path_and_source[0]
+            ),
             fp.do(
                 lambda path: setattr(config, 'last_page_source', path)
             ),  # On refactor>rename, we may miss it here :( better would be like:
@@ -1538,7 +2145,9 @@ class Config:
             )
             else options_to_override
         )
-        return persistent.replace(self, **options)
+        config = persistent.replace(self, **options)
+        config.__dict__['_wait_options_version_box'] = self.__wait_options_version
+        return config
 
     # TODO: should we make it and similar – true private over protected?
     def _format_path_as_uri(self, path):
@@ -1665,10 +2274,30 @@ class Config:
                 # )
             ),
             _decorator=config._wait_decorator,
+            _poll=config._poll_strategy(config),
+            _report=config._wait_metrics_hook,
+            _retry=config._retry_strategy(config),
+            _pause=(
+                _observe._until_mutated(
+                    config,
+                    fraction=config._wait_for_dom_mutations_fraction,
+                    cap=config._wait_for_dom_mutations_cap,
+                )
+                if config._wait_for_dom_mutations
+                else None
+            ),
+            _on_failed_attempt=(
+                (lambda reason: config._executor.on_failed_attempt(reason))
+                if config._cache_located_elements
+                or config._driver_liveness_ttl
+                or config._track_frame_path
+                else None
+            ),
         )
     )
     """A strategy for building a Wait object based on other config options
-    like `config.timeout`, `config.hook_wait_failure`, `config._wait_decorator`, etc.
+    like `config.timeout`, `config.hook_wait_failure`, `config._wait_decorator`,
+    `config._poll_strategy`, `config._retry_strategy`, etc.
     """
 
     # TODO: we definitely not need it inside something called Config,
@@ -1680,3 +2309,345 @@ class Config:
 
     def _wait(self, entity: E) -> Wait[E]:
         return self.wait(entity)
+
+    @property
+    def _wait_options_version(self) -> int:
+        """Is bumped on each change of any option that a Wait built by default
+        `config._build_wait_strategy` depends on (see `_WAIT_OPTIONS`),
+        so an entity can reuse its memoized Wait until then
+        (see `config._memoize_waits`).
+        """
+        return self.__wait_options_version.value
+
+    @property
+    def __wait_options_version(self) -> persistent.Box[int]:
+        # is shared with configs derived by `config.with_`,
+        # same as the storage of their not overridden options
+        box = self.__dict__.get('_wait_options_version_box')
+        if box is None:
+            box = self.__dict__.setdefault(
+                '_wait_options_version_box', persistent.Box(0)
+            )
+        return box
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # not counting the options being stored on init
+        if name in _WAIT_OPTIONS and hasattr(self, persistent.Field.box_mask(name)):
+            # is bumped after the change, so the Wait built meanwhile
+            # by another thread is not memoized as up-to-date
+            with _wait_options_version_lock:
+                self.__wait_options_version.value += 1
+
+
+_wait_options_version_lock = threading.Lock()
+
+_WAIT_OPTIONS = frozenset(
+    (
+        '_build_wait_strategy',
+        'timeout',
+        'hook_wait_failure',
+        'save_screenshot_on_failure',
+        'save_page_source_on_failure',
+        'log_outer_html_on_failure',
+        '_wait_decorator',
+        'poll_during_waits',
+        '_poll_strategy',
+        '_retry_strategy',
+        'rebuild_not_alive_driver',
+        '_wait_for_dom_mutations',
+        '_wait_for_dom_mutations_fraction',
+        '_wait_for_dom_mutations_cap',
+        '_wait_metrics_hook',
+        '_cache_located_elements',
+        '_driver_liveness_ttl',
+        '_track_frame_path',
+    )
+)
+
+
+def _quit_driver(config: Config, driver: WebDriver) -> None:
+    if (
+        not config.hold_driver_at_exit
+        and config._is_driver_set_strategy(driver)
+        and config._is_driver_alive_strategy(driver)
+    ):
+        driver.quit()
+
+
+def _teardown_driver(config: Config, driver: WebDriver) -> None:
+    if not config._reset_driver_on_teardown:
+        _quit_driver(config, driver)
+        return
+
+    if driver is config._executor.driver_instance:
+        # resets the session or quits and unsets the driver, so it will be rebuilt
+        config._executor.reset_driver()
+        return
+
+    # some driver not managed by this config, e.g. of a pool
+    try:
+        config._reset_driver_strategy(config)(driver)
+    except WebDriverException:
+        on_error_return_false(driver.quit)
+
+
+def _reset_session(driver: WebDriver) -> None:
+    """Cleans the state of the browser session, so it can be reused by next test,
+    as if it was a new one: for each opened tab deletes cookies and clears
+    local and session storages of its current page, closes all tabs but the first,
+    then opens about:blank. Raises WebDriverException if the session is broken.
+
+    Cookies and storages of other domains, not opened in any tab,
+    stay untouched, because WebDriver has no access to them.
+    """
+
+    def clean():
+        driver.delete_all_cookies()
+        # same as command.js.clear_local_storage and clear_session_storage do
+        for script in (
+            'window.localStorage.clear()',
+            'window.sessionStorage.clear()',
+        ):
+            try:
+                driver.execute_script(script)
+            except JavascriptException:
+                pass  # storage is not accessible for the page, e.g. about:blank
+
+    first, *others = driver.window_handles
+    for handle in others:
+        driver.switch_to.window(handle)
+        clean()
+        driver.close()
+    driver.switch_to.window(first)
+    clean()
+    driver.get('about:blank')
+
+
+class _PoolUtilization(NamedTuple):
+    size: int
+    busy: int
+    idle: int
+    warming: int
+    max_busy: int
+    acquisitions: int
+    recycles: int
+    rebuilds: int
+    waited: float
+    """total time in seconds spent by all threads waiting for a free driver"""
+
+
+class _ThreadLocalBrowser:
+    """A proxy to the browser of the current thread in the pool,
+    so it can be stored once, e.g. as module-global variable,
+    and used from many threads
+    """
+
+    def __init__(self, pool: DriverPool):
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._pool._browser_of_current_thread(), name)
+
+    def __str__(self):
+        return str(self._pool._browser_of_current_thread())
+
+
+class DriverPool:
+    """A pool of driver sessions, built by `config.build_driver_strategy`
+    in background threads, to be shared between threads (e.g. of parallel tests),
+    where each thread gets its own Browser with its own driver from the pool.
+
+    Between tests, the driver is returned back to the pool
+    (i.e. "recycled" by `config._reset_driver_strategy`, instead of quitting),
+    or quit and replaced by a new one, if reset failed.
+    Same way, a driver rebuilt by the browser of some thread
+    (e.g. if `config.rebuild_not_alive_driver` is on) replaces the dead one.
+
+    Is experimental, so far, and is not used by Selene by default.
+
+    Examples:
+        In conftest.py, for example, for tests run in parallel
+        by pytest-xdist (each worker process will have its own pool):
+
+        >>> import pytest
+        >>> from selene import Config
+        >>> from selene.core.configuration import DriverPool
+        >>>
+        >>> pool = DriverPool(Config(driver_name='chrome', timeout=6), size=2)
+        >>> browser = pool.browser  # thread-local proxy
+        >>>
+        >>> def pytest_sessionstart():
+        >>>     pool.warm_up()
+        >>>
+        >>> def pytest_sessionfinish():
+        >>>     print(pool.utilization)
+        >>>     pool.quit()
+        >>>
+        >>> @pytest.fixture(autouse=True)
+        >>> def recycle_browser():
+        >>>     yield
+        >>>     pool.release_browser()
+    """
+
+    def __init__(self, config: Config, size: int):
+        self.config = config
+        self.size = size
+        self.browser = _ThreadLocalBrowser(self)
+        self._idle: queue.Queue[WebDriver | Exception] = queue.Queue()
+        self._drivers: List[WebDriver] = []
+        # drivers handed out by acquire and not released yet
+        self._busy: List[WebDriver] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._warming = 0
+        self._max_busy = 0
+        self._acquisitions = 0
+        self._recycles = 0
+        self._rebuilds = 0
+        self._waited = 0.0
+
+    def _build_in_background(self) -> None:
+        def build():
+            try:
+                driver = self.config.build_driver_strategy(self.config)
+            except Exception as error:
+                # to fail the thread waiting for the driver instead of hanging it
+                self._idle.put(error)
+            else:
+                with self._lock:
+                    self._drivers.append(driver)
+                self._idle.put(driver)
+            finally:
+                with self._lock:
+                    self._warming -= 1
+
+        with self._lock:
+            self._warming += 1
+        threading.Thread(target=build, name='selene-driver-pool', daemon=True).start()
+
+    def warm_up(self) -> DriverPool:
+        """Starts building missing drivers in background, not waiting for them"""
+        with self._lock:
+            missing = self.size - len(self._drivers) - self._warming
+        for _ in range(missing):
+            self._build_in_background()
+        return self
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """Takes a free driver from the pool, waiting for it if needed"""
+        self.warm_up()
+        started = time.monotonic()
+        driver_or_error = self._idle.get(timeout=timeout)
+        with self._lock:
+            self._waited += time.monotonic() - started
+        if isinstance(driver_or_error, Exception):
+            raise driver_or_error
+
+        with self._lock:
+            self._acquisitions += 1
+            self._busy.append(driver_or_error)
+            self._max_busy = max(self._max_busy, len(self._busy))
+        return driver_or_error
+
+    def release(self, driver: WebDriver) -> None:
+        """Returns the driver to the pool after cleaning its session,
+        or quits it and builds a new one in background if cleaning failed
+        """
+        with self._lock:
+            if driver not in self._busy:
+                raise ValueError('driver was not acquired from this pool')
+            self._busy.remove(driver)
+        try:
+            self.config._reset_driver_strategy(self.config)(driver)
+        except (WebDriverException, HTTPError, OSError):
+            # i.e. the browser is broken or dead, and the remote end is not reachable
+            # (urllib3 raises its own MaxRetryError, ProtocolError, etc., if so)
+            with self._lock:
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+                self._rebuilds += 1
+            on_error_return_false(driver.quit)
+            self._build_in_background()
+            return
+
+        with self._lock:
+            self._recycles += 1
+        self._idle.put(driver)
+
+    def _browser_of_current_thread(self):
+        browser = getattr(self._local, 'browser', None)
+        if browser is None:
+            from selene.web import Browser
+
+            driver = self.acquire()
+            browser = Browser(
+                self.config.with_(
+                    driver=driver,
+                    # the pool manages the driver lifecycle by itself
+                    hold_driver_at_exit=True,
+                    # including the drivers rebuilt in place of dead ones
+                    build_driver_strategy=self._rebuild,
+                )
+            )
+            self._local.browser = browser
+            self._local.driver = driver
+        return browser
+
+    def _rebuild(self, config: Config) -> WebDriver:
+        """Builds a driver in place of the dead one of the current thread browser
+        (e.g. if `config.rebuild_not_alive_driver` is on),
+        keeping it owned by the pool, so it will be quit by `pool.quit()`
+        """
+        driver = self.config.build_driver_strategy(config)
+        with self._lock:
+            self._drivers.append(driver)
+            self._rebuilds += 1
+        return driver
+
+    def release_browser(self) -> None:
+        """Releases the driver of the current thread browser (if any)
+        back to the pool, so the next access to `pool.browser`
+        in this thread will acquire a driver again (probably the same)
+        """
+        browser = getattr(self._local, 'browser', None)
+        if browser is None:
+            return
+        acquired = self._local.driver
+        del self._local.browser, self._local.driver
+
+        current = browser.config._executor.driver_instance
+        if current is not acquired and browser.config._executor.is_driver_set:
+            # the acquired driver was rebuilt by the browser, see _rebuild,
+            # so the rebuilt one takes its place in the pool
+            with self._lock:
+                self._busy[self._busy.index(acquired)] = current
+                if acquired in self._drivers:
+                    self._drivers.remove(acquired)
+            on_error_return_false(acquired.quit)
+            self.release(current)
+            return
+
+        self.release(acquired)
+
+    @property
+    def utilization(self) -> _PoolUtilization:
+        with self._lock:
+            return _PoolUtilization(
+                size=self.size,
+                busy=len(self._busy),
+                idle=self._idle.qsize(),
+                warming=self._warming,
+                max_busy=self._max_busy,
+                acquisitions=self._acquisitions,
+                recycles=self._recycles,
+                rebuilds=self._rebuilds,
+                waited=self._waited,
+            )
+
+    def quit(self) -> None:
+        """Quits all drivers built by the pool"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            on_error_return_false(driver.quit)
@@ -22,15 +22,45 @@
 import itertools
 from types import MappingProxyType
 
-from typing_extensions import Callable, Optional, Any, Union, Dict, Literal, cast, Tuple
+from typing_extensions import (
+    Callable,
+    Optional,
+    Any,
+    Union,
+    Dict,
+    Literal,
+    cast,
+    Tuple,
+    Hashable,
+    NamedTuple,
+)
 
 from selenium.webdriver.common.options import BaseOptions
 from selenium.webdriver.common.service import Service
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from selene.common.fp import F
-from selene.core.wait import Wait
+from selene.core.wait import Wait, _WaitEvent
 from selene.common._typing_functions import E
+from selene.web._context import Browser
+
+class _LivenessCounters(NamedTuple):
+    checks: int
+    trusted: int
+    invalidations: int
+
+class _Frame(NamedTuple):
+    key: str
+    switch_into: Callable[[], None]
+
+class _FramePath:
+    def enter(self, config: Config, frame: _Frame) -> None: ...
+    def exit(self, config: Config) -> None: ...
+    def reset(self, config: Config) -> None: ...
+    def invalidate(self, config: Config) -> None: ...
+    def sync(self, driver: WebDriver) -> None: ...
+
+_frame_path: _FramePath
 
 class _DriverStrategiesExecutor:
     def __init__(self, config: Config): ...
@@ -46,7 +76,14 @@ class _DriverStrategiesExecutor:
     @property
     def teardown(self) -> Callable[[WebDriver], None]: ...
     def schedule_teardown(self, get_driver: Callable[[], WebDriver]) -> None: ...
+    def teardown_driver(self) -> None: ...
+    def reset_driver(self) -> None: ...
+    def on_failed_attempt(self, reason: Exception) -> None: ...
+    @property
+    def driver_liveness_counters(self) -> _LivenessCounters: ...
     def get_url(self, url: Optional[str] = None) -> None: ...
+    def invalidate_located_cache(self) -> None: ...
+    def reset_frame_path(self) -> None: ...
     def save_screenshot(self, path: Optional[str] = None) -> Any: ...
     def save_page_source(self, path: Optional[str] = None) -> Any: ...
 
@@ -63,6 +100,7 @@ class Config:
     hold_driver_at_exit: bool = False
     _reset_not_alive_driver_on_get_url: bool = True
     rebuild_not_alive_driver: bool = False
+    _driver_liveness_ttl: float = 0
     _driver_get_url_strategy: Callable[[Config], Callable[[Optional[str]], None]] = ...
     # Options to customize driver management
     build_driver_strategy: Callable[[Config], WebDriver] = ...
@@ -70,6 +108,8 @@ class Config:
         [Config, Callable[[], WebDriver]], None
     ] = ...
     _teardown_driver_strategy: Callable[[Config, WebDriver], None] = ...
+    _reset_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = ...
+    _reset_driver_on_teardown: bool = False
     _is_driver_set_strategy: Callable[[WebDriver], bool] = ...
     _is_driver_alive_strategy: Callable[[WebDriver], bool] = ...
     # Managed Driver
@@ -79,13 +119,22 @@ class Config:
     # Options to customize general Selene behavior
     # > to customize waiting logic
     timeout: float = 4
-    poll_during_waits: int = ...  # currently fake option
+    poll_during_waits: int = ...
+    _poll_strategy: Callable[[Config], Optional[Callable[[int], float]]] = ...
+    _retry_strategy: Callable[[Config], Optional[Callable[[Exception], bool]]] = ...
+    _wait_for_dom_mutations: bool = False
+    _wait_for_dom_mutations_fraction: float = 0.25
+    _wait_for_dom_mutations_cap: Optional[float] = None
     _wait_decorator: Callable[[Wait[E]], Callable[[F], F]] = lambda w: lambda f: f
+    _wait_metrics_hook: Optional[Callable[[_WaitEvent], None]] = None
+    _memoize_waits: bool = True
     _disable_wait_decorator_on_get_query: bool = True
     reports_folder: Optional[str] = ...
     _counter: itertools.count = ...
     save_screenshot_on_failure: bool = True
     save_page_source_on_failure: bool = True
+    _save_artifacts_in_background: bool = False
+    _compress_saved_page_sources: bool = False
     last_screenshot: Optional[str] = None
     last_page_source: Optional[str] = None
     _save_screenshot_strategy: Callable[[Config, Optional[str]], Any] = ...
@@ -103,11 +152,20 @@ class Config:
     wait_for_no_overlap_found_by_js: bool = False
     _match_only_visible_elements_texts: bool = True
     _match_only_visible_elements_size: bool = False
+    _snapshot_collections_by_js: bool = False
+    _filter_collections_by_js: bool = False
+    _search_nested_by_js: bool = False
+    _compile_selector_chains: bool = False
+    _match_composed_conditions_by_js: bool = False
+    _cache_located_elements: bool = False
+    _track_frame_path: bool = False
+    _cached_entities_ttl: Optional[float] = None
     _match_ignoring_case: bool = False
     _placeholders_to_match_elements: Dict[
         Literal['exactly_one', 'zero_or_one', 'one_or_more', 'zero_or_more'], Any
     ] = cast(dict, MappingProxyType({}))
     selector_to_by_strategy: Callable[[str], Tuple[str, str]] = ...
+    def _located_cache_scope(self) -> Optional[Callable[[], Hashable]]: ...
     def _selector_or_by_to_by(
         self, selector_or_by: str | Tuple[str, str], /
     ) -> Tuple[str, str]: ...
@@ -125,6 +183,7 @@ class Config:
         hold_driver_at_exit: bool = False,
         _reset_not_alive_driver_on_get_url: bool = True,
         rebuild_not_alive_driver: bool = False,
+        _driver_liveness_ttl: float = 0,
         _driver_get_url_strategy: Callable[
             [Config], Callable[[Optional[str]], None]
         ] = ...,
@@ -134,6 +193,8 @@ class Config:
             [Config, Callable[[], WebDriver]], None
         ] = ...,
         _teardown_driver_strategy: Callable[[Config, WebDriver], None] = ...,
+        _reset_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = ...,
+        _reset_driver_on_teardown: bool = False,
         _is_driver_set_strategy: Callable[[WebDriver], bool] = ...,
         _is_driver_alive_strategy: Callable[[WebDriver], bool] = ...,
         # Managed Driver
@@ -143,13 +204,24 @@ class Config:
         # Options to customize general Selene behavior
         # > to customize waiting logic
         timeout: float = 4,
-        poll_during_waits: int = ...,  # currently fake option
+        poll_during_waits: int = ...,
+        _poll_strategy: Callable[[Config], Optional[Callable[[int], float]]] = ...,
+        _retry_strategy: Callable[
+            [Config], Optional[Callable[[Exception], bool]]
+        ] = ...,
+        _wait_for_dom_mutations: bool = False,
+        _wait_for_dom_mutations_fraction: float = 0.25,
+        _wait_for_dom_mutations_cap: Optional[float] = None,
         _wait_decorator: Callable[[Wait[E]], Callable[[F], F]] = lambda w: lambda f: f,
+        _wait_metrics_hook: Optional[Callable[[_WaitEvent], None]] = None,
+        _memoize_waits: bool = True,
         _disable_wait_decorator_on_get_query: bool = True,
         reports_folder: Optional[str] = ...,
         _counter: itertools.count = ...,
         save_screenshot_on_failure: bool = True,
         save_page_source_on_failure: bool = True,
+        _save_artifacts_in_background: bool = False,
+        _compress_saved_page_sources: bool = False,
         last_screenshot: Optional[str] = None,
         last_page_source: Optional[str] = None,
         _save_screenshot_strategy: Callable[[Config, Optional[str]], Any] = ...,
@@ -167,6 +239,14 @@ class Config:
         wait_for_no_overlap_found_by_js: bool = False,
         _match_only_visible_elements_texts: bool = True,
         _match_only_visible_elements_size: bool = False,
+        _snapshot_collections_by_js: bool = False,
+        _filter_collections_by_js: bool = False,
+        _search_nested_by_js: bool = False,
+        _compile_selector_chains: bool = False,
+        _match_composed_conditions_by_js: bool = False,
+        _cache_located_elements: bool = False,
+        _track_frame_path: bool = False,
+        _cached_entities_ttl: Optional[float] = None,
         _match_ignoring_case: bool = False,
         _placeholders_to_match_elements: Dict[
             Literal['exactly_one', 'zero_or_one', 'one_or_more', 'zero_or_more'], Any
@@ -188,6 +268,7 @@ class Config:
         hold_driver_at_exit: bool = False,
         _reset_not_alive_driver_on_get_url: bool = True,
         rebuild_not_alive_driver: bool = False,
+        _driver_liveness_ttl: float = 0,
         _driver_get_url_strategy: Callable[
             [Config], Callable[[Optional[str]], None]
         ] = ...,
@@ -197,6 +278,8 @@ class Config:
             [Config, Callable[[], WebDriver]], None
         ] = ...,
         _teardown_driver_strategy: Callable[[Config, WebDriver], None] = ...,
+        _reset_driver_strategy: Callable[[Config], Callable[[WebDriver], None]] = ...,
+        _reset_driver_on_teardown: bool = False,
         _is_driver_set_strategy: Callable[[WebDriver], bool] = ...,
         _is_driver_alive_strategy: Callable[[WebDriver], bool] = ...,
         # Managed Driver
@@ -206,13 +289,24 @@ class Config:
         # Options to customize general Selene behavior
         # > to customize waiting logic
         timeout: float = 4,
-        poll_during_waits: int = ...,  # currently fake option
+        poll_during_waits: int = ...,
+        _poll_strategy: Callable[[Config], Optional[Callable[[int], float]]] = ...,
+        _retry_strategy: Callable[
+            [Config], Optional[Callable[[Exception], bool]]
+        ] = ...,
+        _wait_for_dom_mutations: bool = False,
+        _wait_for_dom_mutations_fraction: float = 0.25,
+        _wait_for_dom_mutations_cap: Optional[float] = None,
         _wait_decorator: Callable[[Wait[E]], Callable[[F], F]] = lambda w: lambda f: f,
+        _wait_metrics_hook: Optional[Callable[[_WaitEvent], None]] = None,
+        _memoize_waits: bool = True,
         _disable_wait_decorator_on_get_query: bool = True,
         reports_folder: Optional[str] = ...,
         _counter: itertools.count = ...,
         save_screenshot_on_failure: bool = True,
         save_page_source_on_failure: bool = True,
+        _save_artifacts_in_background: bool = False,
+        _compress_saved_page_sources: bool = False,
         last_screenshot: Optional[str] = None,
         last_page_source: Optional[str] = None,
         _save_screenshot_strategy: Callable[[Config, Optional[str]], Any] = ...,
@@ -230,6 +324,14 @@ class Config:
         wait_for_no_overlap_found_by_js: bool = False,
         _match_only_visible_elements_texts: bool = True,
         _match_only_visible_elements_size: bool = False,
+        _snapshot_collections_by_js: bool = False,
+        _filter_collections_by_js: bool = False,
+        _search_nested_by_js: bool = False,
+        _compile_selector_chains: bool = False,
+        _match_composed_conditions_by_js: bool = False,
+        _cache_located_elements: bool = False,
+        _track_frame_path: bool = False,
+        _cached_entities_ttl: Optional[float] = None,
         _match_ignoring_case: bool = False,
         _placeholders_to_match_elements: Dict[
             Literal['exactly_one', 'zero_or_one', 'one_or_more', 'zero_or_more'], Any
@@ -241,3 +343,31 @@ class Config:
         _build_wait_strategy: Callable[[Config], Callable[[E], Wait[E]]] = ...,
     ): ...
     def _wait(self, entity: E) -> Wait[E]: ...
+    @property
+    def _wait_options_version(self) -> int: ...
+
+def _reset_session(driver: WebDriver) -> None: ...
+
+class _PoolUtilization(NamedTuple):
+    size: int
+    busy: int
+    idle: int
+    warming: int
+    max_busy: int
+    acquisitions: int
+    recycles: int
+    rebuilds: int
+    waited: float
+
+class DriverPool:
+    config: Config
+    size: int
+    browser: Browser
+    def __init__(self, config: Config, size: int): ...
+    def warm_up(self) -> DriverPool: ...
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver: ...
+    def release(self, driver: WebDriver) -> None: ...
+    def release_browser(self) -> None: ...
+    @property
+    def utilization(self) -> _PoolUtilization: ...
+    def quit(self) -> None: ...
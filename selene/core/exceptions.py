@@ -103,8 +103,40 @@ class ConditionMismatch(AssertionError):
     ```
     """  # todo: document _describe_actual_result examples
 
-    def __init__(self, message='condition not matched'):
-        super().__init__(message)
+    def __init__(self, message: str | Callable[[], str] = 'condition not matched'):
+        # the message can be deferred, to be rendered only if shown,
+        # e.g. on the final failure of waiting, not on each failed attempt,
+        # because describing actual result may cost additional WebDriver calls
+        self.__message = message
+        super().__init__()
+
+    def __render_message(self) -> str:
+        if callable(self.__message):
+            try:
+                self.__message = self.__message()
+            except Exception as error:
+                self.__message = (
+                    f'condition not matched'
+                    f' (failed to describe actual result:'
+                    f' {error.__class__.__name__}: {getattr(error, "msg", error)})'
+                )
+        return self.__message
+
+    @property
+    def args(self):
+        return (self.__render_message(),)
+
+    @args.setter
+    def args(self, value):
+        # keeps args assignable as for any other exception,
+        # e.g. to reword the error on the way up
+        value = tuple(value)
+        self.__message = (
+            str(value[0]) if len(value) == 1 else str(value) if value else ''
+        )
+
+    def __str__(self):
+        return self.__render_message()
 
     @classmethod
     @overload
@@ -238,7 +270,15 @@ class ConditionMismatch(AssertionError):
                 if _inverted and is_falsy:
                     return
                 # answer is still None
-                raise (cls if is_falsy else reason.__class__)(
+                if is_falsy:
+                    raise cls(
+                        # reason is bound now, because it is deleted after except
+                        lambda reason=reason: (
+                            f'{describe_error(reason)}:'
+                            f'\n{describe_not_match(actual_to_test)}'
+                        )
+                    ) from reason
+                raise reason.__class__(
                     # todo: should we still remove stacktrace from reason
                     #       if it's not is_falsy?
                     f'{describe_error(reason)}:'
@@ -250,7 +290,8 @@ class ConditionMismatch(AssertionError):
                 #       we want need it for our conditions,
                 #       cause wait.py logs it in the message
                 #       but ... ?
-                raise cls(describe_not_match(actual_to_test))
+                # described lazily, i.e. only if the mismatch will be shown
+                raise cls(lambda: describe_not_match(actual_to_test))
 
         return wrapped
 
@@ -20,18 +20,121 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 from __future__ import annotations
-from typing import TypeVar, Generic, Callable
+
+import contextvars
+import time
+import typing
+import weakref
+from typing import TypeVar, Generic, Callable, Hashable, Tuple, Optional, Dict, Any
 
 T = TypeVar('T')
 
 
+_evaluation_memo: contextvars.ContextVar[Optional[Dict[Any, Any]]] = (
+    contextvars.ContextVar('selene_evaluation_memo', default=None)
+)
+"""Results located by locators (and other memoized results) that are reused
+while some evaluation scope is active in the current context,
+see `selene.core.condition._Evaluation`
+"""
+
+
 class Locator(Generic[T]):
-    def __init__(self, description: str | Callable[[], str], locate: Callable[[], T]):
+    def __init__(
+        self,
+        description: str | Callable[[], str],
+        locate: Callable[[], T],
+        *,
+        _cache_scope: Optional[Callable[[], Hashable]] = None,
+        _chain: Optional[Any] = None,
+    ):
         self._description = description
         self._locate = locate
+        # if provided, the located result will be reused
+        # while the scope stays the same, see _LocatedCache below
+        self._cache_scope = _cache_scope
+        self._cached: Optional[Tuple[Hashable, T]] = None
+        # selectors of the chain of elements to locate by,
+        # so the inner locators can compile them, see selene.core._chain
+        self._chain = _chain
 
     def __call__(self) -> T:
-        return self._locate()
+        memo = _evaluation_memo.get()
+        if memo is not None:
+            if self in memo:
+                return memo[self]
+            located = memo[self] = self.__locate()
+            return located
+
+        return self.__locate()
+
+    def __locate(self) -> T:
+        if self._cache_scope is None:
+            return self._locate()
+
+        scope = self._cache_scope()
+        if self._cached is not None and self._cached[0] == scope:
+            return self._cached[1]
+
+        located = self._locate()
+        self._cached = (scope, located)
+        return located
 
     def __str__(self):
+        # lazy description is rendered on demand, each time anew,
+        # because it may depend on a changing state,
+        # e.g. on platform of current driver for mobile locators
         return self._description() if callable(self._description) else self._description
+
+
+class _LazyCachedLocator(Locator[T]):
+    """Locates on first call and reuses the located result on next calls,
+    until `ttl` seconds pass since location (if `ttl` is provided).
+    A failed location is not cached, so the next call will try again.
+    """
+
+    def __init__(
+        self,
+        description: str | Callable[[], str],
+        locate: Callable[[], T],
+        *,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(description, locate)
+        self._ttl = ttl
+        self._located_at: Optional[float] = None
+        self._located: Optional[T] = None
+
+    def __call__(self) -> T:
+        now = time.monotonic()
+        if self._located_at is not None and (
+            self._ttl is None or now - self._located_at < self._ttl
+        ):
+            return typing.cast(T, self._located)
+
+        located = self._locate()
+        self._located, self._located_at = located, now
+        return located
+
+
+class _LocatedCache:
+    """Scopes of located elements cached by locators, one per each driver.
+
+    The scope of a driver is "versioned", so all elements located
+    in context of some driver can be invalidated at once
+    by moving its scope to the next version,
+    e.g. on switching to another window or frame,
+    on opening new url, or on failed attempt of some waiting
+    (because an element might become stale, or even absent in DOM
+    and the latter can't be detected by the cached element).
+    """
+
+    _versions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def scope_of(cls, driver) -> Hashable:
+        return id(driver), cls._versions.get(driver, 0)
+
+    @classmethod
+    def invalidate(cls, driver) -> None:
+        cls._versions[driver] = cls._versions.get(driver, 0) + 1
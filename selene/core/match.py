@@ -21,6 +21,7 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import json
 import re
 import warnings
 from functools import reduce
@@ -54,6 +55,7 @@ from selene.core import entity
 from selene.core._entity import _ConfiguredEntity
 from selene.core._element import Element
 from selene.core._browser import Browser
+from selene.core._snapshot import _js_predicate
 
 
 # GENERAL CONDITION BUILDERS ------------------------------------------------- #
@@ -71,6 +73,8 @@ class _EntityHasSomethingSupportingIgnoreCase(Match[E]):
         _ignore_case=False,
         _inverted=False,
         _falsy_exceptions: Iterable[Type[Exception]] = (AssertionError,),
+        _js_actual: str | None = None,
+        _js_by: Callable[[str], Callable[[str], str]] | None = None,
     ):
         self.__name = name
         self.__actual = actual
@@ -79,6 +83,8 @@ class _EntityHasSomethingSupportingIgnoreCase(Match[E]):
         self.__ignore_case = _ignore_case
         self.__inverted = _inverted
         self.__falsy_exceptions = _falsy_exceptions
+        self.__js_actual = _js_actual
+        self.__js_by = _js_by
 
         super().__init__(
             lambda maybe_entity: (
@@ -114,6 +120,23 @@ class _EntityHasSomethingSupportingIgnoreCase(Match[E]):
             ),
             _inverted=_inverted,
             _falsy_exceptions=_falsy_exceptions,
+            _js=(
+                (
+                    lambda maybe_entity: (
+                        _js_by(str(expected).lower())(
+                            f"String(({_js_actual}) ?? 'None').toLowerCase()"
+                        )
+                        if (
+                            maybe_entity is not None
+                            and maybe_entity.config._match_ignoring_case
+                        )
+                        or _ignore_case
+                        else _js_by(str(expected))(f"String(({_js_actual}) ?? 'None')")
+                    )
+                )
+                if _js_actual and _js_by
+                else None
+            ),
         )
 
     # TODO: should we add property pattern or with_regex (compare with *_like conditions)
@@ -129,6 +152,8 @@ class _EntityHasSomethingSupportingIgnoreCase(Match[E]):
             _ignore_case=True,
             _inverted=self.__inverted,
             _falsy_exceptions=self.__falsy_exceptions,
+            _js_actual=self.__js_actual,
+            _js_by=self.__js_by,
         )
 
 
@@ -307,6 +332,7 @@ visible: Condition[Element] = Match(
         AssertionError,
         NoSuchElementException,
     ),
+    _js='isDisplayed(element)',
 )
 
 # todo: remove once decide on the best implementation
@@ -330,7 +356,9 @@ that will result in good error like:
 – but is slower, because of two calls to webdriver on actual
 """
 
-hidden: Condition[Element] = Condition('is hidden', visible.not_)
+hidden: Condition[Element] = Condition(
+    'is hidden', visible.not_, _js='!isDisplayed(element)'
+)
 
 hidden_in_dom: Condition[Element] = present_in_dom.and_(visible.not_)
 
@@ -338,6 +366,7 @@ hidden_in_dom: Condition[Element] = present_in_dom.and_(visible.not_)
 enabled: Condition[Element] = Match(
     'is enabled',
     by=lambda element: element.locate().is_enabled(),
+    _js='!element.matches(":disabled")',
 )
 
 # disabled: Condition[Element] = Condition('disabled', enabled.not_)
@@ -464,6 +493,8 @@ def text_containing(expected: str | int | float, _ignore_case=False, _inverted=F
         by=predicate.includes,
         _ignore_case=_ignore_case,
         _inverted=_inverted,
+        _js_actual='textOf(element)',
+        _js_by=_js_predicate.includes,
     )
 
 
@@ -475,6 +506,8 @@ def exact_text(expected: str | int | float, _ignore_case=False, _inverted=False)
         by=predicate.equals,
         _ignore_case=_ignore_case,
         _inverted=_inverted,
+        _js_actual='textOf(element)',
+        _js_by=_js_predicate.equals,
     )
 
 
@@ -565,6 +598,14 @@ class _ElementDescriptor(Condition[Element]):
             _inverted=_inverted,
         )
 
+    @property
+    def __js_actual(self) -> str | None:
+        return (
+            f'attributeOf(element, {json.dumps(self.__expected)})'
+            if self.__type_element_query is query.attribute
+            else None
+        )
+
     def value(self, expected):
         return _EntityHasSomethingSupportingIgnoreCase(
             f"has {self.__type_name} '{self.__expected}' with value",
@@ -572,6 +613,8 @@ class _ElementDescriptor(Condition[Element]):
             actual=self.__type_element_query(self.__expected),
             by=predicate.equals,
             _inverted=self.__inverted,
+            _js_actual=self.__js_actual,
+            _js_by=_js_predicate.equals,
         )
 
     def value_containing(self, expected):
@@ -581,6 +624,8 @@ class _ElementDescriptor(Condition[Element]):
             actual=self.__type_element_query(self.__expected),
             by=predicate.includes,
             _inverted=self.__inverted,
+            _js_actual=self.__js_actual,
+            _js_by=_js_predicate.includes,
         )
 
     def values(self, *expected: str | int | float | Iterable[str]):
@@ -662,6 +707,8 @@ def css_class(name: str, _inverted=False):
         actual=class_attribute_value,
         by=predicate.includes_word,
         _inverted=_inverted,
+        _js_actual='getAttribute(element, "class")',
+        _js_by=_js_predicate.includes_word,
     )
 
 
@@ -974,6 +1021,9 @@ class _exact_texts_like(Condition[Collection]):
     that might not work correctly if there will be more than one character.
     """
     _MATCHING_EMPTY_STRING_MARKER = '‹EMTPY_STRING›'
+    _PATTERNS_CACHE_SIZE = 8
+    """How many compiled expected patterns (per different globs and flags)
+    to keep cached on each condition object"""
     _RENDERING_SEPARATOR = ', '
     # todo: consider customizing via config
     _RENDERING_TRANSLATIONS = (
@@ -1025,6 +1075,13 @@ class _exact_texts_like(Condition[Collection]):
         self._name_prefix = _name_prefix
         self._name = _name
         self._flags = _flags
+        self.__patterns: List[
+            Tuple[
+                Tuple[Tuple[Any, str], ...],
+                int,
+                Tuple[str, re.Pattern | None, re.error | None],
+            ]
+        ] = []
         # actually disabling any patterns, processing as a normal string
         self._process_patterns: Callable[[str], str] = re.escape  # HARDCODED by intent
         # should we use above Callable[[AnyStr], AnyStr]
@@ -1099,21 +1156,25 @@ class _exact_texts_like(Condition[Collection]):
             for glob_pattern_type, glob_marker in placeholders.items()
         )
 
-    def __call__(self, entity: Collection):
-        entity_globs = self.__globs_from(
-            placeholders=entity.config._placeholders_to_match_elements
-        )
-        globs = self._globs or entity_globs or _exact_texts_like._DEFAULT_GLOBS
+    def __pattern_for(
+        self, globs: Tuple[Tuple[Any, str], ...], flags: int
+    ) -> Tuple[str, re.Pattern | None, re.error | None]:
+        """Builds and compiles the expected pattern once per globs and flags,
+        keeping a few last results in LRU-like cache on the condition object,
+        because the expected side never changes between attempts of waiting,
+        while globs and flags may only change with config of the matched entity.
+
+        Returns the pattern string, its compiled version (or None) and
+        the error of compilation (or None).
+        """
+        # globs may contain unhashable markers like [...] or {...},
+        # hence the cache is a list of entries compared by equality
+        for index, (cached_globs, cached_flags, cached) in enumerate(self.__patterns):
+            if cached_globs == globs and cached_flags == flags:
+                if index:
+                    self.__patterns.insert(0, self.__patterns.pop(index))
+                return cached
 
-        actual_texts = (
-            [
-                webelement.text
-                for webelement in entity.locate()
-                if webelement.is_displayed()
-            ]
-            if entity.config._match_only_visible_elements_texts
-            else [webelement.text for webelement in entity.locate()]
-        )
         # TODO: should we just check for * in pattern here and further for zero_like?
         # TODO: consider moving to self
         zero_like = lambda item_marker: item_marker in [
@@ -1125,40 +1186,6 @@ class _exact_texts_like(Condition[Collection]):
                 _exact_texts_like._PredefinedGlobPatterns['zero_or_more'],
             )
         ]
-        actual_to_match = (
-            # seems like not needed anymore, once we refactored from join to reduce
-            # in order to be able to add '?' for zero_like in the end...
-            # see more explanation below...
-            #
-            # (
-            #     # zero_like globs in the START needs an extra separator
-            #     # to match correctly
-            #     _exact_texts_like._MATCHING_SEPARATOR
-            #     if zero_like_at_start
-            #     else ''
-            # )
-            # +
-            _exact_texts_like._MATCHING_SEPARATOR.join(
-                text if text != '' else _exact_texts_like._MATCHING_EMPTY_STRING_MARKER
-                for text in actual_texts
-            )
-            # zero_like globs in the END needed an extra separator ...
-            # + (
-            #     # zero_like globs in the END needs an extra separator at the end
-            #     # to match correctly
-            #     _exact_texts_like._MATCHING_SEPARATOR
-            #     if zero_like_at_end
-            #     else ''
-            # )
-            # but to make zero_like work on actual zero items in the middle
-            # we had to add this extra separator for all types of globs...
-            # actually we needed a different thing but the latter happened
-            # as a side effect... so in order to not "clean side effects"
-            # we just add here the same separator for all cases in the end:
-            + _exact_texts_like._MATCHING_SEPARATOR
-        )
-        actual_to_render = _exact_texts_like._RENDERING_SEPARATOR.join(actual_texts)
-
         glob_pattern_by = lambda marker: next(  # noqa
             glob_pattern for glob_marker, glob_pattern in globs if glob_marker == marker
         )
@@ -1200,22 +1227,72 @@ class _exact_texts_like(Condition[Collection]):
             + r'$'
         )
 
-        answer = None
-        regex_invalid_error: re.error | None = None
-
+        compiled: Tuple[str, re.Pattern | None, re.error | None]
         try:
-            answer = re.match(
-                expected_pattern,
-                actual_to_match,
-                (
-                    self._flags | re.IGNORECASE
-                    if entity.config._match_ignoring_case
-                    else self._flags
-                ),
-            )
+            compiled = (expected_pattern, re.compile(expected_pattern, flags), None)
         except re.error as error:
-            # going to re-raise it below as AssertionError on `not answer`
-            regex_invalid_error = error
+            # going to re-raise it in __call__ as AssertionError
+            compiled = (expected_pattern, None, error)
+
+        self.__patterns.insert(0, (globs, flags, compiled))
+        del self.__patterns[_exact_texts_like._PATTERNS_CACHE_SIZE :]
+        return compiled
+
+    def __call__(self, entity: Collection):
+        entity_globs = self.__globs_from(
+            placeholders=entity.config._placeholders_to_match_elements
+        )
+        globs = self._globs or entity_globs or _exact_texts_like._DEFAULT_GLOBS
+
+        actual_texts = (
+            query.visible_texts(entity)
+            if entity.config._match_only_visible_elements_texts
+            else query.texts(entity)
+        )
+        actual_to_match = (
+            # seems like not needed anymore, once we refactored from join to reduce
+            # in order to be able to add '?' for zero_like in the end...
+            # see more explanation below...
+            #
+            # (
+            #     # zero_like globs in the START needs an extra separator
+            #     # to match correctly
+            #     _exact_texts_like._MATCHING_SEPARATOR
+            #     if zero_like_at_start
+            #     else ''
+            # )
+            # +
+            _exact_texts_like._MATCHING_SEPARATOR.join(
+                text if text != '' else _exact_texts_like._MATCHING_EMPTY_STRING_MARKER
+                for text in actual_texts
+            )
+            # zero_like globs in the END needed an extra separator ...
+            # + (
+            #     # zero_like globs in the END needs an extra separator at the end
+            #     # to match correctly
+            #     _exact_texts_like._MATCHING_SEPARATOR
+            #     if zero_like_at_end
+            #     else ''
+            # )
+            # but to make zero_like work on actual zero items in the middle
+            # we had to add this extra separator for all types of globs...
+            # actually we needed a different thing but the latter happened
+            # as a side effect... so in order to not "clean side effects"
+            # we just add here the same separator for all cases in the end:
+            + _exact_texts_like._MATCHING_SEPARATOR
+        )
+        actual_to_render = _exact_texts_like._RENDERING_SEPARATOR.join(actual_texts)
+
+        expected_pattern, compiled_pattern, regex_invalid_error = self.__pattern_for(
+            globs,
+            (
+                self._flags | re.IGNORECASE
+                if entity.config._match_ignoring_case
+                else self._flags
+            ),
+        )
+
+        answer = compiled_pattern.match(actual_to_match) if compiled_pattern else None
 
         def describe_not_match():
             # TODO: implement pattern_explained
@@ -211,6 +211,8 @@ from selene.core import entity, Collection
 from selene.core._element import Element
 from selene.core._browser import Browser
 from selene.core.locator import Locator
+from selene.core import _form
+from selene.core._snapshot import _snapshot
 from selene.web._elements import _FrameContext
 
 # TODO: should not we separate Query type from actual queries implementations?
@@ -244,6 +246,10 @@ def attributes(name: str) -> Query[Collection, List[str]]:
     """
 
     def fn(collection: Collection):
+        snapshot = _snapshot(collection, attributes=[name])
+        if snapshot is not None:
+            return [element.attributes[name] for element in snapshot]
+
         if name in ('href', 'src'):
             return [
                 collection.config.driver.execute_script(
@@ -280,6 +286,19 @@ full text of element without space normalization
 value = attribute('value')
 values = attributes('value')
 
+form_values: Query[Element, Dict[str, Any]] = Query(
+    'form values',
+    lambda element: element.config.driver.execute_script(
+        _form._VALUES_SCRIPT, element.locate()
+    ),
+)
+"""Values of all named (or having id) fields of a form-like element,
+read by one `execute_script` call, as checked state for checkboxes,
+the value of checked radio (or None) for radio groups,
+the list of selected values for multiple selects,
+and just value for other fields.
+"""
+
 tag: Query[Element, str] = Query('tag name', lambda element: element.locate().tag_name)
 tags: Query[Collection, List[str]] = Query(
     'tag names',
@@ -291,7 +310,9 @@ text: Query[Element, str] = Query('text', lambda element: element.locate().text)
 texts: Query[Collection, List[str]] = Query(
     'texts',
     lambda collection: (
-        [element.text for element in collection.locate()]
+        [element.text for element in snapshot]
+        if (snapshot := _snapshot(collection)) is not None
+        else [element.text for element in collection.locate()]
         # [element.text for element in collection.locate() if element.is_displayed()]
         # if collection.config._filter_all_elements_for_visibility
         # else [element.text for element in collection.locate()]
@@ -300,9 +321,11 @@ texts: Query[Collection, List[str]] = Query(
 """list of normalized texts of all elements in collection"""
 visible_texts: Query[Collection, List[str]] = Query(
     'visible texts',
-    lambda collection: [
-        element.text for element in collection.locate() if element.is_displayed()
-    ],
+    lambda collection: (
+        [element.text for element in snapshot if element.displayed]
+        if (snapshot := _snapshot(collection)) is not None
+        else [element.text for element in collection.locate() if element.is_displayed()]
+    ),
 )
 """list of normalized texts of all visible elements in collection"""
 
@@ -22,11 +22,40 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import random
+import re
 import time
 import warnings
-from typing_extensions import Generic, Callable, TypeVar, Optional, cast
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    InvalidArgumentException,
+    InvalidElementStateException,
+    InvalidSelectorException,
+    JavascriptException,
+    MoveTargetOutOfBoundsException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    NoSuchShadowRootException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+)
+from typing_extensions import (
+    Generic,
+    Callable,
+    TypeVar,
+    Optional,
+    cast,
+    NamedTuple,
+    Dict,
+    Type,
+)
 
 from selene.core.exceptions import TimeoutException
+from selene.core.locator import _evaluation_memo
 
 from selene.common.fp import identity
 from selene.common._typing_functions import Query, Command
@@ -39,6 +68,264 @@ A generic TypeVar to identify an Entity Type, i.e. something to wait on
 '''
 
 
+class poll:
+    """Factories of polling schedules to be used by [Wait][selene.core.wait.Wait]
+    between failed attempts, like in `Wait(entity, at_most=4, _poll=poll.fixed(0.1))`.
+
+    A schedule is a function of the number of already failed attempts
+    (starting from 1) that returns a delay in seconds to sleep
+    before the next attempt. The delay is never slept past the wait deadline.
+    """
+
+    @staticmethod
+    def fixed(interval: float) -> Callable[[int], float]:
+        """Sleep the same `interval` seconds between all attempts"""
+        return lambda attempt: interval
+
+    @staticmethod
+    def backoff(
+        initial: float,
+        *,
+        factor: float = 2.0,
+        cap: float = 1.0,
+        jitter: float = 0.0,
+    ) -> Callable[[int], float]:
+        """Sleep exponentially longer starting from `initial` seconds,
+        multiplying it by `factor` after each failed attempt, but never longer
+        than `cap` seconds. Optional `jitter` (a fraction like `0.2`)
+        randomly spreads the delay in range of ±jitter×delay, so parallel
+        workers do not poll the same remote node in sync.
+        """
+
+        def schedule(attempt: int) -> float:
+            delay = min(cap, initial * factor ** (attempt - 1))
+            if jitter:
+                delay += delay * random.uniform(-jitter, jitter)
+            return max(0.0, delay)
+
+        return schedule
+
+    @staticmethod
+    def fast_then_slow(
+        fast: float,
+        slow: float,
+        *,
+        fast_attempts: int = 3,
+    ) -> Callable[[int], float]:
+        """Sleep `fast` seconds after each of the first `fast_attempts`
+        failed attempts, then `slow` seconds after all others.
+        Handy when most conditions pass almost immediately,
+        while the rest of them may take long.
+        """
+        return lambda attempt: fast if attempt <= fast_attempts else slow
+
+
+class retry:
+    """Factories of policies to decide whether [Wait][selene.core.wait.Wait]
+    should make the next attempt after a failed one, or fail immediately,
+    like in `Wait(entity, at_most=4, _retry=retry.on_transient())`.
+
+    A policy is a predicate on the exception of the failed attempt.
+    If it returns False, the waiting fails without waiting for the deadline,
+    with the same failure hooks as on timeout.
+    """
+
+    _TRANSIENT: tuple[Type[Exception], ...] = (
+        StaleElementReferenceException,
+        NoSuchElementException,
+        NoSuchShadowRootException,
+        NoSuchFrameException,
+        NoSuchWindowException,
+        NoAlertPresentException,
+        # including not interactable and not visible elements
+        InvalidElementStateException,
+        ElementClickInterceptedException,
+        MoveTargetOutOfBoundsException,
+        # like the one thrown by JS commands on not visible element yet
+        JavascriptException,
+        # ConditionMismatch and other "not matched yet" assertion errors
+        AssertionError,
+    )
+
+    _BROKEN: tuple[Type[Exception], ...] = (
+        InvalidSelectorException,
+        InvalidArgumentException,
+        re.error,
+    )
+
+    @staticmethod
+    def always() -> Callable[[Exception], bool]:
+        """Retry on any exception until the deadline"""
+        return lambda reason: True
+
+    @staticmethod
+    def on(*exceptions: Type[Exception]) -> Callable[[Exception], bool]:
+        """Retry only on `exceptions` (including their subclasses)"""
+        return lambda reason: isinstance(reason, exceptions)
+
+    @staticmethod
+    def unless(*exceptions: Type[Exception]) -> Callable[[Exception], bool]:
+        """Retry on all exceptions but `exceptions` (including their subclasses)"""
+        return lambda reason: not isinstance(reason, exceptions)
+
+    @staticmethod
+    def on_transient(*also: Type[Exception]) -> Callable[[Exception], bool]:
+        """Retry only on exceptions that usually signal a temporary state
+        of the page: stale or absent element (or its shadow root, frame,
+        window, alert), not interactable element or intercepted click,
+        error thrown from JavaScript (e.g. by JS commands on not visible element),
+        not matched condition (any AssertionError),
+        plus the ones passed as `also`. Fails fast on everything else,
+        including errors in custom lambdas like TypeError.
+        """
+        return retry.on(*retry._TRANSIENT, *also)
+
+    @staticmethod
+    def unless_broken(*also: Type[Exception]) -> Callable[[Exception], bool]:
+        """Retry on all exceptions but the ones that signal a broken test,
+        so can't pass on next attempts: invalid selector, invalid argument,
+        invalid regex pattern, plus the ones passed as `also`.
+        """
+        return retry.unless(*retry._BROKEN, *also)
+
+
+class _Deadline:
+    """A point in time, measured by monotonic clock (i.e. not affected
+    by system clock adjustments), by which some waiting should finish.
+    """
+
+    def __init__(self, at: float):
+        self.at = at
+
+    @classmethod
+    def in_(cls, seconds: float) -> _Deadline:
+        return cls(time.monotonic() + seconds)
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def passed(self) -> bool:
+        return time.monotonic() > self.at
+
+    def __repr__(self):
+        return f'_Deadline(remaining={self.remaining:.3f}s)'
+
+
+_current_deadline: contextvars.ContextVar[_Deadline | None] = contextvars.ContextVar(
+    'selene_wait_deadline', default=None
+)
+
+
+def _deadline_within_budget(seconds: float) -> _Deadline:
+    """The deadline in `seconds`, or the deadline of the current budget,
+    whichever is earlier (see `_budget`)
+    """
+    own = _Deadline.in_(seconds)
+    outer = _current_deadline.get()
+    return outer if outer and outer.at < own.at else own
+
+
+@contextlib.contextmanager
+def _budget(seconds: float):
+    """Limits all waiting inside the block to `seconds`, or to the remaining
+    budget of the outer block, whichever finishes earlier. So nested waits
+    (e.g. waits inside conditions of an outer wait) consume the outer budget
+    instead of multiplying the worst-case time of the outer wait.
+    """
+    deadline = _deadline_within_budget(seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+_webdriver_calls: contextvars.ContextVar[int] = contextvars.ContextVar(
+    'selene_webdriver_calls', default=0
+)
+"""The number of WebDriver commands executed so far by "counted" drivers
+in the current context, see `selene.support._metrics.counting_webdriver_calls`
+"""
+
+
+class _WaitEvent(NamedTuple):
+    """Metrics of one `wait.for_(fn)` call, reported to `_report` hook of Wait"""
+
+    entity: str
+    name: str
+    attempts: int
+    duration: float
+    """total wall time of waiting in seconds"""
+    succeeded: bool
+    exceptions: Dict[str, int]
+    """number of failed attempts by names of exceptions they failed with"""
+    webdriver_calls: int
+    """number of WebDriver commands executed by "counted" drivers"""
+
+
+def _timed_out(
+    timeout: float,
+    entity: object,
+    fn: Callable,
+    reason: Exception,
+    *,
+    elapsed: float | None = None,
+) -> TimeoutException:
+    """Builds the failure of waiting for `fn` on `entity`
+    that was not succeeded during `timeout` because of the last `reason`,
+    or during `elapsed` seconds, if the budget of an outer wait ended earlier
+    """
+    if elapsed is not None:
+        return _failed(
+            f'Timed out after {elapsed:.3f}s of {timeout}s'
+            f' (the budget of an outer wait ended earlier)',
+            entity,
+            fn,
+            reason,
+        )
+    return _failed(f'Timed out after {timeout}s', entity, fn, reason)
+
+
+def _failed_fast(
+    elapsed: float, entity: object, fn: Callable, reason: Exception
+) -> TimeoutException:
+    """Builds the failure of waiting for `fn` on `entity`
+    that was stopped after `elapsed` seconds because of not retriable `reason`
+    """
+    return _failed(f'Failed without retrying after {elapsed:.3f}s', entity, fn, reason)
+
+
+def _failed(
+    summary: str, entity: object, fn: Callable, reason: Exception
+) -> TimeoutException:
+    reason_name = reason.__class__.__name__
+    # Python 3.13 exposes `re.PatternError` instead of `re.error`.
+    # Keep timeout messages backward-compatible across versions.
+    if reason_name == 'PatternError':
+        reason_name = 'error'
+    reason_string = '{name}: {message}'.format(
+        name=reason_name,
+        message=getattr(reason, "msg", str(reason)),
+    )
+    # TODO: think on how can we improve logging failures in selene, e.g. reverse msg and stacktrace
+    # stacktrace = getattr(reason, 'stacktrace', None)
+    # TODO: should we have an option to turn on stacktrace logging?
+
+    # TODO: consider using Query.full_description_for(fn)
+    # TODO: consider customizing what to use on __init__
+    fn_name = Query._full_name_for(fn, entity) or str(fn)
+
+    return TimeoutException(
+        f'\n'
+        f'\n{summary}, while waiting for:'
+        f'\n{entity}.{fn_name}'
+        f'\n'
+        f'\nReason: {reason_string}'
+    )
+
+
 # TODO: provide sexy fluent implementation via builder, i.e. Wait.the(element).atMost(3).orFailWith(hook)
 class Wait(Generic[E]):
     # TODO: provide the smallest possible timeout default, something like 1ms
@@ -50,6 +337,11 @@ class Wait(Generic[E]):
         _decorator: (
             Callable[[Wait[E]], Callable[[Callable[..., R]], Callable[..., R]]] | None
         ) = None,
+        _poll: Callable[[int], float] | None = None,
+        _on_failed_attempt: Callable[[Exception], None] | None = None,
+        _report: Callable[[_WaitEvent], None] | None = None,
+        _retry: Callable[[Exception], bool] | None = None,
+        _pause: Callable[[E, float, float], None] | None = None,
         # TODO: should not we add here ignore_exceptions?
         #       (called as _falsy_exceptions in Condition init)
         #       and then tune it depending on context,
@@ -61,6 +353,18 @@ class Wait(Generic[E]):
         self._timeout = at_most
         self._hook_failure = or_fail_with or identity
         self._decorator = _decorator or (lambda wait: identity)
+        self._poll = _poll
+        # e.g. to invalidate cached located elements before the next attempt
+        self._on_failed_attempt = _on_failed_attempt
+        # e.g. to collect metrics of all waits, see selene.support._metrics
+        self._report = _report
+        # e.g. to fail fast on exceptions that will not pass on next attempts,
+        # see retry.*; if not provided, any failed attempt is retried
+        self._retry = _retry
+        # e.g. to wake up on DOM mutations instead of sleeping the whole delay,
+        # called with the entity, the polling delay (0 if no _poll is set)
+        # and the remaining time till the deadline; if not provided, just sleeps
+        self._pause = _pause
 
     def with_(
         self,
@@ -70,7 +374,17 @@ class Wait(Generic[E]):
         ),
         # TODO: consider adding other options for consistency
     ) -> Wait[E]:
-        return Wait(self.entity, self._timeout, self._hook_failure, decorator)
+        return Wait(
+            self.entity,
+            self._timeout,
+            self._hook_failure,
+            decorator,
+            _poll=self._poll,
+            _on_failed_attempt=self._on_failed_attempt,
+            _report=self._report,
+            _retry=self._retry,
+            _pause=self._pause,
+        )
 
     @property
     def _entity(self):
@@ -82,12 +396,30 @@ class Wait(Generic[E]):
         return self.entity
 
     def at_most(self, timeout: float) -> Wait[E]:
-        return Wait(self.entity, timeout, self._hook_failure)
+        return Wait(
+            self.entity,
+            timeout,
+            self._hook_failure,
+            _poll=self._poll,
+            _on_failed_attempt=self._on_failed_attempt,
+            _report=self._report,
+            _retry=self._retry,
+            _pause=self._pause,
+        )
 
     def or_fail_with(
         self, hook_failure: Optional[Callable[[TimeoutException], Exception]]
     ) -> Wait[E]:
-        return Wait(self.entity, self._timeout, hook_failure)
+        return Wait(
+            self.entity,
+            self._timeout,
+            hook_failure,
+            _poll=self._poll,
+            _on_failed_attempt=self._on_failed_attempt,
+            _report=self._report,
+            _retry=self._retry,
+            _pause=self._pause,
+        )
 
     @property
     def hook_failure(
@@ -99,42 +431,77 @@ class Wait(Generic[E]):
     # todo: consider renaming to `def to(...)`, though will sound awkward when wait.to(condition)
     # todo: do we need a second description/named param?
     def for_(self, fn: Callable[[E], R]) -> R:
+        # per-call state is kept local, because the same Wait may be reused
+        # by nested or concurrent calls (see config._memoize_waits)
+        failures: Dict[str, int] = {}
+        attempts = 0
+
         def logic(fn: Callable[[E], R]) -> R:
-            finish_time = time.time() + self._timeout
+            if _evaluation_memo.get() is not None:
+                # waiting inside evaluation of some composed condition
+                # should not reuse elements located by its outer attempt
+                token = _evaluation_memo.set(None)
+                try:
+                    return budgeted()
+                finally:
+                    _evaluation_memo.reset(token)
+            return budgeted()
+
+        def budgeted() -> R:
+            outer = _current_deadline.get()
+            with _budget(self._timeout) as deadline:
+                narrowed = deadline is outer
+                if self._report is None:
+                    return attempt_until(deadline, narrowed)
+                return attempt_until_reporting(deadline, narrowed)
+
+        def attempt_until_reporting(deadline: _Deadline, narrowed: bool) -> R:
+            report = cast(Callable[[_WaitEvent], None], self._report)
+            started = time.perf_counter()
+            calls = _webdriver_calls.get()
+            succeeded = False
+            try:
+                result = attempt_until(deadline, narrowed)
+                succeeded = True
+                return result
+            finally:
+                duration = time.perf_counter() - started
+                report(
+                    self._event(
+                        fn,
+                        attempts=attempts,
+                        duration=duration,
+                        succeeded=succeeded,
+                        exceptions=failures,
+                        webdriver_calls=_webdriver_calls.get() - calls,
+                    )
+                )
+
+        def attempt_until(deadline: _Deadline, narrowed: bool) -> R:
+            nonlocal attempts
+            started = time.monotonic()
 
             while True:
+                attempts += 1
                 try:
                     return fn(self.entity)
                 except Exception as reason:
-                    if time.time() > finish_time:
-                        reason_name = reason.__class__.__name__
-                        # Python 3.13 exposes `re.PatternError` instead of `re.error`.
-                        # Keep timeout messages backward-compatible across versions.
-                        if reason_name == 'PatternError':
-                            reason_name = 'error'
-                        reason_string = '{name}: {message}'.format(
-                            name=reason_name,
-                            message=getattr(reason, "msg", str(reason)),
-                        )
-                        # TODO: think on how can we improve logging failures in selene, e.g. reverse msg and stacktrace
-                        # stacktrace = getattr(reason, 'stacktrace', None)
-                        # TODO: should we have an option to turn on stacktrace logging?
-                        timeout = self._timeout
-                        entity = self.entity
-
-                        # TODO: consider using Query.full_description_for(fn)
-                        # TODO: consider customizing what to use on __init__
-                        fn_name = Query._full_name_for(fn, entity) or str(fn)
-
-                        failure = TimeoutException(
-                            f'\n'
-                            f'\nTimed out after {timeout}s, while waiting for:'
-                            f'\n{entity}.{fn_name}'
-                            f'\n'
-                            f'\nReason: {reason_string}'
-                        )
-
-                        raise self._hook_failure(failure)
+                    if self._report is not None:
+                        name = reason.__class__.__name__
+                        failures[name] = failures.get(name, 0) + 1
+
+                    delay = self._after_failed(
+                        fn, reason, attempts, started, deadline, narrowed
+                    )
+                    # last attempt should happen right at the deadline,
+                    # so we never sleep past it
+                    remaining = deadline.remaining
+                    delay = min(delay, remaining)
+                    if self._pause:
+                        if remaining > 0:
+                            self._pause(self.entity, delay, remaining)
+                    elif delay > 0:
+                        time.sleep(delay)
 
         decorator = cast(
             Callable[[Wait[E]], Callable[[Callable[..., R]], Callable[..., R]]],
@@ -143,6 +510,63 @@ class Wait(Generic[E]):
 
         return decorator(self)(logic)(fn)
 
+    # the parts of waiting loop shared with selene.aio.Wait
+
+    def _after_failed(
+        self,
+        fn: Callable[[E], R],
+        reason: Exception,
+        attempts: int,
+        started: float,
+        deadline: _Deadline,
+        narrowed: bool,
+    ) -> float:
+        """Fails the waiting for `fn` (started at `started` by monotonic clock)
+        if no more attempts should be made after the failed one,
+        otherwise returns the polling delay before the next attempt
+        (to be limited by the remaining time by the caller)
+        """
+        if deadline.passed:
+            raise self._hook_failure(
+                _timed_out(
+                    self._timeout,
+                    self.entity,
+                    fn,
+                    reason,
+                    elapsed=time.monotonic() - started if narrowed else None,
+                )
+            )
+
+        if self._retry and not self._retry(reason):
+            raise self._hook_failure(
+                _failed_fast(time.monotonic() - started, self.entity, fn, reason)
+            )
+
+        if self._on_failed_attempt:
+            self._on_failed_attempt(reason)
+
+        return self._poll(attempts) if self._poll else 0.0
+
+    def _event(
+        self,
+        fn: Callable[[E], R],
+        *,
+        attempts: int,
+        duration: float,
+        succeeded: bool,
+        exceptions: Dict[str, int],
+        webdriver_calls: int,
+    ) -> _WaitEvent:
+        return _WaitEvent(
+            entity=str(self.entity),
+            name=Query._full_name_for(fn, self.entity) or str(fn),
+            attempts=attempts,
+            duration=duration,
+            succeeded=succeeded,
+            exceptions=dict(exceptions),
+            webdriver_calls=webdriver_calls,
+        )
+
     def until(self, fn: Callable[[E], R]) -> bool:
         try:
             Wait(
@@ -150,6 +574,11 @@ class Wait(Generic[E]):
                 self._timeout,
                 or_fail_with=identity,
                 _decorator=self._decorator,
+                _poll=self._poll,
+                _on_failed_attempt=self._on_failed_attempt,
+                _report=self._report,
+                _retry=self._retry,
+                _pause=self._pause,
             ).for_(fn)
             return True
         except TimeoutException:
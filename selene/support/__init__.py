@@ -1,3 +1,20 @@
 # TODO: consider renaming support to _support to emphasize its experimental nature
 
-from . import _logging, _extensions, _wait
+import typing
+
+from selene.common import _lazy
+
+if typing.TYPE_CHECKING:
+    from . import _logging, _extensions, _wait, _metrics
+
+# imported lazily on first access (see __getattr__),
+# because e.g. _logging imports Selenium's webdriver stack
+_LAZY = ('_logging', '_extensions', '_wait', '_metrics')
+
+
+def __getattr__(name: str):
+    return _lazy.submodule(__name__, name)
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
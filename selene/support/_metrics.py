@@ -0,0 +1,174 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Collecting metrics of Selene waits, i.e. of all commands, queries and assertions
+with waiting built in, in order to see where test time goes.
+
+To start collecting, set `config._wait_metrics_hook` to an aggregator:
+
+    >>> from selene import browser, support
+    >>>
+    >>> browser.config._wait_metrics_hook = support._metrics.wait_metrics
+
+To also count WebDriver commands made during each wait, wrap the driver:
+
+    >>> build_driver = browser.config.build_driver_strategy
+    >>> browser.config.build_driver_strategy = lambda config: (
+    >>>     support._metrics.counting_webdriver_calls(build_driver(config))
+    >>> )
+
+Or just use the pytest plugin from `selene.support._pytest_metrics`
+that does all of this for the shared browser and prints the report at the end.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import threading
+from typing_extensions import Dict, List, Tuple, NamedTuple, TypeVar
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selene.core.wait import _WaitEvent, _webdriver_calls
+
+D = TypeVar('D', bound=WebDriver)
+
+
+def counting_webdriver_calls(driver: D) -> D:
+    """Instruments the driver instance to count all WebDriver commands
+    executed by it, so they are reported in `_WaitEvent.webdriver_calls`
+    """
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def counted_execute(*args, **kwargs):
+        _webdriver_calls.set(_webdriver_calls.get() + 1)
+        return execute(*args, **kwargs)
+
+    driver.execute = counted_execute  # type: ignore[method-assign]
+    return driver
+
+
+class _LocatorFlakiness(NamedTuple):
+    entity: str
+    failed_attempts: int
+    waits: int
+
+
+class WaitMetrics:
+    """Thread-safe in-memory aggregator of wait events,
+    to be used as `config._wait_metrics_hook`
+
+    Events are aggregated as they arrive, and only `keep_slowest` of them
+    are kept to report the slowest waits, so the memory used
+    does not grow with the number of waits.
+    """
+
+    def __init__(self, keep_slowest: int = 100):
+        self._lock = threading.Lock()
+        self._keep_slowest = keep_slowest
+        self._reset()
+
+    def _reset(self) -> None:
+        self._waits = 0
+        self._failed = 0
+        self._duration = 0.0
+        self._webdriver_calls = 0
+        # min-heap by duration, with order of arrival to compare equal durations
+        self._slowest: List[Tuple[float, int, _WaitEvent]] = []
+        self._by_entity: Dict[str, Tuple[int, int]] = {}
+
+    def __call__(self, event: _WaitEvent) -> None:
+        with self._lock:
+            self._waits += 1
+            self._failed += 0 if event.succeeded else 1
+            self._duration += event.duration
+            self._webdriver_calls += event.webdriver_calls
+
+            slow = (event.duration, self._waits, event)
+            if len(self._slowest) < self._keep_slowest:
+                heapq.heappush(self._slowest, slow)
+            elif self._slowest and slow > self._slowest[0]:
+                heapq.heapreplace(self._slowest, slow)
+
+            failed_so_far, waits = self._by_entity.get(event.entity, (0, 0))
+            self._by_entity[event.entity] = (
+                failed_so_far + sum(event.exceptions.values()),
+                waits + 1,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def slowest(self, top: int = 10) -> List[_WaitEvent]:
+        with self._lock:
+            return [event for _, _, event in heapq.nlargest(top, self._slowest)]
+
+    def flakiest(self, top: int = 10) -> List[_LocatorFlakiness]:
+        """Entities (i.e. their locators) sorted by the number of failed attempts
+        made while waiting for them (only those with failed attempts)
+        """
+        with self._lock:
+            by_entity = list(self._by_entity.items())
+
+        return sorted(
+            (
+                _LocatorFlakiness(entity, failed, waits)
+                for entity, (failed, waits) in by_entity
+                if failed
+            ),
+            key=lambda flakiness: flakiness.failed_attempts,
+            reverse=True,
+        )[:top]
+
+    def report(self, top: int = 10) -> str:
+        with self._lock:
+            waits, failed = self._waits, self._failed
+            duration, webdriver_calls = self._duration, self._webdriver_calls
+        lines = [
+            f'waits: {waits}, '
+            f'failed: {failed}, '
+            f'total time: {duration:.3f}s, '
+            f'webdriver calls: {webdriver_calls}',
+            '',
+            f'top {top} slowest waits:',
+            *(
+                f'  {event.duration:.3f}s'
+                f' ({event.attempts} attempts'
+                f'{"" if event.succeeded else ", failed"})'
+                f' {event.entity}.{event.name}'
+                for event in self.slowest(top)
+            ),
+            '',
+            f'top {top} flakiest locators:',
+            *(
+                f'  {flakiness.failed_attempts} failed attempts'
+                f' in {flakiness.waits} waits: {flakiness.entity}'
+                for flakiness in self.flakiest(top)
+            ),
+        ]
+        return '\n'.join(lines)
+
+
+wait_metrics = WaitMetrics()
+"""The default aggregator, used by `selene.support._pytest_metrics` plugin"""
@@ -29,7 +29,7 @@ from selene.common._typing_functions import Command
 from selene.core.condition import Condition
 from selene.core.configuration import Config
 from selene.core._entity import _WaitingConfiguredEntity
-from selene.core.locator import Locator
+from selene.core.locator import Locator, _LazyCachedLocator
 from selene.core.wait import Wait
 
 from selenium.webdriver import ActionChains
@@ -118,7 +118,7 @@ class Element(_WaitingConfiguredEntity):
 
         return Element(
             Locator(
-                f'{self}.element({by})',
+                lambda: f'{self}.element({by})',
                 lambda: cast(AppiumElement, self.locate().find_element(*by)),
             ),
             self.config,
@@ -129,7 +129,7 @@ class Element(_WaitingConfiguredEntity):
 
         return AllElements(
             Locator(
-                f'{self}.all({by})',
+                lambda: f'{self}.all({by})',
                 lambda: cast(Sequence[AppiumElement], self.locate().find_elements(*by)),
             ),
             self.config,
@@ -314,16 +314,23 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
     @property
     def cached(self) -> AllElements:
-        mobelements = self.locate()
-        return AllElements(Locator(f'{self}.cached', lambda: mobelements), self.config)
+        return AllElements(
+            _LazyCachedLocator(
+                lambda: f'{self}.cached',
+                self.locate,
+                ttl=self.config._cached_entities_ttl,
+            ),
+            self.config,
+        )
 
     def __iter__(self):
-        i = 0
-        cached = self.cached
-        while i < len(cached()):
-            element = cached[i]
-            yield element
-            i += 1
+        # iterating over one "snapshot" of located mobelements
+        mobelements = self.locate()
+        cached = AllElements(
+            Locator(lambda: f'{self}.cached', lambda: mobelements), self.config
+        )
+        for index in range(len(mobelements)):
+            yield cached[index]
 
     def __len__(self):
         from selene.core import query
@@ -346,7 +353,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
             return mobelements[index]
 
-        return Element(Locator(f'{self}[{index}]', find), self.config)
+        return Element(Locator(lambda: f'{self}[{index}]', find), self.config)
 
     @property
     def first(self) -> Element:
@@ -404,7 +411,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
         return AllElements(
             Locator(
-                f'{self}[{start or ""}'
+                lambda: f'{self}[{start or ""}'
                 f':{stop or ""}'
                 f'{":" + str(step) if step else ""}]',
                 find,
@@ -439,7 +446,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
         return AllElements(
             Locator(
-                f'{self}.by({condition})',
+                lambda: f'{self}.by({condition})',
                 lambda: [
                     element.locate()
                     for element in self.cached
@@ -586,7 +593,9 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
                     f'\n\tAmong {self}'
                 )
 
-        return Element(Locator(f'{self}.element_by({condition})', find), self.config)
+        return Element(
+            Locator(lambda: f'{self}.element_by({condition})', find), self.config
+        )
 
     def element_by_its(
         self,
@@ -677,7 +686,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
         return AllElements(
             Locator(
-                f'{self}.collected({finder})',
+                lambda: f'{self}.collected({finder})',
                 # TODO: consider skipping None while flattening
                 lambda: cast(
                     Sequence[AppiumElement],
@@ -718,7 +727,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
         return AllElements(
             Locator(
-                f'{self}.all({by})',
+                lambda: f'{self}.all({by})',
                 lambda: cast(
                     Sequence[AppiumElement],
                     flatten(
@@ -762,7 +771,7 @@ class AllElements(_WaitingConfiguredEntity, Iterable[Element]):
 
         return AllElements(
             Locator(
-                f'{self}.all_first({by})',
+                lambda: f'{self}.all_first({by})',
                 lambda: [
                     cast(AppiumElement, mobelement.find_element(*by))
                     for mobelement in self.locate()
@@ -0,0 +1,74 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A pytest plugin to print metrics of Selene waits at the end of the session,
+i.e. top N slowest waits and flakiest locators of the shared browser.
+
+Is not registered automatically, use it like:
+
+```bash
+pytest -p selene.support._pytest_metrics --selene-metrics=10
+```
+
+or add to your conftest.py:
+
+```python
+pytest_plugins = ['selene.support._pytest_metrics']
+```
+"""
+
+from selene.support._metrics import wait_metrics, counting_webdriver_calls
+
+
+def pytest_addoption(parser):
+    parser.getgroup('selene').addoption(
+        '--selene-metrics',
+        action='store',
+        type=int,
+        default=None,
+        metavar='N',
+        help='collect metrics of Selene waits of the shared browser '
+        'and print top N slowest waits and flakiest locators at the end',
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('selene_metrics') is None:
+        return
+
+    from selene import browser
+
+    build_driver = browser.config.build_driver_strategy
+
+    browser.config._wait_metrics_hook = wait_metrics
+    browser.config.build_driver_strategy = lambda selene_config: (
+        counting_webdriver_calls(build_driver(selene_config))
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    top = config.getoption('selene_metrics')
+    if top is None:
+        return
+
+    terminalreporter.write_sep('=', 'Selene wait metrics')
+    for line in wait_metrics.report(top).splitlines():
+        terminalreporter.write_line(line)
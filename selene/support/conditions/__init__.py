@@ -0,0 +1,6 @@
+from selene.common import _lazy
+
+
+def __getattr__(name: str):
+    # be, have, not_ are imported on first access, same as in selene/__init__.py
+    return _lazy.submodule(__name__, name)
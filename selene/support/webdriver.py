@@ -25,6 +25,7 @@ from typing import Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from selene.common.helpers import on_error_return_false
+from selene.core import _artifacts
 
 
 # TODO: consider privatizing
@@ -33,8 +34,17 @@ class WebHelper:
     # what about this style for example: ExtendedWebdriver(driver).is_alive() ?
     # over: Help(driver).has_browser_still_alive() ?
 
-    def __init__(self, driver: WebDriver):
+    def __init__(
+        self,
+        driver: WebDriver,
+        *,
+        _save_artifacts_in_background: bool = False,
+        _compress_saved_page_sources: bool = False,
+    ):
         self._driver = driver
+        # see same options of Config
+        self._save_artifacts_in_background = _save_artifacts_in_background
+        self._compress_saved_page_sources = _compress_saved_page_sources
 
     # TODO: refactor to browser.get(query.is_alive)
     #       or browser.get(query.is_driver_alive) ?
@@ -51,6 +61,14 @@ class WebHelper:
 
         html = self._driver.page_source
 
+        if self._save_artifacts_in_background:
+            # only the capturing above happens on the calling thread
+            return _artifacts._writer.submit(
+                file,
+                html.encode('utf-8'),
+                compress=self._compress_saved_page_sources,
+            )
+
         try:
             with open(file, 'w', encoding="utf-8") as f:
                 f.write(html)
@@ -69,4 +87,7 @@ class WebHelper:
                 UserWarning,
             )
 
+        if self._save_artifacts_in_background:
+            return _artifacts._writer.submit(file, self._driver.get_screenshot_as_png())
+
         return file if self._driver.get_screenshot_as_file(file) else None
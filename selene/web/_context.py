@@ -22,12 +22,14 @@
 from __future__ import annotations
 
 import warnings
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, Literal
 
 from selenium.webdriver.remote.switch_to import SwitchTo
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from selene.core._actions import _Actions
+from selene.core._batch import _Batch
+from selene.core._chain import _Chain
 from selene.core.configuration import Config
 from selene.core._entity import _WaitingConfiguredEntity
 from selene.web._elements import Element, Collection
@@ -65,6 +67,13 @@ class Browser(_WaitingConfiguredEntity):
     def _actions(self) -> _Actions:
         return _Actions(self.config)
 
+    def _batch(self, *, by: Literal['js', 'actions'] = 'js') -> _Batch:
+        """Returns a context manager to queue element commands
+        and flush them all together on exit,
+        see [_Batch][selene.core._batch._Batch] for more details.
+        """
+        return _Batch(self, by=by)
+
     # --- Element builders --- #
 
     # TODO: consider @overload to have more specific signature variations
@@ -82,7 +91,16 @@ class Browser(_WaitingConfiguredEntity):
         # todo: do we need by_to_locator_strategy?
 
         return Element(
-            Locator(f'{self}.element({by})', lambda: self.driver.find_element(*by)),
+            Locator(
+                lambda: f'{self}.element({by})',
+                lambda: self.driver.find_element(*by),
+                _cache_scope=self.config._located_cache_scope(),
+                _chain=(
+                    _Chain.of(None, by)
+                    if self.config._compile_selector_chains
+                    else None
+                ),
+            ),
             self.config,
         )
 
@@ -95,7 +113,10 @@ class Browser(_WaitingConfiguredEntity):
         by = self.config._selector_or_by_to_by(css_or_xpath_or_by)
 
         return Collection(
-            Locator(f'{self}.all({by})', lambda: self.driver.find_elements(*by)),
+            Locator(
+                lambda: f'{self}.all({by})',
+                lambda: self.driver.find_elements(*by),
+            ),
             self.config,
         )
 
@@ -112,7 +133,9 @@ class Browser(_WaitingConfiguredEntity):
     def switch_to_next_tab(self) -> Browser:
         from selene.core import query
 
+        self.config._executor.reset_frame_path()
         self.driver.switch_to.window(query.next_tab(self))
+        self.config._executor.invalidate_located_cache()
 
         # TODO: should we use waiting version here (and in other similar cases)?
         # self.perform(Command(
@@ -124,10 +147,13 @@ class Browser(_WaitingConfiguredEntity):
     def switch_to_previous_tab(self) -> Browser:
         from selene.core import query
 
+        self.config._executor.reset_frame_path()
         self.driver.switch_to.window(query.previous_tab(self))
+        self.config._executor.invalidate_located_cache()
         return self
 
     def switch_to_tab(self, index_or_name: Union[int, str]) -> Browser:
+        self.config._executor.reset_frame_path()
         if isinstance(index_or_name, int):
             index = index_or_name
             from selene.core import query
@@ -135,6 +161,7 @@ class Browser(_WaitingConfiguredEntity):
             self.driver.switch_to.window(query.tab(index)(self))
         else:
             self.driver.switch_to.window(index_or_name)
+        self.config._executor.invalidate_located_cache()
 
         return self
 
@@ -232,7 +259,11 @@ class Browser(_WaitingConfiguredEntity):
         if file is None:
             file = self.config._generate_filename(suffix='.html')  # type: ignore
 
-        saved_file = WebHelper(self.driver).save_page_source(file)
+        saved_file = WebHelper(
+            self.driver,
+            _save_artifacts_in_background=self.config._save_artifacts_in_background,
+            _compress_saved_page_sources=self.config._compress_saved_page_sources,
+        ).save_page_source(file)
 
         self.config.last_page_source = saved_file  # type: ignore
 
@@ -33,11 +33,13 @@ from selene.common.fp import pipe
 from selene.common.helpers import flatten
 from selene.common._typing_functions import Command
 from selene.core.condition import Condition
-from selene.core.configuration import Config
+from selene.core.configuration import Config, _Frame, _frame_path
 from selene.core._elements_context import E
 from selene.core._entity import _LocatableEntity, _WaitingConfiguredEntity
-from selene.core.locator import Locator
+from selene.core.locator import Locator, _LazyCachedLocator
 from selene.core.wait import Wait
+from selene.core._snapshot import _filtered, _js_inner
+from selene.core import _search, _chain
 
 from selene.core.exceptions import TimeoutException, _SeleneError
 
@@ -90,25 +92,24 @@ class _ElementsContext(_LocatableEntity[_SearchContext], _WaitingConfiguredEntit
 
     @property
     def cached(self) -> _ElementsContext:
-        cache = None
-        error = None
-        try:
-            cache = self.locate()
-        except Exception as e:
-            error = e
-
-        def get_cache():
-            if cache:
-                return cache
-            raise error
-
-        return _ElementsContext(Locator(f'{self}.cached', get_cache), self.config)
+        return _ElementsContext(
+            _LazyCachedLocator(
+                lambda: f'{self}.cached',
+                self.locate,
+                ttl=self.config._cached_entities_ttl,
+            ),
+            self.config,
+        )
 
     def element(self, selector_or_by: Union[str, Tuple[str, str]], /) -> Element:
         by = self.config._selector_or_by_to_by(selector_or_by)
 
         return Element(
-            Locator(f'{self}.element({by})', lambda: self().find_element(*by)),
+            Locator(
+                lambda: f'{self}.element({by})',
+                lambda: self().find_element(*by),
+                _cache_scope=self.config._located_cache_scope(),
+            ),
             self.config,
         )
 
@@ -116,7 +117,7 @@ class _ElementsContext(_LocatableEntity[_SearchContext], _WaitingConfiguredEntit
         by = self.config._selector_or_by_to_by(selector_or_by)
 
         return Collection(
-            Locator(f'{self}.all({by})', lambda: self().find_elements(*by)),
+            Locator(lambda: f'{self}.all({by})', lambda: self().find_elements(*by)),
             self.config,
         )
 
@@ -179,12 +180,16 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         if self.config.log_outer_html_on_failure:
             # TODO: remove this part completely from core.entity logic
             #       move it to support.shared.config
-            return super().wait.or_fail_with(
-                pipe(
-                    Element._log_webelement_outer_html_for(self),
-                    super().wait.hook_failure,
+            def build() -> Wait[Element]:
+                wait = self.config._wait(self)
+                return wait.or_fail_with(
+                    pipe(
+                        Element._log_webelement_outer_html_for(self),
+                        wait.hook_failure,
+                    )
                 )
-            )
+
+            return self._memoizing_wait(build)
         else:
             return super().wait
 
@@ -192,38 +197,60 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
 
     @property
     def cached(self) -> Element:
-        # TODO: do we need caching ? with lazy save of webelement to cache
-
-        cache = None
-        error = None
-        try:
-            cache = self.locate()
-        except Exception as e:
-            error = e
-
-        def get_webelement():
-            if cache:
-                return cache
-            raise error
-
-        return Element(Locator(f'{self}.cached', get_webelement), self.config)
+        return Element(
+            _LazyCachedLocator(
+                lambda: f'{self}.cached',
+                self.locate,
+                ttl=self.config._cached_entities_ttl,
+            ),
+            self.config,
+        )
 
     def element(self, css_or_xpath_or_by: Union[str, Tuple[str, str]]) -> Element:
         by = self.config._selector_or_by_to_by(css_or_xpath_or_by)
+        chain = self.__chained(by)
+
+        def locate() -> WebElement:
+            if chain:
+                found = _chain._find(self.config, chain)
+                if found is not None:
+                    return found
+            return self().find_element(*by)
 
         return Element(
-            Locator(f'{self}.element({by})', lambda: self().find_element(*by)),
+            Locator(
+                lambda: f'{self}.element({by})',
+                locate,
+                _cache_scope=self.config._located_cache_scope(),
+                _chain=chain,
+            ),
             self.config,
         )
 
     def all(self, css_or_xpath_or_by: Union[str, Tuple[str, str]]) -> Collection:
         by = self.config._selector_or_by_to_by(css_or_xpath_or_by)
+        chain = self.__chained(by)
+
+        def locate() -> typing.Sequence[WebElement]:
+            if chain:
+                found = _chain._find_all(self.config, chain)
+                if found is not None:
+                    return found
+            return self().find_elements(*by)
 
         return Collection(
-            Locator(f'{self}.all({by})', lambda: self().find_elements(*by)),
+            Locator(lambda: f'{self}.all({by})', locate),
             self.config,
         )
 
+    def __chained(self, by: Tuple[str, str]) -> Optional[_chain._Chain]:
+        # continues the chain of self's locator if any,
+        # otherwise starts a new one from self as a root
+        if not self.config._compile_selector_chains:
+            return None
+        parent = getattr(self._locator, '_chain', None)
+        return parent.then(by) if parent else _chain._Chain.of(self.locate, by)
+
     def s(self, css_or_xpath_or_by: Union[str, Tuple[str, str]]) -> Element:
         """A JQuery-like alias (~ $) to
         [Element.element(selector_or_by)][selene.web._elements.Element.element].
@@ -239,7 +266,7 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
     @property
     def shadow_root(self) -> _ElementsContext:
         return _ElementsContext(
-            Locator(f'{self}.shadow root', lambda: self.locate().shadow_root),
+            Locator(lambda: f'{self}.shadow root', lambda: self.locate().shadow_root),
             self.config,
         )
 
@@ -261,6 +288,17 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
     # --- Commands --- #
 
     def set_value(self, value: Union[str, int]) -> Element:
+        self.wait.for_(self._set_value_command(value))
+
+        # TODO: consider returning self.cached, since after first successful call,
+        #       all next ones should normally pass
+        #       no waiting will be needed normally
+        #       if yes - then we should pass fn commands to wait.for_ so the latter will return webelement to cache
+        #       also it will make sense to make this behaviour configurable...
+        return self
+
+    # the commands are built separately to be reused by selene.aio.Element
+    def _set_value_command(self, value: Union[str, int]) -> Command[Element]:
         # TODO: should we move all commands like following or queries like in conditions - to separate py modules?
         # TODO: should we make them webelement based (Callable[[WebElement], None]) instead of element based?
         def fn(element: Element):
@@ -288,17 +326,56 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         #       Command(f'actual_webelement.clear().send_keys({value})', fn)
         #   )
         #
-        self.wait.for_(
+        return (
             command.js.set_value(value)
             if self.config.set_value_by_js
             else Command(f'set value: {value}', fn)
         )
 
-        # TODO: consider returning self.cached, since after first successful call,
-        #       all next ones should normally pass
-        #       no waiting will be needed normally
-        #       if yes - then we should pass fn commands to wait.for_ so the latter will return webelement to cache
-        #       also it will make sense to make this behaviour configurable...
+    def fill(self, values: typing.Mapping[str, typing.Any]) -> Element:
+        """Sets values of all fields of this form-like element
+        by one `execute_script` call, where `values` maps field name, id
+        or css selector (relative to this element) to the value to set.
+
+        Text values are truncated by `maxlength` same way
+        as `command.js.set_value` does (i.e. as on `element.set_value(value)`
+        with turned on `config.set_value_by_js`),
+        checkboxes are checked by truthy values, radio groups are checked
+        by the value of the radio to check, multiple selects accept lists
+        of values to select. The `input` and `change` events are dispatched
+        for each changed field.
+
+        Waits till all fields are found, and, if
+        [config.wait_for_no_overlap_found_by_js][selene.core.configuration.Config.wait_for_no_overlap_found_by_js]
+        is set to True, till this element is not covered by any other element.
+
+        Examples:
+            ```python
+            from selene import browser, query
+
+            browser.element('#registration').fill(
+                {'first-name': 'Yakiv', 'gender': 'male', 'agree': True}
+            )
+            assert browser.element('#registration').get(query.form_values) == {...}
+            ```
+        """
+        from selene.core._form import _FILL_SCRIPT
+
+        def fn(element: Element):
+            webelement = (
+                element._actual_not_overlapped_webelement
+                if self.config.wait_for_no_overlap_found_by_js
+                else element()
+            )
+            missing = self.config.driver.execute_script(
+                _FILL_SCRIPT, webelement, dict(values)
+            )
+            if missing:
+                raise _SeleneError(f'fields not found: {", ".join(missing)}')
+
+        # only names of fields are logged, their values may be secret
+        self.wait.for_(Command(f'fill: {", ".join(values)}', fn))
+
         return self
 
     def set(self, value: Union[str, int]) -> Element:
@@ -387,7 +464,11 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         [config.wait_for_no_overlap_found_by_js][selene.core.configuration.Config.wait_for_no_overlap_found_by_js]
         is set to True.
         """
+        self.wait.for_(self._type_command(text))
 
+        return self
+
+    def _type_command(self, text: Union[str, int]) -> Command[Element]:
         def fn(element: Element):
             if self.config.wait_for_no_overlap_found_by_js:
                 webelement = element._actual_not_overlapped_webelement
@@ -397,14 +478,12 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
 
         from selene.core import command
 
-        self.wait.for_(
+        return (
             command.js.type(text)
             if self.config.type_by_js
             else Command(f'type: {text}', fn)
         )
 
-        return self
-
     def send_keys(self, *value) -> Element:
         """To be used for more low level operations like «uploading files», etc.
         To simulate normal input of keys by user when typing - consider using
@@ -412,9 +491,12 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         that has additional customizaton to wait for the element
         to be not overlapped by other elements.
         """
-        self.wait.command('send keys', lambda element: element().send_keys(*value))
+        self.wait.for_(self._send_keys_command(*value))
         return self
 
+    def _send_keys_command(self, *value) -> Command[Element]:
+        return Command('send keys', lambda element: element().send_keys(*value))
+
     def press(self, *keys) -> Element:
         """Simulates pressing keys on the element.
         A human readable alternative to pure Selenium's send_keys method.
@@ -422,7 +504,11 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         Can be customized via
         [config.wait_for_no_overlap_found_by_js][selene.core.configuration.Config.wait_for_no_overlap_found_by_js].
         """
+        self.wait.for_(self._press_command(*keys))
 
+        return self
+
+    def _press_command(self, *keys) -> Command[Element]:
         def fn(element: Element):
             webelement = (
                 element._actual_not_overlapped_webelement
@@ -431,9 +517,7 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
             )
             webelement.send_keys(*keys)
 
-        self.wait.command(f'press keys: {keys}', fn)
-
-        return self
+        return Command(f'press keys: {keys}', fn)
 
     def press_enter(self) -> Element:
         return self.press(Keys.ENTER)
@@ -450,7 +534,11 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         Can be customized via
         [config.wait_for_no_overlap_found_by_js][selene.core.configuration.Config.wait_for_no_overlap_found_by_js]
         """
+        self.wait.for_(self._clear_command())
 
+        return self
+
+    def _clear_command(self) -> Command[Element]:
         def fn(element: Element):
             webelement = (
                 element._actual_not_overlapped_webelement
@@ -459,9 +547,7 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
             )
             webelement.clear()
 
-        self.wait.command('clear', fn)
-
-        return self
+        return Command('clear', fn)
 
     def submit(self) -> Element:
         """Submits a form-like element.
@@ -501,7 +587,11 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
         something like:
         `browser.element('#save').should(be.not_overlapped).with_(click_by_js=True).click()`
         """
+        self.wait.for_(self._click_command(xoffset=xoffset, yoffset=yoffset))
 
+        return self
+
+    def _click_command(self, *, xoffset=0, yoffset=0) -> Command[Element]:
         def raw_click(element: Element):
             element.locate().click()
 
@@ -518,7 +608,7 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
 
         from selene.core import command
 
-        self.wait.for_(
+        return (
             command.js.click(xoffset=xoffset, yoffset=yoffset)
             if self.config.click_by_js
             else (
@@ -531,8 +621,6 @@ class Element(_LocatableEntity[WebElement], _WaitingConfiguredEntity):
             )
         )
 
-        return self
-
     def double_click(self) -> Element:
         """Double clicks on the element.
 
@@ -899,16 +987,25 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
 
     @property
     def cached(self) -> Collection:
-        webelements = self.locate()
-        return Collection(Locator(f'{self}.cached', lambda: webelements), self.config)
+        return Collection(
+            _LazyCachedLocator(
+                lambda: f'{self}.cached',
+                self.locate,
+                ttl=self.config._cached_entities_ttl,
+            ),
+            self.config,
+        )
 
     def __iter__(self):
-        i = 0
-        cached = self.cached
-        while i < len(cached()):
-            element = cached[i]
-            yield element
-            i += 1
+        # iterating over one "snapshot" of located webelements
+        # (the ttl of cached entities is not applied here,
+        # to keep the snapshot consistent during the whole iteration)
+        webelements = self.locate()
+        cached = Collection(
+            Locator(lambda: f'{self}.cached', lambda: webelements), self.config
+        )
+        for index in range(len(webelements)):
+            yield cached[index]
 
     def __len__(self):
         from selene.core import query
@@ -931,7 +1028,7 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
 
             return webelements[index]
 
-        return Element(Locator(f'{self}[{index}]', find), self.config)
+        return Element(Locator(lambda: f'{self}[{index}]', find), self.config)
 
     @property
     def first(self) -> Element:
@@ -989,7 +1086,7 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
 
         return Collection(
             Locator(
-                f'{self}[{start or ""}'
+                lambda: f'{self}[{start or ""}'
                 f':{stop or ""}'
                 f'{":" + str(step) if step else ""}]',
                 find,
@@ -1022,13 +1119,16 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
             else Condition(str(condition), condition)  # TODO: check here for fn name
         )
 
+        def find() -> typing.Sequence[WebElement]:
+            # all elements are filtered by one script call if possible
+            filtered = _filtered(self, condition._js_for(self.first))
+            if filtered is not None:
+                return filtered
+
+            return [element() for element in self.cached if element.matching(condition)]
+
         return Collection(
-            Locator(
-                f'{self}.filtered_by({condition})',
-                lambda: [
-                    element() for element in self.cached if element.matching(condition)
-                ],
-            ),
+            Locator(lambda: f'{self}.filtered_by({condition})', find),
             self.config,
         )
 
@@ -1109,7 +1209,22 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
             else:
                 return parent.element(selector)
 
-        return self.by(lambda it: condition(find_in(it)))
+        inner_condition = lambda it: condition(find_in(it))  # noqa
+
+        return self.by(
+            Condition(
+                str(inner_condition),
+                inner_condition,
+                _js=(
+                    _js_inner(
+                        self.config._selector_or_by_to_by(selector),
+                        condition._js_for(self.first),
+                    )
+                    if not callable(selector) and isinstance(condition, Condition)
+                    else None
+                ),
+            )
+        )
 
     def element_by(
         self, condition: Union[Condition[Element], Callable[[Element], None]]
@@ -1152,11 +1267,17 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
         )
 
         def find() -> WebElement:
+            # the first matched element is found by one script call if possible
+            filtered = _filtered(self, condition._js_for(self.first), first=True)
+            if filtered:
+                return filtered[0]
+
             cached = self.cached
 
-            for element in cached:
-                if element.matching(condition):
-                    return element()
+            if filtered is None:
+                for element in cached:
+                    if element.matching(condition):
+                        return element()
 
             from selene.core import query
 
@@ -1178,7 +1299,9 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
                     f'\n\tAmong {self}'
                 )
 
-        return Element(Locator(f'{self}.element_by({condition})', find), self.config)
+        return Element(
+            Locator(lambda: f'{self}.element_by({condition})', find), self.config
+        )
 
     def element_by_its(
         self,
@@ -1269,7 +1392,7 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
 
         return Collection(
             Locator(
-                f'{self}.collected({finder})',
+                lambda: f'{self}.collected({finder})',
                 # TODO: consider skipping None while flattening
                 lambda: typing.cast(
                     typing.Sequence[WebElement],
@@ -1308,14 +1431,18 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
         # TODO: consider implement it through calling self.collected
         #       because actually the impl is self.collected(lambda element: element.all(selector))
 
+        def locate() -> typing.Sequence[WebElement]:
+            webelements = self()
+            found = _search._all_in_each(self.config, webelements, by)
+            if found is not None:
+                return found
+            return typing.cast(
+                typing.Sequence[WebElement],
+                flatten([webelement.find_elements(*by) for webelement in webelements]),
+            )
+
         return Collection(
-            Locator(
-                f'{self}.all({by})',
-                lambda: typing.cast(
-                    typing.Sequence[WebElement],
-                    flatten([webelement.find_elements(*by) for webelement in self()]),
-                ),
-            ),
+            Locator(lambda: f'{self}.all({by})', locate),
             self.config,
         )
 
@@ -1350,11 +1477,15 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
         # TODO: consider implement it through calling self.collected
         #       because actually the impl is self.collected(lambda element: element.element(selector))
 
+        def locate() -> typing.Sequence[WebElement]:
+            webelements = self()
+            found = _search._first_in_each(self.config, webelements, by)
+            if found is not None:
+                return found
+            return [webelement.find_element(*by) for webelement in webelements]
+
         return Collection(
-            Locator(
-                f'{self}.all_first({by})',
-                lambda: [webelement.find_element(*by) for webelement in self()],
-            ),
+            Locator(lambda: f'{self}.all_first({by})', locate),
             self.config,
         )
 
@@ -1363,12 +1494,16 @@ class Collection(_WaitingConfiguredEntity, Iterable[Element]):
     @property
     def shadow_roots(self) -> Collection:
 
+        def locate() -> typing.Sequence[WebElement]:
+            webelements = self.locate()
+            found = _search._shadow_roots_of_each(self.config, webelements)
+            if found is not None:
+                return found
+            return [webelement.shadow_root for webelement in webelements]
+
         # TODO: should not we return Collection of _SearchContexts instead of Collection of WebElements?
         return Collection(
-            Locator(
-                f'{self}.shadow roots',
-                lambda: [webelement.shadow_root for webelement in self.locate()],
-            ),
+            Locator(lambda: f'{self}.shadow roots', locate),
             self.config,
         )
 
@@ -1654,33 +1789,46 @@ class _FrameContext:
     ```
     """
 
+    def __switch_into(self):
+        self._container.wait.with_(
+            # resetting wait decorator to default
+            # in order to avoid automatic exit applied to each command
+            # including switching to the frame
+            # that (automatic exit) was added after self.element
+            # (this fixes breaking exiting from the frame in nested frame context)
+            decorator=None,
+        ).for_(
+            Command(
+                'switch to frame',
+                lambda entity: entity.config.driver.switch_to.frame(entity.locate()),
+            )
+        )
+
     def __enter__(self):
         if not self.__entered:
-            self._container.wait.with_(
-                # resetting wait decorator to default
-                # in order to avoid automatic exit applied to each command
-                # including switching to the frame
-                # that (automatic exit) was added after self.element
-                # (this fixes breaking exiting from the frame in nested frame context)
-                decorator=None,
-            ).for_(
-                Command(
-                    'switch to frame',
-                    lambda entity: entity.config.driver.switch_to.frame(
-                        entity.locate()
-                    ),
+            config = self._container.config
+            if config._track_frame_path:
+                # actual switching (if any) is postponed till next driver access
+                _frame_path.enter(
+                    config, _Frame(str(self._container), self.__switch_into)
                 )
-            )
+            else:
+                self.__switch_into()
+            config._executor.invalidate_located_cache()
         self.__entered = True
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.__entered:
-            driver = self._container.config.driver
-
-            # we intentionally use parent_frame() over default_content()
-            # to make it work for nested frames
-            # (in case of "root frames" parent_frame() should work as default_content())
-            driver.switch_to.parent_frame()
+            config = self._container.config
+            if config._track_frame_path:
+                _frame_path.exit(config)
+            else:
+                # we intentionally use parent_frame() over default_content()
+                # to make it work for nested frames
+                # (in case of "root frames" parent_frame() should work
+                # as default_content())
+                config.driver.switch_to.parent_frame()
+            config._executor.invalidate_located_cache()
             self.__entered = False
 
     @property
@@ -1750,7 +1898,7 @@ class _FrameContext:
 
         return Element(
             Locator(
-                f'{self._container}: element({by})',
+                lambda: f'{self._container}: element({by})',
                 # f'{self._container} {{ element({by}) }}',  # TODO: maybe this?
                 lambda: self._container.config.driver.find_element(*by),
             ),
@@ -1777,7 +1925,7 @@ class _FrameContext:
 
         return Collection(
             Locator(
-                f'{self._container}: all({by})',
+                lambda: f'{self._container}: all({by})',
                 lambda: self._container.config.driver.find_elements(*by),
             ),
             self._container.config.with_(_wait_decorator=self.__as_wait_decorator),
@@ -17,6 +17,7 @@ from typing_extensions import (
     cast,
 )
 import typing_extensions as typing
+from selene.common._typing_functions import Command
 from selene.core.condition import Condition
 from selene.core.configuration import Config
 from selene.core._entity import Assertable, _WaitingConfiguredEntity
@@ -123,16 +124,23 @@ class Element(_WaitingConfiguredEntity):
     @property
     def frame_context(self) -> _FrameContext: ...
     def set_value(self, value: Union[str, int]) -> Element: ...
+    def _set_value_command(self, value: Union[str, int]) -> Command[Element]: ...
+    def fill(self, values: typing.Mapping[str, Any]) -> Element: ...
     def set(self, value: Union[str, int]) -> Element: ...
     def type(self, text: Union[str, int]) -> Element: ...
+    def _type_command(self, text: Union[str, int]) -> Command[Element]: ...
     def send_keys(self, *value) -> Element: ...
+    def _send_keys_command(self, *value) -> Command[Element]: ...
     def press(self, *keys) -> Element: ...
+    def _press_command(self, *keys) -> Command[Element]: ...
     def press_enter(self) -> Element: ...
     def press_escape(self) -> Element: ...
     def press_tab(self) -> Element: ...
     def clear(self) -> Element: ...
+    def _clear_command(self) -> Command[Element]: ...
     def submit(self) -> Element: ...
     def click(self, *, xoffset=0, yoffset=0) -> Element: ...
+    def _click_command(self, *, xoffset=0, yoffset=0) -> Command[Element]: ...
     def double_click(self) -> Element: ...
     def context_click(self) -> Element: ...
     def execute_script(self, script_on_self: str, *arguments): ...
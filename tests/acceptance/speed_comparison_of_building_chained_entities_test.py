@@ -0,0 +1,122 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import Browser, Config
+from selene.core.locator import Locator
+from selene.web import Element
+from tests.helpers import repeated_time_spent
+
+pytestmark = [pytest.mark.speed]
+
+CHAINS = 100
+DEPTH = 100  # i.e. 10k chained entities in total
+BENCHMARK_REPEATS = 9
+BENCHMARK_WARMUPS = 2
+
+browser = Browser(Config())
+
+
+def build_chains_with_lazy_descriptions():
+    for _ in range(CHAINS):
+        element = browser.element('#root')
+        for _ in range(DEPTH):
+            element = element.element('.child')
+
+
+def build_chains_with_eager_descriptions():
+    # imitates the previous behavior of rendering description on each build
+    for _ in range(CHAINS):
+        element = browser.element('#root')
+        for _ in range(DEPTH):
+            parent = element
+            by = browser.config._selector_or_by_to_by('.child')
+            element = Element(
+                Locator(
+                    f'{parent}.element({by})',
+                    lambda parent=parent: parent().find_element(*by),
+                ),
+                browser.config,
+            )
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    """Counts descriptions rendered by str() of any locator or browser"""
+    renders = []
+
+    def counting(original):
+        def __str__(self):
+            renders.append(self)
+            return original(self)
+
+        return __str__
+
+    monkeypatch.setattr(Locator, '__str__', counting(Locator.__str__))
+    monkeypatch.setattr(Browser, '__str__', counting(Browser.__str__))
+    return renders
+
+
+def test_building_10k_chained_entities_renders_no_descriptions(rendered):
+    lazy_time, lazy_samples = repeated_time_spent(
+        build_chains_with_lazy_descriptions,
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    lazy_renders = len(rendered)
+    eager_time, eager_samples = repeated_time_spent(
+        build_chains_with_eager_descriptions,
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    eager_renders = len(rendered) - lazy_renders
+    print(
+        f"lazy: {lazy_time * 1000:.3f}ms vs eager: {eager_time * 1000:.3f}ms; "
+        f"ratio={lazy_time / eager_time}; lazy={lazy_samples}; eager={eager_samples}"
+    )
+
+    # the timing depends too much on the machine load to be asserted,
+    # while the number of rendered descriptions is what makes the difference
+    assert lazy_renders == 0
+    runs = BENCHMARK_REPEATS + BENCHMARK_WARMUPS
+    # i.e. each parent in chain, plus the browser at its root
+    assert eager_renders == runs * CHAINS * (DEPTH + 1)
+
+
+def test_building_chained_entities_of_all_kinds_renders_no_descriptions(rendered):
+    browser.element('#root').cached.element('.child').all('.item').first.element(
+        'a'
+    ).cached
+    browser.all('.item').cached[1:].all('.inner').by(lambda element: True).element_by(
+        lambda element: True
+    ).all('span')
+
+    assert rendered == []
+
+
+def test_lazy_description_is_rendered_on_demand():
+    element = browser.element('#root').element('.child')
+
+    assert str(element) == (
+        "browser.element(('css selector', '#root'))"
+        ".element(('css selector', '.child'))"
+    )
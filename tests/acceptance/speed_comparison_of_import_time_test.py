@@ -0,0 +1,96 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measures the startup cost of `import selene` by `python -X importtime`,
+each time in a fresh interpreter, so nothing is cached in `sys.modules`,
+comparing it to the cost of importing all the things selene is built on,
+as it happened on `import selene` before top-level names became lazy.
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = [pytest.mark.speed]
+
+BENCHMARK_REPEATS = 9
+ROOT = Path(__file__).parents[2]
+
+
+def import_time_of(code: str) -> float:
+    """Returns microseconds spent on all imports made by `code`
+    (i.e. the sum of cumulative times of top-level imports
+    reported by `-X importtime` after the interpreter startup)
+    """
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    lines = [
+        line.split('|')
+        for line in stderr.splitlines()
+        if line.startswith('import time:') and '|' in line
+    ]
+    started = [name.strip() for _, _, name in lines].index('site') + 1
+    return sum(
+        int(cumulative)
+        for _, cumulative, name in lines[started:]
+        if not name.startswith('  ')  # i.e. top-level import
+    )
+
+
+def median_import_time_of(code: str) -> float:
+    return statistics.median(import_time_of(code) for _ in range(BENCHMARK_REPEATS))
+
+
+def test_import_selene_does_not_import_selenium_webdriver():
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, selene; print("selenium.webdriver" in sys.modules)',
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == 'False'
+
+
+def test_import_selene_is_faster_than_importing_everything_it_is_built_on():
+    lazy_time = median_import_time_of('import selene')
+    eager_time = median_import_time_of(
+        'import selene, selene.support._logging; selene.browser, selene.have'
+    )
+    print(
+        f'import selene: {lazy_time / 1000:.1f}ms; '
+        f'with all it is built on: {eager_time / 1000:.1f}ms'
+    )
+
+    assert lazy_time * 10 < eager_time
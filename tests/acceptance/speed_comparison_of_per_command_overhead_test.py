@@ -0,0 +1,80 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measures pure per-command overhead of Selene over raw Selenium,
+by running commands against an in-memory fake driver,
+so the time of WebDriver calls themselves does not hide the overhead.
+"""
+
+import pytest
+
+from tests.helpers import repeated_time_spent
+from tests.helpers.fakes import FakeDriver, FakeWebElement, browser_with
+
+pytestmark = [pytest.mark.speed]
+
+COMMANDS = 2_000
+BENCHMARK_REPEATS = 9
+BENCHMARK_WARMUPS = 2
+
+
+driver = FakeDriver()
+driver.elements['#button'] = FakeWebElement('#button', driver)
+
+
+def click_with_raw_selenium():
+    for _ in range(COMMANDS):
+        driver.find_element('css selector', '#button').click()
+
+
+def clicker_with_selene(*, memoize_waits):
+    button = browser_with(driver, _memoize_waits=memoize_waits).element('#button')
+
+    def click():
+        for _ in range(COMMANDS):
+            button.click()
+
+    return click
+
+
+def test_memoized_waits_reduce_per_command_overhead_of_selene():
+    memoized_time, memoized_samples = repeated_time_spent(
+        clicker_with_selene(memoize_waits=True),
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    rebuilt_time, rebuilt_samples = repeated_time_spent(
+        clicker_with_selene(memoize_waits=False),
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    raw_time, raw_samples = repeated_time_spent(
+        click_with_raw_selenium,
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    print(
+        f"per command overhead over raw selenium: "
+        f"memoized={(memoized_time - raw_time) / COMMANDS * 1e6:.2f}µs, "
+        f"rebuilt={(rebuilt_time - raw_time) / COMMANDS * 1e6:.2f}µs; "
+        f"memoized={memoized_samples}; rebuilt={rebuilt_samples}; raw={raw_samples}"
+    )
+    assert memoized_time < rebuilt_time
@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene.core import match
+from tests.helpers import repeated_time_spent
+from tests.helpers.fakes import FakeCollection, FakeWebElement
+
+pytestmark = [pytest.mark.speed]
+
+ELEMENTS_NUMBER = 1000
+ATTEMPTS = 20
+BENCHMARK_REPEATS = 9
+BENCHMARK_WARMUPS = 2
+
+
+TEXTS = [f'item {number}' for number in range(ELEMENTS_NUMBER)]
+EXPECTED = [
+    text if number % 10 else {...}  # every 10th item matched by "exactly one" glob
+    for number, text in enumerate(TEXTS)
+]
+# imitates a located collection without a browser,
+# so only CPU cost of matching is measured
+collection = FakeCollection([FakeWebElement(text=text) for text in TEXTS])
+
+
+def match_attempts_with_pattern_built_on_each_attempt():
+    # imitates the previous behavior of building the expected pattern per attempt
+    for _ in range(ATTEMPTS):
+        match._exact_texts_like(*EXPECTED)(collection)
+
+
+def match_attempts_with_pattern_compiled_once():
+    condition = match._exact_texts_like(*EXPECTED)
+    for _ in range(ATTEMPTS):
+        condition(collection)
+
+
+def test_exact_texts_like_attempts_on_1k_elements_are_faster_with_compiled_pattern():
+    cached_time, cached_samples = repeated_time_spent(
+        match_attempts_with_pattern_compiled_once,
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    uncached_time, uncached_samples = repeated_time_spent(
+        match_attempts_with_pattern_built_on_each_attempt,
+        repeats=BENCHMARK_REPEATS,
+        warmups=BENCHMARK_WARMUPS,
+    )
+    ratio = cached_time / uncached_time
+    print(
+        f"per attempt: {cached_time / ATTEMPTS * 1000:.3f}ms "
+        f"vs {uncached_time / ATTEMPTS * 1000:.3f}ms; ratio={ratio}; "
+        f"cached={cached_samples}; uncached={uncached_samples}"
+    )
+    assert cached_time < uncached_time
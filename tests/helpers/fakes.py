@@ -0,0 +1,227 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Fakes of WebDriver and its elements to unit-test Selene without a browser.
+
+The fake driver logs all commands it and its elements were called with
+into `driver.log`, like `['find #form', 'find .row in #form', 'click .row']`,
+and all executed scripts with their arguments into `driver.scripts`.
+Subclass them in a test to fake more specific behavior,
+and build a browser on them by `browser_with(driver, **config)`.
+"""
+
+from __future__ import annotations
+
+from selenium.common import NoSuchElementException
+
+from selene import Browser, Config
+
+
+class FakeWebElement:
+    """Is named by the selector it was found by, and by default has it as text.
+
+    Finds a new element for any selector inside, unless `children` are given,
+    then finds them (or nothing if empty).
+    """
+
+    def __init__(
+        self,
+        name='',
+        driver=None,
+        *,
+        text=None,
+        displayed=True,
+        enabled=True,
+        attributes=None,
+        children=None,
+    ):
+        self.name = name
+        self.driver = driver
+        self._text = text
+        self.displayed = displayed
+        self.enabled = enabled
+        self.attributes = dict(attributes or {})
+        self.children = None if children is None else list(children)
+        self.calls = []
+
+    def __repr__(self):
+        return f'FakeWebElement({self.name!r})'
+
+    def _log(self, entry):
+        if self.driver is not None:
+            self.driver.log.append(entry)
+
+    @property
+    def text(self):
+        return self.name if self._text is None else self._text
+
+    def is_displayed(self):
+        self.calls.append('is_displayed')
+        return self.displayed
+
+    def is_enabled(self):
+        self.calls.append('is_enabled')
+        return self.enabled
+
+    def get_attribute(self, name):
+        self.calls.append(f'get_attribute({name})')
+        return self.attributes.get(name, '')
+
+    def click(self):
+        self.calls.append('click')
+        self._log(f'click {self.name}')
+
+    def _element(self, name):
+        if self.driver is None:
+            return FakeWebElement(name)
+        return self.driver.element(name)
+
+    def find_element(self, by, value):
+        self.calls.append(f'find_element({value})')
+        self._log(f'find {value} in {self.name}')
+        if self.children is None:
+            return self._element(value)
+        if not self.children:
+            raise NoSuchElementException(f'no {value} inside {self.name}')
+        return self.children[0]
+
+    def find_elements(self, by, value):
+        self.calls.append(f'find_elements({value})')
+        self._log(f'find all {value} in {self.name}')
+        if self.children is None:
+            return [self._element(value)]
+        return self.children
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+    def frame(self, webelement):
+        self.driver.log.append(f'frame {webelement.name}')
+
+    def parent_frame(self):
+        self.driver.log.append('parent')
+
+    def default_content(self):
+        self.driver.log.append('default')
+
+
+class FakeDriver:
+    """Finds the given `elements` (or lists of them) by their selectors,
+    or new ones named by them (`size` ones for each selector on finding all),
+    and returns `script_result` on executing any script.
+    Has the given window `handles`, the first of them is the current one.
+    """
+
+    def __init__(
+        self,
+        elements=None,
+        *,
+        size=1,
+        script_result=None,
+        handles=('main',),
+        page_source='<html></html>',
+    ):
+        self.elements = dict(elements or {})
+        self.size = size
+        self.script_result = script_result
+        self.log = []
+        self.scripts = []
+        self.handles = list(handles)
+        self.current = self.handles[0]
+        self.switch_to = FakeSwitchTo(self)
+        self.capabilities = {}
+        self.page_source = page_source
+
+    @property
+    def window_handles(self):
+        return list(self.handles)
+
+    def element(self, name):
+        """Builds a new element found by `name` selector by the driver
+        or by its elements, override it to fake other elements
+        """
+        return FakeWebElement(name, self)
+
+    def find_element(self, by, value):
+        self.log.append(f'find {value}')
+        found = self.elements.get(value)
+        return self.element(value) if found is None else found
+
+    def find_elements(self, by, value):
+        self.log.append(f'find all {value}')
+        found = self.elements.get(value)
+        if found is None:
+            return [self.element(f'{value}[{index}]') for index in range(self.size)]
+        return found if isinstance(found, list) else [found]
+
+    def execute_script(self, script, *arguments):
+        self.scripts.append((script, *arguments))
+        return self.script_result
+
+    def get(self, url):
+        self.log.append(f'get {url}')
+
+    def delete_all_cookies(self):
+        self.log.append(f'delete cookies in {self.current}')
+
+    def close(self):
+        self.log.append(f'close {self.current}')
+        self.handles.remove(self.current)
+
+    def quit(self):
+        self.log.append('quit')
+
+    def get_screenshot_as_png(self):
+        return b'png'
+
+
+class FakeCollection:
+    """Is enough for conditions and queries that just locate the collection"""
+
+    def __init__(self, webelements, **config_options):
+        self.config = Config(**{'hold_driver_at_exit': True, **config_options})
+        self.webelements = webelements
+
+    def locate(self):
+        return self.webelements
+
+
+def browser_with(driver=None, **config):
+    """Builds a browser on the fake `driver` (a new one by default)
+    and other `config` options,
+    that neither quits the driver at exit nor saves artifacts on failures
+    """
+    return Browser(
+        Config(
+            **{
+                'driver': FakeDriver() if driver is None else driver,
+                'hold_driver_at_exit': True,
+                'save_screenshot_on_failure': False,
+                'save_page_source_on_failure': False,
+                **config,
+            }
+        )
+    )
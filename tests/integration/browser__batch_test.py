@@ -0,0 +1,77 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import have
+from tests.integration.helpers.givenpage import GivenPage
+
+FORM = '''
+<input id="first" value="old">
+<input id="last" maxlength="4">
+<input id="agree" type="checkbox">
+'''
+
+
+def test_batch_sets_values_and_clicks_by_one_script(session_browser):
+    browser = session_browser.with_(timeout=0.5)
+    GivenPage(browser.driver).opened_with_body(FORM)
+
+    with browser._batch() as batch:
+        batch.set_value(browser.element('#first'), 'Yakiv')
+        batch.type(browser.element('#last'), 'Kramarenko')
+        batch.click(browser.element('#agree'))
+
+    browser.element('#first').should(have.value('Yakiv'))
+    browser.element('#last').should(have.value('Kram'))
+    browser.element('#agree').should(have.js_property('checked').value(True))
+
+
+def test_batch_types_and_clicks_by_one_actions_perform(session_browser):
+    browser = session_browser.with_(timeout=0.5)
+    GivenPage(browser.driver).opened_with_body(FORM)
+
+    with browser._batch(by='actions') as batch:
+        batch.set_value(browser.element('#first'), 'Yakiv')
+        batch.type(browser.element('#last'), 'Kramarenko')
+        batch.click(browser.element('#agree'))
+
+    browser.element('#first').should(have.value('Yakiv'))
+    browser.element('#last').should(have.value('Kram'))
+    browser.element('#agree').should(have.js_property('checked').value(True))
+
+
+@pytest.mark.parametrize('by', ['js', 'actions'])
+def test_batch_types_at_the_end_of_prefilled_value(session_browser, by):
+    browser = session_browser.with_(timeout=0.5)
+    # the text is wider than the field, so the click lands in its middle
+    GivenPage(browser.driver).opened_with_body('''
+        <input id="name" value="Yakiv Kramarenko" style="width: 60px">
+        <textarea id="bio" rows="2" style="width: 60px">Selene
+author</textarea>
+        ''')
+
+    with browser._batch(by=by) as batch:
+        batch.type(browser.element('#name'), '!')
+        batch.type(browser.element('#bio'), '!')
+
+    browser.element('#name').should(have.value('Yakiv Kramarenko!'))
+    browser.element('#bio').should(have.value('Selene\nauthor!'))
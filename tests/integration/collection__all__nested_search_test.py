@@ -0,0 +1,127 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import have
+from tests.integration.helpers.givenpage import GivenPage
+
+TABLE = '''
+<table>
+  <tr class="row"><td class="cell">A1</td><td class="cell">A2</td></tr>
+  <tr class="row"><td class="cell">B1</td><td class="cell">B2</td></tr>
+  <tr class="row"><td>C1</td></tr>
+</table>
+<div class="outer">outer <div class="outer">inner <span>X</span></div></div>
+'''
+
+
+@pytest.mark.parametrize('search_nested_by_js', [True, False])
+def test_all_inside_each_element_by_css_and_xpath(session_browser, search_nested_by_js):
+    browser = session_browser.with_(
+        timeout=0.5, _search_nested_by_js=search_nested_by_js
+    )
+    GivenPage(browser.driver).opened_with_body(TABLE)
+
+    browser.all('.row').all('.cell').should(have.exact_texts('A1', 'A2', 'B1', 'B2'))
+    browser.all('.row').all('./td[2]').should(have.exact_texts('A2', 'B2'))
+    # the same element found inside different parents is listed for each of them
+    browser.all('.outer').all('span').should(have.exact_texts('X', 'X'))
+
+
+@pytest.mark.parametrize('search_nested_by_js', [True, False])
+def test_all_first_inside_each_element(session_browser, search_nested_by_js):
+    browser = session_browser.with_(
+        timeout=0.5, _search_nested_by_js=search_nested_by_js
+    )
+    GivenPage(browser.driver).opened_with_body(TABLE)
+
+    browser.all('.row').all_first('td').should(have.exact_texts('A1', 'B1', 'C1'))
+    browser.all('.row').all_first('./td').should(have.exact_texts('A1', 'B1', 'C1'))
+
+
+def test_all_first_fails_as_webdriver_on_absent_inner_element(session_browser):
+    browser = session_browser.with_(timeout=0.5, _search_nested_by_js=True)
+    GivenPage(browser.driver).opened_with_body(TABLE)
+
+    with pytest.raises(AssertionError) as error:
+        browser.all('.row').all_first('.cell').should(have.size(3))
+
+    assert 'Reason: NoSuchElementException: no such element' in str(error.value)
+
+
+def test_all_by_invalid_selector_fails_as_webdriver(session_browser):
+    browser = session_browser.with_(timeout=0.5, _search_nested_by_js=True)
+    GivenPage(browser.driver).opened_with_body(TABLE)
+
+    with pytest.raises(AssertionError) as error:
+        browser.all('.row').all('td[').should(have.size(5))
+
+    assert 'Reason: InvalidSelectorException' in str(error.value)
+
+
+@pytest.mark.parametrize('search_nested_by_js', [True, False])
+def test_shadow_roots_of_each_element(session_browser, search_nested_by_js):
+    browser = session_browser.with_(
+        timeout=0.5, _search_nested_by_js=search_nested_by_js
+    )
+    GivenPage(browser.driver).opened_with_body('''
+        <p class="host"></p>
+        <p class="host"></p>
+        ''')
+    browser.driver.execute_script('''
+        document.querySelectorAll('.host').forEach((host, index) => {
+            host.attachShadow({mode: 'open'}).innerHTML =
+                `<span class="shadowed">shadowed ${index + 1}</span>`;
+        });
+        ''')
+
+    browser.all('.host').shadow_roots.should(have.size(2))
+    browser.all('.host').shadow_roots.all('.shadowed').should(
+        have.exact_texts('shadowed 1', 'shadowed 2')
+    )
+
+
+def test_all_by_xpath_inside_each_shadow_root_is_searched_as_by_webdriver(
+    session_browser,
+):
+    GivenPage(session_browser.driver).opened_with_body('''
+        <p class="host"></p>
+        <p class="host"></p>
+        ''')
+    session_browser.driver.execute_script('''
+        document.querySelectorAll('.host').forEach((host, index) => {
+            host.attachShadow({mode: 'open'}).innerHTML =
+                `<span class="shadowed">shadowed ${index + 1}</span>`;
+        });
+        ''')
+
+    def searched(search_nested_by_js):
+        browser = session_browser.with_(_search_nested_by_js=search_nested_by_js)
+        try:
+            return [
+                element.text
+                for element in browser.all('.host').shadow_roots.all('./span').locate()
+            ]
+        except Exception as error:
+            return type(error)
+
+    assert searched(True) == searched(False)
@@ -0,0 +1,48 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene import be, have
+from tests.integration.helpers.givenpage import GivenPage
+
+
+def test_collection_is_filtered_by_one_js_call(session_browser):
+    browser = session_browser.with_(_filter_collections_by_js=True)
+    GivenPage(browser.driver).opened_with_body('''
+        <ul>
+           <li class="done"><span class="name">Alex</span></li>
+           <li><span class="name">Yakov</span></li>
+           <li class="done" style="display: none">
+             <span class="name">Hidden</span>
+           </li>
+        </ul>
+        ''')
+
+    browser.all('li').by(have.css_class('done')).should(have.size(2))
+    browser.all('li').by(have.css_class('done').and_(be.visible)).should(
+        have.exact_texts('Alex')
+    )
+    browser.all('li').element_by(have.no.css_class('done')).should(
+        have.exact_text('Yakov')
+    )
+    browser.all('li').by_their('.name', have.text('ako')).should(
+        have.exact_texts('Yakov')
+    )
@@ -37,4 +37,25 @@ def test_query_texts_as_normalized(session_browser):
     assert session_browser.all('li').get(query.texts) == ['Alex!', 'Yakov!']
 
 
+def test_query_texts_as_normalized_by_one_js_call(session_browser):
+    browser = session_browser.with_(_snapshot_collections_by_js=True)
+    GivenPage(browser.driver).opened_with_body(
+        '''
+        <ul>Hello:
+           <li id="alex">Alex!</li>
+           <li id="yakov">  Yakov! \n </li>
+           <li id="hidden" style="display: none">Hidden!</li>
+        </ul>
+        '''
+    )
+
+    assert browser.all('li').get(query.texts) == ['Alex!', 'Yakov!', '']
+    assert browser.all('li').get(query.visible_texts) == ['Alex!', 'Yakov!']
+    assert browser.all('li').get(query.attributes('id')) == [
+        'alex',
+        'yakov',
+        'hidden',
+    ]
+
+
 # TODO: check query is logged properly
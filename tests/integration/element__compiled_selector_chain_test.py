@@ -0,0 +1,81 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+from selenium.common import WebDriverException
+
+from tests.integration.helpers.givenpage import GivenPage
+
+# the first .row has no input, so the first-match semantics matters:
+# the chain should not find the input of the second .row
+PAGE = '''
+<form id="form">
+  <div class="row"><span>no input here</span></div>
+  <div class="row"><input value="second row">
+    <div class="row"><input value="nested row"></div>
+  </div>
+</form>
+<form id="other">
+  <div class="row"><input value="other form"></div>
+</form>
+'''
+
+CHAINS = {
+    'css': lambda it: it.element('form').element('.row').element('input'),
+    'css by id': lambda it: it.element('#other').element('.row').element('input'),
+    'css all': lambda it: it.element('form').element('.row').all('input'),
+    'css all of nested': lambda it: it.element('form').all('.row input'),
+    'xpath': lambda it: it.element('//form').element('.//div').element('./input'),
+    'xpath all': lambda it: it.element('//form').element('.//div[2]').all('.//input'),
+    'xpath parent': lambda it: it.element('//input').element('..').element('./span'),
+    'xpath absolute': lambda it: it.element('#other').element('//input'),
+    'mixed': lambda it: it.element('//form[2]').element('.row').element('./input'),
+    'mixed all': lambda it: it.element('#form').element('.//div[2]').all('.row input'),
+    'absent first': lambda it: it.element('#absent').element('.row').element('input'),
+    'absent parent of all': lambda it: it.element('#absent')
+    .element('div')
+    .all('input'),
+    'absent last of all': lambda it: it.element('form').element('span').all('input'),
+}
+
+
+def located(entity):
+    try:
+        found = entity.locate()
+    except WebDriverException as error:
+        return error.__class__.__name__
+    if isinstance(found, list):
+        return [
+            element.get_attribute('value') or element.get_attribute('outerHTML')
+            for element in found
+        ]
+    return found.get_attribute('value') or found.get_attribute('outerHTML')
+
+
+@pytest.mark.parametrize('chain', CHAINS.values(), ids=CHAINS.keys())
+def test_compiled_chain_locates_same_as_uncompiled(session_browser, chain):
+    browser = session_browser.with_(timeout=0.5)
+    GivenPage(browser.driver).opened_with_body(PAGE)
+
+    compiled = located(chain(browser.with_(_compile_selector_chains=True)))
+    uncompiled = located(chain(browser.with_(_compile_selector_chains=False)))
+
+    assert compiled == uncompiled
@@ -0,0 +1,95 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import query, have
+from tests.integration.helpers.givenpage import GivenPage
+
+
+def test_fill_sets_all_form_values_and_form_values_reads_them(session_browser):
+    browser = session_browser.with_(timeout=0.5)
+    GivenPage(browser.driver).opened_with_body('''
+        <form id="registration">
+            <input name="first-name" value="old">
+            <input id="code" maxlength="4">
+            <textarea class="about"></textarea>
+            <input type="radio" name="gender" value="female" checked>
+            <input type="radio" name="gender" value="male">
+            <input type="checkbox" name="agree">
+            <select name="langs" multiple>
+                <option value="py">Python</option>
+                <option value="js">JavaScript</option>
+            </select>
+            <input type="submit" name="submit" value="Register">
+        </form>
+        <div id="changed"></div>
+        <script>
+            document.querySelector('[name=first-name]').addEventListener(
+                'change', event => {
+                    document.querySelector('#changed').textContent = event.target.value
+                }
+            )
+        </script>
+        ''')
+    form = browser.element('#registration')
+
+    form.fill(
+        {
+            'first-name': 'Yakiv',
+            'code': '123456',
+            '.about': 'Selene author',
+            'gender': 'male',
+            'agree': True,
+            'langs': ['py', 'js'],
+        }
+    )
+
+    assert form.get(query.form_values) == {
+        'first-name': 'Yakiv',
+        'code': '1234',
+        'gender': 'male',
+        'agree': True,
+        'langs': ['py', 'js'],
+    }
+    browser.element('.about').should(have.value('Selene author'))
+    browser.element('#changed').should(have.exact_text('Yakiv'))
+
+
+def test_fill_sets_nothing_if_radio_of_value_is_absent(session_browser):
+    browser = session_browser.with_(
+        timeout=0.2,
+        save_screenshot_on_failure=False,
+        save_page_source_on_failure=False,
+    )
+    GivenPage(browser.driver).opened_with_body('''
+        <form id="registration">
+            <input name="first-name" value="old">
+            <input type="radio" name="gender" value="female" checked>
+        </form>
+        ''')
+    form = browser.element('#registration')
+
+    with pytest.raises(AssertionError) as error:
+        form.fill({'first-name': 'Yakiv', 'gender': 'male'})
+
+    assert 'fields not found: gender=male' in str(error.value)
+    assert form.get(query.form_values) == {'first-name': 'old', 'gender': 'female'}
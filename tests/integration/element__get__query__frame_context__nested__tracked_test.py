@@ -0,0 +1,58 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from selene import have, be
+
+
+def test_actions_on_nested_frames_with_tracked_frame_path(session_browser):
+    browser = session_browser.with_(timeout=0.5, _track_frame_path=True)
+
+    # GIVEN
+    browser.open('https://the-internet.herokuapp.com/nested_frames')
+    top = browser.element('[name=frame-top]').frame_context
+    middle = browser.element('[name=frame-middle]').frame_context
+    left = browser.element('[name=frame-left]').frame_context
+
+    # WHEN
+    with top:
+        with middle:
+            browser.element('#content').should(have.exact_text('MIDDLE'))
+        with left:
+            browser.element('body').should(have.exact_text('LEFT'))
+        # THEN
+        browser.element('[name=frame-right]').should(be.visible)
+    # AND
+    browser.element('[name=frame-bottom]').should(be.visible)
+
+
+def test_actions_on_implicit_frame_elements_with_tracked_frame_path(session_browser):
+    browser = session_browser.with_(timeout=0.5, _track_frame_path=True)
+
+    # GIVEN
+    browser.open('https://the-internet.herokuapp.com/nested_frames')
+    bottom = browser.element('[name=frame-bottom]').frame_context
+
+    # WHEN
+    bottom.element('body').should(have.exact_text('BOTTOM'))
+    bottom.element('body').should(be.visible)
+
+    # THEN
+    browser.element('[name=frame-top]').should(be.visible)
@@ -0,0 +1,92 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import time
+
+import pytest
+
+from selene import have, be
+from tests.integration.helpers.givenpage import GivenPage
+
+
+@pytest.mark.parametrize('wait_for_dom_mutations', [True, False])
+def test_should_have_text_changed_later(session_browser, wait_for_dom_mutations):
+    browser = session_browser.with_(
+        timeout=2, _wait_for_dom_mutations=wait_for_dom_mutations
+    )
+    page = GivenPage(browser.driver)
+    page.opened_with_body('<div id="status">loading</div>')
+    page.execute_script_with_timeout(
+        'document.getElementById("status").textContent = "done";', 0.5
+    )
+
+    browser.element('#status').should(have.exact_text('done'))
+
+
+def test_should_be_visible_when_parent_is_shown_later(session_browser):
+    browser = session_browser.with_(timeout=2, _wait_for_dom_mutations=True)
+    page = GivenPage(browser.driver)
+    page.opened_with_body(
+        '<div id="parent" style="display: none"><span id="child">X</span></div>'
+    )
+    page.execute_script_with_timeout(
+        'document.getElementById("parent").style.display = "block";', 0.5
+    )
+
+    browser.element('#child').should(be.visible)
+
+
+def test_should_have_size_of_collection_grown_later(session_browser):
+    browser = session_browser.with_(timeout=2, _wait_for_dom_mutations=True)
+    page = GivenPage(browser.driver)
+    page.opened_with_body('<ul><li>1</li></ul>')
+    page.execute_script_with_timeout(
+        'document.querySelector("ul").innerHTML += "<li>2</li>";', 0.5
+    )
+
+    browser.all('li').should(have.size(2))
+
+
+def test_should_have_value_typed_later(session_browser):
+    # value property changes are not mutations, but are noticed by input events
+    browser = session_browser.with_(timeout=2, _wait_for_dom_mutations=True)
+    page = GivenPage(browser.driver)
+    page.opened_with_body('<input id="field">')
+    page.execute_script_with_timeout(
+        'const field = document.getElementById("field");'
+        ' field.value = "typed";'
+        ' field.dispatchEvent(new Event("input", {bubbles: true}));',
+        0.5,
+    )
+
+    browser.element('#field').should(have.value('typed'))
+
+
+def test_should_still_fail_on_timeout(session_browser):
+    browser = session_browser.with_(timeout=0.5, _wait_for_dom_mutations=True)
+    GivenPage(browser.driver).opened_with_body('<div id="status">loading</div>')
+
+    started = time.monotonic()
+    with pytest.raises(AssertionError) as error:
+        browser.element('#status').should(have.exact_text('done'))
+
+    assert time.monotonic() - started < 1.5
+    assert 'Timed out after 0.5s' in str(error.value)
@@ -0,0 +1,160 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from selene import have
+from selene.aio import Browser
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeWebElement(fakes.FakeWebElement):
+    @property
+    def text(self):
+        texts = self.driver.texts
+        return texts.pop(0) if len(texts) > 1 else texts[0]
+
+    def click(self):
+        time.sleep(self.driver.latency)
+        super().click()
+
+
+class FakeDriver(fakes.FakeDriver):
+    def __init__(self, *, texts=('ok',), latency=0.0):
+        super().__init__()
+        self.texts = list(texts)
+        self.latency = latency
+
+    def element(self, name):
+        return FakeWebElement(name, self)
+
+
+def test_should_waits_asynchronously_till_condition_is_matched():
+    driver = FakeDriver(texts=['loading', 'loading', 'ok'])
+    browser = Browser(browser_with(driver, poll_during_waits=10).config)
+
+    asyncio.run(browser.element('#status').should(have.exact_text('ok')))
+
+    assert driver.texts == ['ok']
+
+
+def test_should_fails_with_same_message_as_normal_wait():
+    driver = FakeDriver(texts=['loading'])
+    browser = Browser(browser_with(driver, timeout=0.1, poll_during_waits=10).config)
+
+    with pytest.raises(AssertionError) as error:
+        asyncio.run(browser.element('#status').should(have.exact_text('ok')))
+
+    assert (
+        'Timed out after 0.1s, while waiting for:\n'
+        "browser.element(('css selector', '#status')).has exact text 'ok'\n"
+    ) in str(error.value)
+
+
+def test_many_sessions_are_driven_concurrently_from_one_event_loop():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
+    drivers = [FakeDriver(latency=0.1) for _ in range(10)]
+    browsers = [
+        Browser(browser_with(driver).config, executor=executor) for driver in drivers
+    ]
+
+    async def scenario(browser):
+        await browser.element('#a').click()
+        await browser.element('#b').click()
+
+    async def all_scenarios():
+        await asyncio.gather(*(scenario(browser) for browser in browsers))
+
+    started = time.perf_counter()
+    asyncio.run(all_scenarios())
+    duration = time.perf_counter() - started
+    executor.shutdown()
+
+    assert [driver.log for driver in drivers] == [
+        ['find #a', 'click #a', 'find #b', 'click #b']
+    ] * 10
+    # 10 sessions × 2 commands × 0.1s each would take 2s if run one by one
+    assert duration < 1.0
+
+
+def test_waits_reuse_hooks_of_normal_wait():
+    driver = FakeDriver(texts=['loading', 'ok'])
+    events = []
+    browser = Browser(
+        browser_with(
+            driver, poll_during_waits=10, _wait_metrics_hook=events.append
+        ).config
+    )
+
+    asyncio.run(browser.element('#status').should(have.exact_text('ok')))
+
+    [event] = events
+    assert event.name == "has exact text 'ok'"
+    assert event.attempts == 2
+    assert event.succeeded
+    assert event.exceptions == {'ConditionMismatch': 1}
+
+
+def test_pending_waits_do_not_occupy_executor_workers():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    drivers = [FakeDriver(texts=['loading'] * 5 + ['ok']) for _ in range(20)]
+    browsers = [
+        Browser(
+            browser_with(driver, timeout=2, poll_during_waits=50).config,
+            executor=executor,
+        )
+        for driver in drivers
+    ]
+
+    async def all_waits():
+        await asyncio.gather(
+            *(
+                browser.element('#status').should(have.exact_text('ok'))
+                for browser in browsers
+            )
+        )
+
+    started = time.perf_counter()
+    asyncio.run(all_waits())
+    duration = time.perf_counter() - started
+    executor.shutdown()
+
+    assert all(driver.texts == ['ok'] for driver in drivers)
+    # 20 waits × 5 polls × 50ms each would take 5s if run by 2 workers
+    assert duration < 1.5
+
+
+def test_commands_are_same_as_of_normal_element():
+    driver = FakeDriver()
+    browser = Browser(browser_with(driver, type_by_js=True).config)
+
+    asyncio.run(browser.element('#name').type('Selene'))
+
+    assert len(driver.scripts) == 1
+    script, webelement, arguments = driver.scripts[0]
+    assert 'textToAppend' in script
+    assert webelement.name == '#name'
+    assert arguments == ('Selene',)
@@ -0,0 +1,99 @@
+import gzip
+import os
+
+import pytest
+
+from selene.core import _artifacts
+from selene.core._artifacts import _ArtifactWriter
+from selene.support.webdriver import WebHelper
+from tests.helpers.fakes import FakeDriver, browser_with
+
+
+def test_writer_writes_submitted_artifacts_in_background(tmp_path):
+    writer = _ArtifactWriter(max_queued=2)
+
+    paths = [
+        writer.submit(str(tmp_path / 'folder' / f'{index}.png'), b'%d' % index)
+        for index in range(5)
+    ]
+    writer.flush()
+
+    assert [open(path, 'rb').read() for path in paths] == [
+        b'0',
+        b'1',
+        b'2',
+        b'3',
+        b'4',
+    ]
+
+
+def test_writer_compresses_artifacts(tmp_path):
+    writer = _ArtifactWriter()
+
+    path = writer.submit(str(tmp_path / '1.html'), b'<html/>', compress=True)
+    writer.flush()
+
+    assert path == str(tmp_path / '1.html.gz')
+    assert gzip.decompress(open(path, 'rb').read()) == b'<html/>'
+
+
+def test_writer_stores_same_content_once(tmp_path):
+    writer = _ArtifactWriter()
+
+    first = writer.submit(str(tmp_path / '1.png'), b'same')
+    second = writer.submit(str(tmp_path / '2.png'), b'same')
+    writer.flush()
+
+    assert open(second, 'rb').read() == b'same'
+    assert os.path.samefile(first, second)
+
+
+def test_failure_artifacts_are_saved_in_background_if_turned_on(tmp_path):
+    config = browser_with(
+        FakeDriver(page_source='<html>Hello</html>'),
+        _save_artifacts_in_background=True,
+        _compress_saved_page_sources=True,
+    ).config
+
+    screenshot = config._save_screenshot_strategy(config, str(tmp_path / '1.png'))
+    page_source = config._save_page_source_strategy(config, str(tmp_path / '1.html'))
+    _artifacts._writer.flush()
+
+    assert config.last_screenshot == screenshot == str(tmp_path / '1.png')
+    assert config.last_page_source == page_source == str(tmp_path / '1.html.gz')
+    assert open(screenshot, 'rb').read() == b'png'
+    assert gzip.decompress(open(page_source, 'rb').read()) == b'<html>Hello</html>'
+
+
+def test_web_helper_saves_artifacts_in_background_if_turned_on(tmp_path):
+    helper = WebHelper(
+        FakeDriver(page_source='<html>Hello</html>'),  # type: ignore
+        _save_artifacts_in_background=True,
+        _compress_saved_page_sources=True,
+    )
+
+    screenshot = helper.save_screenshot(str(tmp_path / '2.png'))
+    page_source = helper.save_page_source(str(tmp_path / '2.html'))
+    _artifacts._writer.flush()
+
+    assert screenshot == str(tmp_path / '2.png')
+    assert page_source == str(tmp_path / '2.html.gz')
+    assert open(screenshot, 'rb').read() == b'png'
+    assert gzip.decompress(open(page_source, 'rb').read()) == b'<html>Hello</html>'
+
+
+def test_browser_saves_page_source_in_background_if_turned_on(tmp_path):
+    browser = browser_with(
+        FakeDriver(page_source='<html>Hello</html>'),
+        _save_artifacts_in_background=True,
+        _compress_saved_page_sources=True,
+    )
+
+    with pytest.warns(DeprecationWarning):
+        page_source = browser.save_page_source(str(tmp_path / '3.html'))
+    _artifacts._writer.flush()
+
+    # i.e. written by the background writer, that compresses it
+    assert browser.config.last_page_source == page_source
+    assert page_source == str(tmp_path / '3.html.gz')
+    assert gzip.decompress(open(page_source, 'rb').read()) == b'<html>Hello</html>'
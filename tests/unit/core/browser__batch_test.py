@@ -0,0 +1,148 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+from selenium.webdriver import Keys
+
+from selene.core import _batch
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeDriver(fakes.FakeDriver):
+    """Fails to execute steps on `failing` elements `failures` times"""
+
+    def __init__(self, *, failing=(), failures=1):
+        super().__init__()
+        self.failing = failing
+        self.failures = failures
+
+    def execute_script(self, script, steps):
+        super().execute_script(script, steps)
+        self.log.append(
+            'execute '
+            + ', '.join(
+                f'{action} {element.name} {value}'.strip()
+                for element, action, value in steps
+            )
+        )
+        for index, (element, _, _) in enumerate(steps):
+            if element.name in self.failing and self.failures:
+                self.failures -= 1
+                return [index, 'Error: not ready']
+        return None
+
+
+def test_batch_flushes_all_steps_by_one_script():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    with browser._batch() as batch:
+        batch.set_value(browser.element('#first'), 'Yakiv')
+        batch.type(browser.element('#last'), 'Kramarenko')
+        batch.click(browser.element('#agree'))
+        assert driver.log == []
+
+    assert driver.log == [
+        'find #first',
+        'find #last',
+        'find #agree',
+        'execute set_value #first Yakiv, type #last Kramarenko, click #agree',
+    ]
+
+
+def test_batch_resumes_from_failed_step():
+    driver = FakeDriver(failing=['#last'])
+    browser = browser_with(driver, poll_during_waits=0)
+
+    with browser._batch() as batch:
+        batch.set_value(browser.element('#first'), 'Yakiv')
+        batch.set_value(browser.element('#last'), 'Kramarenko')
+        batch.click(browser.element('#agree'))
+
+    assert driver.log[-3:] == [
+        'find #last',
+        'find #agree',
+        'execute set_value #last Kramarenko, click #agree',
+    ]
+
+
+def test_batch_reports_failed_step_with_its_element():
+    driver = FakeDriver(failing=['#last'], failures=1000)
+    browser = browser_with(driver, timeout=0.1, poll_during_waits=10)
+
+    with pytest.raises(AssertionError) as error:
+        with browser._batch() as batch:
+            batch.set_value(browser.element('#first'), 'Yakiv')
+            batch.set_value(browser.element('#last'), 'Kramarenko')
+
+    assert (
+        "Reason: _SeleneError: failed on step 2 of 2: "
+        "browser.element(('css selector', '#last')).set value by js: Kramarenko: "
+        "Error: not ready"
+    ) in str(error.value)
+
+
+def test_batch_is_discarded_on_error_inside_with_statement():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    with pytest.raises(ZeroDivisionError):
+        with browser._batch() as batch:
+            batch.click(browser.element('#agree'))
+            _ = 1 / 0
+
+    assert driver.log == []
+
+
+@pytest.mark.parametrize(
+    'platform_name, key',
+    [
+        ('mac', Keys.COMMAND),
+        ('macOS', Keys.COMMAND),
+        ('Mac OS X', Keys.COMMAND),
+        ('linux', Keys.CONTROL),
+        ('Windows', Keys.CONTROL),
+        (None, Keys.CONTROL),
+    ],
+)
+def test_select_all_key_is_chosen_by_platform_of_remote_browser(platform_name, key):
+    driver = FakeDriver()
+    if platform_name is not None:
+        driver.capabilities['platformName'] = platform_name
+
+    assert _batch._select_all_key(driver) == key
+
+
+@pytest.mark.parametrize(
+    'platform_name, keys',
+    [
+        ('mac', (Keys.COMMAND, Keys.ARROW_DOWN)),
+        ('linux', (Keys.CONTROL, Keys.END)),
+        (None, (Keys.CONTROL, Keys.END)),
+    ],
+)
+def test_end_of_text_keys_are_chosen_by_platform_of_remote_browser(platform_name, keys):
+    driver = FakeDriver()
+    if platform_name is not None:
+        driver.capabilities['platformName'] = platform_name
+
+    assert _batch._end_of_text_keys(driver) == keys
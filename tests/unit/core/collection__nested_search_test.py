@@ -0,0 +1,115 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+from selenium.common import JavascriptException
+
+from selene import have
+from tests.helpers import fakes
+from tests.helpers.fakes import FakeWebElement, browser_with
+
+
+class FakeDriver(fakes.FakeDriver):
+    """Finds `rows` by `tr` selector, and searches inside them by script
+    (if `scripting`) as `selene.core._search` does
+    """
+
+    def __init__(self, rows, *, scripting=True):
+        super().__init__({'tr': rows})
+        self.rows = rows
+        self.scripting = scripting
+
+    def execute_script(self, script, parents, how, selector, mode):
+        super().execute_script(script, parents, how, selector, mode)
+        if not self.scripting:
+            raise JavascriptException('not supported')
+        if mode == 'first':
+            return [(parent.children or [None])[0] for parent in parents]
+        return [parent.children for parent in parents]
+
+
+def table():
+    return [
+        FakeWebElement('row1', children=[FakeWebElement('A1'), FakeWebElement('A2')]),
+        FakeWebElement('row2', children=[FakeWebElement('B1'), FakeWebElement('B2')]),
+    ]
+
+
+def test_all_inside_each_element_is_searched_by_one_script():
+    driver = FakeDriver(table())
+    browser = browser_with(driver, _search_nested_by_js=True)
+
+    browser.all('tr').all('td').should(have.texts('A1', 'A2', 'B1', 'B2'))
+
+    [(_, _, *searched)] = driver.scripts
+    assert searched == ['css selector', 'td', 'all']
+    assert [row.calls for row in driver.rows] == [[], []]
+
+
+def test_all_first_inside_each_element_is_searched_by_one_script():
+    driver = FakeDriver(table())
+    browser = browser_with(driver, _search_nested_by_js=True)
+
+    browser.all('tr').all_first('td').should(have.texts('A1', 'B1'))
+
+    [(_, _, *searched)] = driver.scripts
+    assert searched == ['css selector', 'td', 'first']
+    assert [row.calls for row in driver.rows] == [[], []]
+
+
+def test_all_first_falls_back_to_webdriver_if_some_element_has_nothing_inside():
+    driver = FakeDriver([*table(), FakeWebElement('row3', children=[])])
+    browser = browser_with(driver, timeout=0.1, _search_nested_by_js=True)
+
+    with pytest.raises(AssertionError) as error:
+        browser.all('tr').all_first('td').should(have.size(3))
+
+    assert 'NoSuchElementException' in str(error.value)
+    assert 'no td inside row3' in str(error.value)
+
+
+def test_all_falls_back_to_webdriver_if_script_is_not_supported():
+    driver = FakeDriver(table(), scripting=False)
+    browser = browser_with(driver, _search_nested_by_js=True)
+
+    browser.all('tr').all('td').should(have.texts('A1', 'A2', 'B1', 'B2'))
+
+    assert [row.calls for row in driver.rows] == [['find_elements(td)']] * 2
+
+
+def test_all_is_searched_inside_each_element_by_webdriver_by_default():
+    driver = FakeDriver(table())
+    browser = browser_with(driver)
+
+    browser.all('tr').all('td').should(have.texts('A1', 'A2', 'B1', 'B2'))
+
+    assert driver.scripts == []
+    assert [row.calls for row in driver.rows] == [['find_elements(td)']] * 2
+
+
+def test_all_by_not_composable_selector_is_searched_by_webdriver():
+    driver = FakeDriver(table())
+    browser = browser_with(driver, _search_nested_by_js=True)
+
+    browser.all('tr').all(('link text', 'A')).should(have.size(4))
+
+    assert driver.scripts == []
+    assert [row.calls for row in driver.rows] == [['find_elements(A)']] * 2
@@ -0,0 +1,121 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import be, have
+from selene.core.exceptions import TimeoutException
+from tests.helpers.fakes import FakeDriver, FakeWebElement, browser_with
+
+
+def test_clickable_locates_element_once_per_evaluation():
+    webelement = FakeWebElement()
+    driver = FakeDriver({'#a': webelement})
+    element = browser_with(driver, timeout=0.1).element('#a')
+
+    element.should(be.clickable)
+
+    assert driver.log == ['find #a']
+    assert webelement.calls == ['is_displayed', 'is_enabled']
+
+
+def test_composed_condition_queries_same_actual_once_per_evaluation():
+    webelement = FakeWebElement(displayed=False)
+    driver = FakeDriver({'#a': webelement})
+    element = browser_with(driver, timeout=0.1).element('#a')
+
+    element.should(be.hidden_in_dom)
+
+    assert driver.log == ['find #a']
+    assert webelement.calls == ['is_displayed']
+
+
+def test_composed_condition_locates_again_on_next_evaluation():
+    webelement = FakeWebElement(enabled=False)
+    driver = FakeDriver({'#a': webelement})
+    element = browser_with(driver, timeout=0.1).element('#a')
+
+    with pytest.raises(TimeoutException) as error:
+        element.should(be.clickable)
+
+    attempts = webelement.calls.count('is_enabled')
+    assert attempts > 1
+    assert driver.log == ['find #a'] * attempts
+    assert 'is enabled' in str(error.value)
+
+
+def test_element_outside_of_composed_condition_is_located_each_time():
+    driver = FakeDriver({'#a': FakeWebElement()})
+    element = browser_with(driver, timeout=0.1).element('#a')
+
+    element.should(be.visible).should(be.enabled)
+
+    assert driver.log == ['find #a', 'find #a']
+
+
+def test_nested_wait_does_not_reuse_element_located_by_outer_evaluation():
+    driver = FakeDriver({'#a': FakeWebElement()})
+    element = browser_with(driver, timeout=0.1).element('#a')
+    found_by_nested = []
+
+    def nested(entity):
+        found = len(driver.log)
+        entity.wait.for_(lambda it: it.locate())
+        found_by_nested.append(len(driver.log) - found)
+
+    element.should(be.visible.and_(have.size(0).or_(nested)))
+
+    assert found_by_nested == [1]
+
+
+def test_clickable_is_tested_by_one_script_if_turned_on(monkeypatch):
+    monkeypatch.setattr(
+        'selene.core.condition.WebElement', FakeWebElement, raising=True
+    )
+    webelement = FakeWebElement()
+    driver = FakeDriver({'#a': webelement}, script_result=True)
+    element = browser_with(
+        driver, timeout=0.1, _match_composed_conditions_by_js=True
+    ).element('#a')
+
+    element.should(be.clickable)
+
+    assert driver.log == ['find #a']
+    assert webelement.calls == []
+    [(script, *_)] = driver.scripts
+    assert '(isDisplayed(element)) && (!element.matches(":disabled"))' in script
+
+
+def test_clickable_not_matched_by_script_is_described_by_sub_conditions(monkeypatch):
+    monkeypatch.setattr(
+        'selene.core.condition.WebElement', FakeWebElement, raising=True
+    )
+    webelement = FakeWebElement(enabled=False)
+    driver = FakeDriver({'#a': webelement}, script_result=False)
+    element = browser_with(
+        driver, timeout=0.1, _match_composed_conditions_by_js=True
+    ).element('#a')
+
+    with pytest.raises(TimeoutException) as error:
+        element.should(be.clickable)
+
+    assert webelement.calls[-2:] == ['is_displayed', 'is_enabled']
+    assert 'is enabled' in str(error.value)
@@ -0,0 +1,90 @@
+from selene import Config, be, have
+from selene.core._snapshot import _filtered, _js_inner
+from tests.helpers.fakes import FakeCollection, FakeDriver
+
+
+class FakeEntity:
+    def __init__(self, **config_options):
+        self.config = Config(**config_options)
+
+
+def test_built_in_conditions_provide_js_version_of_predicate():
+    entity = FakeEntity()
+
+    assert be.visible._js_for(entity) == 'isDisplayed(element)'
+    assert be.hidden._js_for(entity) == '!isDisplayed(element)'
+    assert have.text('a')._js_for(entity) == (
+        '''(String((textOf(element)) ?? 'None')).includes("a")'''
+    )
+    assert have.exact_text('a')._js_for(entity) == (
+        '''(String((textOf(element)) ?? 'None')) === "a"'''
+    )
+    assert have.attribute('id').value('a')._js_for(entity) == (
+        '''(String((attributeOf(element, "id")) ?? 'None')) === "a"'''
+    )
+
+
+def test_inverted_and_combined_conditions_provide_js_version_of_predicate():
+    entity = FakeEntity()
+
+    assert have.no.exact_text('a')._js_for(entity) == (
+        '''!((String((textOf(element)) ?? 'None')) === "a")'''
+    )
+    assert be.visible.and_(be.enabled)._js_for(entity) == (
+        '(isDisplayed(element)) && (!element.matches(":disabled"))'
+    )
+    assert be.visible.or_(be.hidden)._js_for(entity) == (
+        '(isDisplayed(element)) || (!isDisplayed(element))'
+    )
+
+
+def test_js_version_of_predicate_respects_ignore_case():
+    assert have.exact_text('A').ignore_case._js_for(FakeEntity()) == (
+        '''(String((textOf(element)) ?? 'None').toLowerCase()) === "a"'''
+    )
+    assert have.exact_text('A')._js_for(FakeEntity(_match_ignoring_case=True)) == (
+        '''(String((textOf(element)) ?? 'None').toLowerCase()) === "a"'''
+    )
+
+
+def test_custom_conditions_have_no_js_version_of_predicate():
+    entity = FakeEntity()
+
+    assert have.size(2)._js_for(entity) is None
+    assert be.visible.and_(have.size(2))._js_for(entity) is None
+
+
+def test_js_version_of_predicate_is_applied_to_inner_element():
+    assert _js_inner(('css selector', '.name'), 'isDisplayed(element)') == (
+        '(element => { if (!element) throw new Error("inner element not found");'
+        ' return (isDisplayed(element)); })'
+        '(element.querySelector(".name"))'
+    )
+    assert _js_inner(('id', 'name'), 'isDisplayed(element)') is None
+    assert _js_inner(('css selector', '.name'), None) is None
+
+
+def test_filtered_is_not_applied_if_turned_off_or_no_js_provided():
+    driver = FakeDriver(script_result=['li1'])
+
+    assert _filtered(FakeCollection(['li1'], driver=driver), 'true') is None
+    assert (
+        _filtered(
+            FakeCollection(['li1'], driver=driver, _filter_collections_by_js=True),
+            None,
+        )
+        is None
+    )
+    assert driver.scripts == []
+
+
+def test_filtered_filters_all_elements_by_one_script_call():
+    driver = FakeDriver(script_result=['li2'])
+    collection = FakeCollection(
+        ['li1', 'li2'], driver=driver, _filter_collections_by_js=True
+    )
+
+    assert _filtered(collection, 'isDisplayed(element)', first=True) == ['li2']
+    [(script, *arguments)] = driver.scripts
+    assert 'const matching = element => (isDisplayed(element));' in script
+    assert arguments == [['li1', 'li2'], True]
@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import be
+from selene.core.condition import Condition
+from selene.core.exceptions import ConditionMismatch, TimeoutException
+from tests.helpers.fakes import FakeDriver, FakeWebElement, browser_with
+
+
+def test_failed_attempts_describe_actual_only_on_final_failure():
+    webelement = FakeWebElement(
+        displayed=False, attributes={'outerHTML': '<button hidden>Press me</button>'}
+    )
+    driver = FakeDriver({'#button': webelement})
+    element = browser_with(driver, timeout=0.2).element('#button')
+
+    with pytest.raises(TimeoutException) as error:
+        element.should(be.visible)
+
+    assert len(driver.log) > 1
+    assert webelement.calls.count('get_attribute(outerHTML)') == 1
+    assert 'actual html element: <button hidden>Press me</button>' in str(error.value)
+
+
+def test_mismatch_is_described_once_on_demand():
+    described = []
+
+    def describe():
+        described.append(True)
+        return 'actual: 0'
+
+    mismatch = ConditionMismatch(describe)
+
+    assert described == []
+    assert str(mismatch) == 'actual: 0'
+    assert mismatch.args == ('actual: 0',)
+    assert described == [True]
+
+
+def test_mismatch_describes_failure_to_describe_actual():
+    def describe():
+        raise ValueError('element is stale')
+
+    mismatch = ConditionMismatch(describe)
+
+    assert str(mismatch) == (
+        'condition not matched'
+        ' (failed to describe actual result: ValueError: element is stale)'
+    )
+
+
+def test_mismatch_args_can_be_reassigned():
+    mismatch = ConditionMismatch(lambda: 'actual: 0')
+
+    mismatch.args = ('reworded: actual: 0',)
+
+    assert mismatch.args == ('reworded: actual: 0',)
+    assert str(mismatch) == 'reworded: actual: 0'
+
+
+def test_or_condition_describes_mismatches_only_on_demand():
+    described = []
+
+    def mismatch(entity):
+        def describe():
+            described.append(entity)
+            return f'actual: {entity}'
+
+        raise ConditionMismatch(describe)
+
+    condition = Condition('negative', mismatch).or_(Condition('zero', mismatch))
+
+    with pytest.raises(AssertionError) as error:
+        condition(1)
+
+    assert type(error.value) is AssertionError
+    assert error.value.__cause__ is None
+    assert described == []
+    assert str(error.value) == 'actual: 1; actual: 1'
+    assert described == [1, 1]
+
+
+def test_lazily_described_mismatch_is_chained_from_its_reason_as_before():
+    reason = AssertionError('not yet')
+
+    def failing(entity):
+        raise reason
+
+    with pytest.raises(ConditionMismatch) as error:
+        ConditionMismatch._to_raise_if_not(failing)(0)
+
+    assert error.value.__cause__ is reason
+    assert str(error.value).startswith('not yet')
@@ -0,0 +1,81 @@
+import pytest
+from selenium.common import InvalidSessionIdException
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from selene import Config
+from tests.helpers import fakes
+
+
+class FakeDriver(fakes.FakeDriver):
+    def __init__(self):
+        super().__init__()
+        self.checks = 0
+
+    @property
+    def window_handles(self):
+        self.checks += 1
+        return super().window_handles
+
+
+def test_driver_is_checked_for_being_alive_on_each_access_by_default():
+    driver = FakeDriver()
+    config = Config(
+        driver=driver, rebuild_not_alive_driver=True, hold_driver_at_exit=True
+    )
+
+    for _ in range(3):
+        assert config.driver is driver
+
+    assert driver.checks == 3
+
+
+def test_successful_liveness_check_is_trusted_during_ttl():
+    driver = FakeDriver()
+    config = Config(
+        driver=driver,
+        rebuild_not_alive_driver=True,
+        hold_driver_at_exit=True,
+        _driver_liveness_ttl=60,
+    )
+    counters_before = config._executor.driver_liveness_counters
+
+    for _ in range(3):
+        assert config.driver is driver
+
+    assert driver.checks == 1
+    counters = config._executor.driver_liveness_counters
+    assert counters.checks - counters_before.checks == 1
+    assert counters.trusted - counters_before.trusted == 2
+
+
+@pytest.mark.parametrize(
+    'error',
+    [
+        InvalidSessionIdException('invalid session id'),
+        ConnectionRefusedError('connection refused'),
+        MaxRetryError(None, '/session/1/element', reason='refused'),  # type: ignore
+        ProtocolError('Connection aborted.'),
+        NewConnectionError(None, 'Failed to establish a new connection'),  # type: ignore
+    ],
+)
+def test_trusted_liveness_check_is_invalidated_on_dead_session_error(error):
+    driver = FakeDriver()
+    config = Config(
+        driver=driver,
+        rebuild_not_alive_driver=True,
+        hold_driver_at_exit=True,
+        _driver_liveness_ttl=60,
+        poll_during_waits=0,
+    )
+    assert config.driver is driver
+    attempts = []
+
+    def dead_session_once(entity):
+        attempts.append(entity)
+        if len(attempts) == 1:
+            raise error
+
+    config.wait('entity').for_(dead_session_once)
+    assert config.driver is driver
+
+    assert driver.checks == 2
@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from selenium.common import WebDriverException
+
+from selene import Config
+from selene.core.configuration import DriverPool
+from tests.helpers import fakes
+
+
+class FakeDriver(fakes.FakeDriver):
+    broken = False
+
+    def delete_all_cookies(self):
+        if self.broken:
+            raise WebDriverException('session is broken')
+        super().delete_all_cookies()
+
+
+def pool_of(size):
+    return DriverPool(Config(build_driver_strategy=lambda config: FakeDriver()), size)
+
+
+def test_pool_gives_each_thread_its_own_browser():
+    pool = pool_of(2).warm_up()
+    drivers = {}
+
+    def use_browser(name):
+        drivers[name] = pool.browser.driver
+        assert pool.browser.driver is drivers[name]
+
+    threads = [threading.Thread(target=use_browser, args=(n,)) for n in 'ab']
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert drivers['a'] is not drivers['b']
+    assert pool.utilization.busy == 2
+    assert pool.utilization.max_busy == 2
+
+
+def test_pool_recycles_driver_of_released_browser():
+    pool = pool_of(1)
+    driver = pool.browser.driver
+
+    pool.release_browser()
+
+    assert driver.log.count('delete cookies in main') == 1
+    assert pool.browser.driver is driver
+    utilization = pool.utilization
+    assert (utilization.acquisitions, utilization.recycles) == (2, 1)
+
+
+def test_pool_rebuilds_driver_if_recycling_failed():
+    pool = pool_of(1)
+    driver = pool.acquire()
+    driver.broken = True
+
+    pool.release(driver)
+
+    assert driver.log.count('quit') == 1
+    assert pool.acquire(timeout=2) is not driver
+    assert pool.utilization.rebuilds == 1
+
+
+def test_pool_quits_all_built_drivers():
+    pool = pool_of(2)
+    first = pool.acquire()
+    second = pool.acquire()
+
+    pool.quit()
+
+    assert first.log.count('quit') == second.log.count('quit') == 1
+
+
+def test_pool_rebuilds_driver_if_its_remote_end_is_not_reachable():
+    from urllib3.exceptions import MaxRetryError
+
+    class DeadDriver(FakeDriver):
+        def delete_all_cookies(self):
+            raise MaxRetryError(None, '/session', 'connection refused')
+
+    pool = DriverPool(Config(build_driver_strategy=lambda config: DeadDriver()), 1)
+    driver = pool.acquire()
+
+    pool.release(driver)
+
+    assert driver.log.count('quit') == 1
+    assert pool.utilization.rebuilds == 1
+    assert pool.acquire(timeout=2) is not driver
+
+
+def test_pool_does_not_release_driver_it_has_not_handed_out():
+    pool = pool_of(1)
+    driver = pool.acquire()
+    pool.release(driver)
+
+    with pytest.raises(ValueError):
+        pool.release(driver)
+    with pytest.raises(ValueError):
+        pool.release(FakeDriver())
+
+    assert pool.utilization.busy == 0
+
+
+def test_pool_owns_driver_rebuilt_by_browser_in_place_of_dead_one():
+    pool = pool_of(1)
+    acquired = pool.browser.driver
+    # as if the driver was found dead and rebuilt by Config on next access
+    pool.browser.config.driver = ...
+    rebuilt = pool.browser.driver
+
+    pool.release_browser()
+    pool.quit()
+
+    assert rebuilt is not acquired
+    assert acquired.log.count('quit') == 1
+    assert rebuilt.log.count('quit') == 1
+    assert pool.utilization.busy == 0
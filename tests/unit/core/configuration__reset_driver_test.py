@@ -0,0 +1,121 @@
+from selenium.common import JavascriptException, WebDriverException
+
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeDriver(fakes.FakeDriver):
+    broken = False
+
+    def delete_all_cookies(self):
+        if self.broken:
+            raise WebDriverException('session is broken')
+        super().delete_all_cookies()
+
+    def execute_script(self, script, *arguments):
+        if self.current == 'blank':
+            raise JavascriptException('SecurityError: access is denied')
+        self.log.append(f'{script} in {self.current}')
+
+
+def test_reset_driver_strategy_cleans_all_tabs_and_closes_extra_ones():
+    driver = FakeDriver(handles=('first', 'second'))
+    config = browser_with(driver).config
+
+    config._reset_driver_strategy(config)(driver)
+
+    assert driver.log == [
+        'delete cookies in second',
+        'window.localStorage.clear() in second',
+        'window.sessionStorage.clear() in second',
+        'close second',
+        'delete cookies in first',
+        'window.localStorage.clear() in first',
+        'window.sessionStorage.clear() in first',
+        'get about:blank',
+    ]
+    assert driver.handles == ['first']
+
+
+def test_reset_driver_strategy_skips_not_accessible_storage():
+    driver = FakeDriver(handles=('blank',))
+    config = browser_with(driver).config
+
+    config._reset_driver_strategy(config)(driver)
+
+    assert driver.log == ['delete cookies in blank', 'get about:blank']
+
+
+def test_reset_driver_keeps_driver_if_reset_succeeded():
+    driver = FakeDriver()
+    config = browser_with(driver).config
+
+    config._executor.reset_driver()
+
+    assert config.driver is driver
+    assert 'quit' not in driver.log
+
+
+def test_reset_driver_falls_back_to_rebuild_if_reset_failed():
+    broken = FakeDriver()
+    broken.broken = True
+    rebuilt = FakeDriver()
+    config = browser_with(broken, build_driver_strategy=lambda config: rebuilt).config
+
+    config._executor.reset_driver()
+
+    assert broken.log == ['quit']
+    assert config.driver is rebuilt
+
+
+def test_teardown_driver_resets_session_if_turned_on():
+    driver = FakeDriver(handles=('first', 'second'))
+    config = browser_with(driver, _reset_driver_on_teardown=True).config
+
+    config._executor.teardown_driver()
+
+    assert config.driver is driver
+    assert 'get about:blank' in driver.log
+    assert 'quit' not in driver.log
+    assert driver.handles == ['first']
+
+
+def test_teardown_driver_falls_back_to_rebuild_if_reset_failed():
+    broken = FakeDriver()
+    broken.broken = True
+    rebuilt = FakeDriver()
+    config = browser_with(
+        broken,
+        build_driver_strategy=lambda config: rebuilt,
+        _reset_driver_on_teardown=True,
+    ).config
+
+    config._executor.teardown_driver()
+
+    assert broken.log == ['quit']
+    assert config.driver is rebuilt
+
+
+def test_teardown_driver_quits_it_if_reset_is_turned_off():
+    driver = FakeDriver()
+    config = browser_with(driver).config
+
+    config._teardown_driver_strategy(config.with_(hold_driver_at_exit=False))(driver)
+
+    assert driver.log == ['quit']
+
+
+def test_driver_is_quit_at_exit_even_if_reset_on_teardown(monkeypatch):
+    from selene.core import configuration
+
+    handlers = []
+    monkeypatch.setattr(configuration.atexit, 'register', handlers.append)
+    driver = FakeDriver()
+    config = browser_with(
+        driver, hold_driver_at_exit=False, _reset_driver_on_teardown=True
+    ).config
+
+    config._schedule_driver_teardown_strategy(config, lambda: driver)
+    handlers[-1]()
+
+    assert driver.log == ['quit']
@@ -0,0 +1,152 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from selenium.common import NoSuchFrameException
+
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeWebElement(fakes.FakeWebElement):
+    def click(self):
+        if self.driver.failures:
+            self.driver.failures -= 1
+            raise NoSuchFrameException('frame was detached')
+        super().click()
+
+
+class FakeDriver(fakes.FakeDriver):
+    failures = 0
+
+    def element(self, name):
+        return FakeWebElement(name, self)
+
+
+def commands(driver):
+    """Only switching and commands, without finding elements"""
+    return [entry for entry in driver.log if not entry.startswith('find ')]
+
+
+def test_consecutive_commands_inside_frame_switch_into_it_once():
+    driver = FakeDriver()
+    browser = browser_with(
+        driver, timeout=0.5, poll_during_waits=0, _track_frame_path=True
+    )
+    iframe = browser.element('#frame').frame_context
+
+    iframe.element('#a').click()
+    iframe.element('#b').click()
+    browser.element('#c').click()
+
+    assert commands(driver) == [
+        'frame #frame',
+        'click #a',
+        'click #b',
+        'parent',
+        'click #c',
+    ]
+
+
+def test_untracked_commands_inside_frame_switch_into_it_each_time():
+    driver = FakeDriver()
+    browser = browser_with(driver, timeout=0.5, poll_during_waits=0)
+    iframe = browser.element('#frame').frame_context
+
+    iframe.element('#a').click()
+    iframe.element('#b').click()
+
+    assert commands(driver) == [
+        'frame #frame',
+        'click #a',
+        'parent',
+        'frame #frame',
+        'click #b',
+        'parent',
+    ]
+
+
+def test_switching_between_nested_and_sibling_frames_is_minimal():
+    driver = FakeDriver()
+    browser = browser_with(
+        driver, timeout=0.5, poll_during_waits=0, _track_frame_path=True
+    )
+    top = browser.element('#top').frame_context
+    left = browser.element('#left').frame_context
+    right = browser.element('#right').frame_context
+
+    with top:
+        with left:
+            browser.element('#a').click()
+        with right:
+            browser.element('#b').click()
+    with top:
+        with right:
+            browser.element('#c').click()
+
+    assert commands(driver) == [
+        'frame #top',
+        'frame #left',
+        'click #a',
+        'parent',
+        'frame #right',
+        'click #b',
+        'click #c',
+    ]
+
+
+def test_tracked_frame_path_is_reset_on_navigation():
+    driver = FakeDriver()
+    browser = browser_with(
+        driver, timeout=0.5, poll_during_waits=0, _track_frame_path=True
+    )
+    iframe = browser.element('#frame').frame_context
+
+    iframe.element('#a').click()
+    browser.open('about:blank')
+    iframe.element('#b').click()
+
+    assert commands(driver) == [
+        'frame #frame',
+        'click #a',
+        'get about:blank',
+        'frame #frame',
+        'click #b',
+    ]
+
+
+def test_tracked_frame_path_is_restored_from_default_content_on_no_such_frame():
+    driver = FakeDriver()
+    browser = browser_with(
+        driver, timeout=0.5, poll_during_waits=0, _track_frame_path=True
+    )
+    iframe = browser.element('#frame').frame_context
+    iframe.element('#a').click()
+
+    driver.failures = 1
+    iframe.element('#b').click()
+
+    assert commands(driver) == [
+        'frame #frame',
+        'click #a',
+        'default',
+        'frame #frame',
+        'click #b',
+    ]
@@ -0,0 +1,175 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from selenium.common import NoSuchElementException
+
+from selene.core._chain import _Chain
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeDriver(fakes.FakeDriver):
+    """Finds nothing by compiled selectors if not `found_by_compiled`"""
+
+    def __init__(self, *, found_by_compiled=True):
+        super().__init__()
+        self.found_by_compiled = found_by_compiled
+
+    def _not_found_by(self, value):
+        return value.startswith('(') and not self.found_by_compiled
+
+    def find_element(self, by, value):
+        found = super().find_element(by, value)
+        if self._not_found_by(value):
+            raise NoSuchElementException(value)
+        return found
+
+    def find_elements(self, by, value):
+        found = super().find_elements(by, value)
+        return [] if self._not_found_by(value) else found
+
+    def execute_script(self, script, root, links, all):
+        super().execute_script(script, root, links, all)
+        if not self.found_by_compiled:
+            return None
+        found = self.element(links[-1][1])
+        return [found] if all else found
+
+
+def test_chain_of_relative_xpaths_is_compiled_to_one_xpath():
+    chain = (
+        _Chain.of(None, ('xpath', '//form'))
+        .then(('xpath', './/*[@class="row"]'))
+        .then(('xpath', './input'))
+    )
+
+    assert chain.xpath == '((//form)[1]/.//*[@class="row"])[1]/./input'
+
+
+def test_chain_with_css_or_absolute_or_union_xpath_is_not_compiled_to_xpath():
+    form = _Chain.of(None, ('xpath', '//form'))
+
+    assert form.then(('css selector', '.row')).xpath is None
+    assert form.then(('xpath', '//input')).xpath is None
+    assert form.then(('xpath', './a | ./b')).xpath is None
+    assert (
+        _Chain.of(None, ('css selector', 'form')).then(('xpath', './a')).xpath is None
+    )
+
+
+def test_chain_with_not_compilable_link_is_not_continued():
+    assert _Chain.of(None, ('link text', 'Home')) is None
+    assert _Chain.of(None, ('xpath', '//form')).then(('link text', 'Home')) is None
+
+
+def test_chain_is_extended_by_pointing_to_its_parent():
+    form = _Chain.of(None, ('css selector', 'form'))
+    row = form.then(('css selector', '.row'))
+    field = row.then(('xpath', './input'))
+
+    assert field.parent is row and row.parent is form
+    assert field.links == (
+        ('css selector', 'form'),
+        ('css selector', '.row'),
+        ('xpath', './input'),
+    )
+
+
+def test_chain_is_not_built_if_not_compiled():
+    browser = browser_with(FakeDriver())
+
+    element = browser.element('form').element('.row')
+    collection = element.all('input')
+
+    assert element._locator._chain is None
+    assert browser.element('form')._locator._chain is None
+    assert collection._locator._chain is None
+
+
+def test_element_chain_of_xpaths_is_located_by_one_find_element():
+    driver = FakeDriver()
+    browser = browser_with(driver, _compile_selector_chains=True)
+
+    browser.element('//form').element('.//div').element('./input').locate()
+
+    assert driver.log == ['find ((//form)[1]/.//div)[1]/./input']
+    assert driver.scripts == []
+
+
+def test_element_chain_of_css_selectors_is_located_by_one_script():
+    driver = FakeDriver()
+    browser = browser_with(driver, _compile_selector_chains=True)
+
+    browser.element('#form').element('.row').all('input').locate()
+
+    assert driver.log == []
+    [(_, root, links, all)] = driver.scripts
+    assert (root, links, all) == (
+        None,
+        [
+            ['css selector', '#form'],
+            ['css selector', '.row'],
+            ['css selector', 'input'],
+        ],
+        True,
+    )
+
+
+def test_element_chain_not_found_by_compiled_selector_is_located_link_by_link():
+    driver = FakeDriver(found_by_compiled=False)
+    browser = browser_with(driver, _compile_selector_chains=True)
+
+    browser.element('//form').element('.//div').all('./input').locate()
+
+    assert driver.log == [
+        'find all ((//form)[1]/.//div)[1]/./input',
+        'find (//form)[1]/.//div',
+        'find //form',
+        'find .//div in //form',
+        'find all ./input in .//div',
+    ]
+
+
+def test_element_chain_is_located_link_by_link_if_not_compiled():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    browser.element('#form').element('.row').element('input').locate()
+
+    assert driver.log == ['find #form', 'find .row in #form', 'find input in .row']
+    assert driver.scripts == []
+
+
+def test_element_chain_is_continued_from_element_after_not_compilable_link():
+    driver = FakeDriver()
+    browser = browser_with(driver, _compile_selector_chains=True)
+
+    browser.element('#form').element(('link text', 'Home')).element('.row').element(
+        'input'
+    ).locate()
+
+    assert driver.log == ['find #form', 'find Home in #form']
+    [(_, root, links, all)] = driver.scripts
+    assert root.name == 'Home'
+    assert (links, all) == (
+        [['css selector', '.row'], ['css selector', 'input']],
+        False,
+    )
@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from selene import query
+from selene.core import _form
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeDriver(fakes.FakeDriver):
+    """Does not find the `missing` fields on filling"""
+
+    def __init__(self, *, missing=()):
+        super().__init__(script_result=list(missing))
+
+    def execute_script(self, script, *arguments):
+        missing = super().execute_script(script, *arguments)
+        if script == _form._VALUES_SCRIPT:
+            return {'first-name': 'Yakiv', 'agree': True}
+        return missing
+
+
+def test_fill_sets_all_values_by_one_script():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    browser.element('#form').fill({'first-name': 'Yakiv', 'agree': True})
+
+    [(script, form, values)] = driver.scripts
+    assert script == _form._FILL_SCRIPT
+    assert form.name == '#form'
+    assert values == {'first-name': 'Yakiv', 'agree': True}
+
+
+def test_fill_fails_on_not_found_fields():
+    driver = FakeDriver(missing=['last-name'])
+    browser = browser_with(driver, timeout=0.1)
+
+    with pytest.raises(AssertionError) as error:
+        browser.element('#form').fill({'last-name': 'Kramarenko'})
+
+    assert "Reason: _SeleneError: fields not found: last-name" in str(error.value)
+
+
+def test_fill_is_described_by_names_of_fields_only():
+    driver = FakeDriver(missing=['password'])
+    browser = browser_with(driver, timeout=0.1)
+
+    with pytest.raises(AssertionError) as error:
+        browser.element('#form').fill({'login': 'yakiv', 'password': 'secret'})
+
+    assert "element(('css selector', '#form')).fill: login, password" in str(
+        error.value
+    )
+    assert 'secret' not in str(error.value)
+
+
+def test_form_values_are_read_by_one_script():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    values = browser.element('#form').get(query.form_values)
+
+    assert values == {'first-name': 'Yakiv', 'agree': True}
+    assert len(driver.scripts) == 1
@@ -0,0 +1,197 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+
+from selenium.common import JavascriptException
+from selenium.webdriver.remote.webelement import WebElement
+
+from selene import have
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class FakeWebElement(fakes.FakeWebElement, WebElement):
+    """Is a WebElement, to be observed for DOM mutations by itself"""
+
+    def __init__(self, text):
+        super().__init__('#text', text=text)
+
+
+class FakeDriver(fakes.FakeDriver):
+    """Resolves each observation at once, as if some mutation happened,
+    and changes the element text on the `mutating_at` observation (if any)
+    """
+
+    def __init__(self, element, *, observing=True, mutating_at=2, blocking=False):
+        super().__init__({'#text': element})
+        self.element = element
+        self.mutating_at = mutating_at
+        self.observing = observing
+        self.blocking = blocking
+        self.observed = []
+
+    def execute_async_script(self, script, element, ms):
+        self.observed.append((element, ms))
+        if not self.observing:
+            raise JavascriptException('not supported')
+        if self.blocking:
+            # i.e. no mutation happens till the end of the slice
+            time.sleep(ms / 1000)
+            return False
+        if len(self.observed) == self.mutating_at:
+            self.element._text = 'changed'
+        return True
+
+
+def test_waits_for_dom_mutations_of_located_element_instead_of_polling():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(
+        driver, timeout=4, poll_during_waits=0, _wait_for_dom_mutations=True
+    )
+
+    browser.element('#text').should(have.exact_text('changed'))
+
+    assert [observed for observed, _ in driver.observed] == [element, element]
+    # not longer than two polling delays, or 0.1s if no polling
+    assert all(ms == 100 for _, ms in driver.observed)
+
+
+def test_waits_for_dom_mutations_of_whole_page_for_collection():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(driver, _wait_for_dom_mutations=True)
+
+    browser.all('#text').should(have.exact_texts('changed'))
+
+    assert [observed for observed, _ in driver.observed] == [None, None]
+
+
+def test_observes_not_shorter_than_poll_delay():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(
+        driver, timeout=0.4, poll_during_waits=200, _wait_for_dom_mutations=True
+    )
+
+    browser.element('#text').should(have.exact_text('changed'))
+
+    assert all(150 < ms <= 200 for _, ms in driver.observed)
+
+
+def test_observes_not_longer_than_two_poll_delays_by_default():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(
+        driver, timeout=4, poll_during_waits=50, _wait_for_dom_mutations=True
+    )
+
+    browser.element('#text').should(have.exact_text('changed'))
+
+    assert all(ms == 100 for _, ms in driver.observed)
+
+
+def test_observing_slice_is_configurable():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(
+        driver,
+        timeout=4,
+        poll_during_waits=50,
+        _wait_for_dom_mutations=True,
+        _wait_for_dom_mutations_cap=2.0,
+        _wait_for_dom_mutations_fraction=0.1,
+    )
+
+    browser.element('#text').should(have.exact_text('changed'))
+
+    # a tenth of remaining timeout, as it is less than the cap
+    assert all(300 < ms <= 400 for _, ms in driver.observed)
+
+
+def test_notices_not_mutation_change_within_about_one_poll_delay():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element, blocking=True, mutating_at=None)
+    browser = browser_with(
+        driver, timeout=4, poll_during_waits=100, _wait_for_dom_mutations=True
+    )
+    # e.g. a change of the value property by typing, that is not a mutation
+    changing = threading.Timer(0.15, lambda: setattr(element, '_text', 'changed'))
+
+    started = time.monotonic()
+    changing.start()
+    browser.element('#text').should(have.exact_text('changed'))
+    noticed_after_change = time.monotonic() - started - 0.15
+
+    assert noticed_after_change < 0.25
+
+
+def test_falls_back_to_polling_when_async_scripts_are_not_supported():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element, observing=False)
+    browser = browser_with(
+        driver, timeout=0.3, poll_during_waits=100, _wait_for_dom_mutations=True
+    )
+
+    started = time.monotonic()
+    try:
+        browser.element('#text').should(have.exact_text('changed'))
+    except AssertionError as error:
+        assert 'changed' in str(error)
+
+    # still sleeps between attempts, and does not fail until timeout
+    assert time.monotonic() - started >= 0.3
+    assert 2 <= len(driver.observed) <= 4
+
+
+def test_does_not_busy_loop_on_continuously_mutating_page():
+    element = FakeWebElement('spinning')
+    # i.e. the observer is resolved at once by some mutation each time,
+    # while the text never changes to the expected one
+    driver = FakeDriver(element, mutating_at=None)
+    browser = browser_with(
+        driver, timeout=0.5, poll_during_waits=100, _wait_for_dom_mutations=True
+    )
+
+    started = time.monotonic()
+    try:
+        browser.element('#text').should(have.exact_text('changed'))
+    except AssertionError:
+        pass
+
+    # i.e. not more often than by polling each 100ms
+    assert time.monotonic() - started >= 0.5
+    assert 3 <= len(driver.observed) <= 6
+
+
+def test_polls_as_usual_when_turned_off():
+    element = FakeWebElement('initial')
+    driver = FakeDriver(element)
+    browser = browser_with(driver, timeout=0.2)
+
+    try:
+        browser.element('#text').should(have.exact_text('changed'))
+    except AssertionError:
+        pass
+
+    assert driver.observed == []
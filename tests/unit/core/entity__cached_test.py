@@ -0,0 +1,46 @@
+from tests.helpers.fakes import FakeDriver, browser_with
+
+
+def test_cached_element_is_located_lazily_once():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+
+    cached = browser.element('#a').cached
+    assert driver.log == []
+
+    assert cached().name == '#a'
+    assert cached() is cached()
+    assert driver.log == ['find #a']
+
+
+def test_cached_collection_is_located_lazily_once():
+    driver = FakeDriver(size=3)
+    browser = browser_with(driver)
+
+    cached = browser.all('li').cached
+    assert driver.log == []
+
+    assert [webelement.name for webelement in cached()] == ['li[0]', 'li[1]', 'li[2]']
+    assert cached[1]().name == 'li[1]'
+    assert driver.log == ['find all li']
+
+
+def test_cached_entity_is_located_again_after_ttl():
+    driver = FakeDriver()
+    browser = browser_with(driver, _cached_entities_ttl=0)
+
+    cached = browser.element('#a').cached
+    cached()
+    cached()
+
+    assert driver.log == ['find #a', 'find #a']
+
+
+def test_collection_is_iterated_over_one_snapshot():
+    driver = FakeDriver(size=200)
+    browser = browser_with(driver)
+
+    names = [element().name for element in browser.all('li')]
+
+    assert names == [f'li[{index}]' for index in range(200)]
+    assert driver.log == ['find all li']
@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+from tests.helpers.fakes import FakeDriver, browser_with
+
+
+def test_element_reuses_built_wait():
+    browser = browser_with(FakeDriver())
+    element = browser.element('#a')
+
+    assert element.wait is element.wait
+
+
+def test_element_rebuilds_wait_once_shared_config_option_changed():
+    browser = browser_with(FakeDriver())
+    element = browser.element('#a')
+    wait = element.wait
+
+    browser.config.timeout = 2
+
+    assert element.wait is not wait
+    assert element.wait._timeout == 2
+    assert element.wait is element.wait
+
+
+def test_element_logging_outer_html_reuses_built_wait():
+    browser = browser_with(FakeDriver(), log_outer_html_on_failure=True)
+    element = browser.element('#a')
+
+    assert element.wait is element.wait
+
+
+def test_element_builds_wait_each_time_if_memoizing_is_off():
+    browser = browser_with(FakeDriver(), _memoize_waits=False)
+    element = browser.element('#a')
+
+    assert element.wait is not element.wait
+
+
+def test_element_rebuilds_wait_once_option_shared_with_derived_config_changed():
+    browser = browser_with(FakeDriver())
+    element = browser.with_(base_url='https://autotest.how').element('#a')
+    wait = element.wait
+
+    browser.config.timeout = 2
+
+    assert element.wait is not wait
+    assert element.wait._timeout == 2
+
+
+def test_element_reuses_wait_once_option_not_affecting_it_changed():
+    browser = browser_with(FakeDriver())
+    element = browser.element('#a')
+    wait = element.wait
+
+    browser.config.base_url = 'https://autotest.how'
+
+    assert element.wait is wait
+
+
+def test_element_reuses_wait_once_option_of_another_config_changed():
+    browser = browser_with(FakeDriver())
+    another = browser_with(FakeDriver())
+    element = browser.element('#a')
+    wait = element.wait
+
+    another.config.timeout = 2
+
+    assert element.wait is wait
+
+
+def test_element_wait_reflects_options_changed_concurrently():
+    browser = browser_with(FakeDriver())
+    element = browser.element('#a')
+    changed = threading.Barrier(10)
+    version = browser.config._wait_options_version
+
+    def change_timeout(timeout):
+        changed.wait()
+        browser.config.timeout = timeout
+        assert element.wait is not None
+
+    threads = [
+        threading.Thread(target=change_timeout, args=(timeout,))
+        for timeout in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert element.wait._timeout == browser.config.timeout
+    assert browser.config._wait_options_version - version == 10
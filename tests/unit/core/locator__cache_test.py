@@ -0,0 +1,111 @@
+from selenium.common import StaleElementReferenceException
+
+from selene.core.locator import Locator, _LocatedCache
+from tests.helpers import fakes
+from tests.helpers.fakes import browser_with
+
+
+class StaleWebElement(fakes.FakeWebElement):
+    def click(self):
+        raise StaleElementReferenceException('stale element reference')
+
+
+class FakeDriver(fakes.FakeDriver):
+    def __init__(self):
+        super().__init__()
+        self.stale_found = 0
+
+    def element(self, name):
+        if self.stale_found:
+            self.stale_found -= 1
+            return StaleWebElement(name, self)
+        return super().element(name)
+
+
+def test_locator_reuses_located_while_scope_is_the_same():
+    scope = ['first']
+    located = []
+    locator = Locator(
+        'element',
+        lambda: located.append('located') or len(located),
+        _cache_scope=lambda: scope[0],
+    )
+
+    assert locator() == 1
+    assert locator() == 1
+
+    scope[0] = 'second'
+    assert locator() == 2
+
+
+def test_locator_does_not_cache_by_default():
+    located = []
+    locator = Locator('element', lambda: located.append('located') or len(located))
+
+    assert locator() == 1
+    assert locator() == 2
+
+
+def test_located_cache_scope_is_versioned_per_driver():
+    driver = FakeDriver()
+    another = FakeDriver()
+    scope = _LocatedCache.scope_of(driver)
+
+    _LocatedCache.invalidate(driver)
+
+    assert _LocatedCache.scope_of(driver) != scope
+    assert _LocatedCache.scope_of(another) == (id(another), 0)
+
+
+def test_element_chain_is_located_once_for_many_commands():
+    driver = FakeDriver()
+    browser = browser_with(driver, _cache_located_elements=True)
+    element = browser.element('#a').element('.b').element('.c')
+
+    element.click()
+    element.click()
+    element.click()
+
+    assert driver.log == [
+        'find #a',
+        'find .b in #a',
+        'find .c in .b',
+        'click .c',
+        'click .c',
+        'click .c',
+    ]
+
+
+def test_element_chain_is_located_again_after_stale_element():
+    driver = FakeDriver()
+    browser = browser_with(driver, _cache_located_elements=True, poll_during_waits=0)
+    element = browser.element('#a').element('.b')
+    driver.stale_found = 2  # both elements of the chain are stale at first
+
+    element.click()
+
+    assert driver.log == [
+        'find #a',
+        'find .b in #a',
+        'find #a',
+        'find .b in #a',
+        'click .b',
+    ]
+
+
+def test_element_chain_is_located_on_each_command_by_default():
+    driver = FakeDriver()
+    browser = browser_with(driver)
+    element = browser.element('#a').element('.b')
+
+    element.click()
+    element.click()
+
+    assert driver.log == [
+        'find #a',
+        'find .b in #a',
+        'click .b',
+        'find #a',
+        'find .b in #a',
+        'click .b',
+    ]
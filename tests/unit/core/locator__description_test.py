@@ -0,0 +1,53 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from selene.core.locator import Locator
+from tests.helpers.fakes import FakeDriver, browser_with
+
+
+def test_lazy_description_is_not_rendered_till_needed():
+    rendered = []
+    locator = Locator(lambda: rendered.append(True) or 'element', lambda: None)
+
+    assert rendered == []
+    assert str(locator) == 'element'
+
+
+def test_lazy_description_reflects_current_state_on_each_render():
+    platform = ['android']
+    locator = Locator(lambda: f'element on {platform[0]}', lambda: None)
+
+    assert str(locator) == 'element on android'
+
+    platform[0] = 'ios'
+    assert str(locator) == 'element on ios'
+
+
+def test_chained_element_description_reflects_current_parent_description():
+    platform = ['android']
+    parent = browser_with(FakeDriver()).element('#a')
+    parent._locator = Locator(lambda: f'element on {platform[0]}', lambda: None)
+    element = parent.element('.b')
+
+    assert str(element) == "element on android.element(('css selector', '.b'))"
+
+    platform[0] = 'ios'
+    assert str(element) == "element on ios.element(('css selector', '.b'))"
@@ -0,0 +1,49 @@
+import pytest
+
+from selene.core import match
+from tests.helpers.fakes import FakeCollection, FakeWebElement
+
+
+def collection_of(*texts, **config_options):
+    return FakeCollection([FakeWebElement(text) for text in texts], **config_options)
+
+
+def test_exact_texts_like_builds_expected_pattern_once_per_globs_and_flags():
+    condition = match._exact_texts_like('a', ..., 'z')
+    collection = collection_of('a', 'b', 'c', 'z')
+
+    condition(collection)
+    condition(collection)
+    condition(collection_of('a', 'z', 'z'))
+
+    assert len(condition._exact_texts_like__patterns) == 1
+
+    condition(collection_of('A', 'b', 'Z', _match_ignoring_case=True))
+
+    assert len(condition._exact_texts_like__patterns) == 2
+
+
+def test_exact_texts_like_cache_takes_config_placeholders_into_account():
+    condition = match._exact_texts_like('a', '*', 'z')
+    condition(
+        collection_of(
+            'a', 'b', 'z', _placeholders_to_match_elements={'exactly_one': '*'}
+        )
+    )
+
+    with pytest.raises(AssertionError):
+        condition(collection_of('a', 'b', 'z'))
+
+    assert len(condition._exact_texts_like__patterns) == 2
+
+
+def test_text_patterns_like_keeps_reporting_invalid_regex():
+    condition = match._text_patterns_like('a(', ...)
+
+    with pytest.raises(AssertionError) as error:
+        condition(collection_of('a', 'b'))
+    with pytest.raises(AssertionError) as error_from_cache:
+        condition(collection_of('a', 'b'))
+
+    assert 'RegexError: missing ), unterminated subpattern' in str(error.value)
+    assert str(error.value) == str(error_from_cache.value)
@@ -0,0 +1,51 @@
+from selene.core import query
+from selene.core._snapshot import _snapshot
+from tests.helpers.fakes import FakeCollection, FakeDriver
+
+
+def test_snapshot_is_not_taken_if_turned_off():
+    driver = FakeDriver(script_result=[])
+    collection = FakeCollection(['li1', 'li2'], driver=driver)
+
+    assert _snapshot(collection) is None
+    assert driver.scripts == []
+
+
+def test_snapshot_takes_all_elements_by_one_script_call():
+    driver = FakeDriver(
+        script_result=[
+            ['Alex!', True, ['alex']],
+            ['', False, ['hidden']],
+        ]
+    )
+    collection = FakeCollection(
+        ['li1', 'li2'], driver=driver, _snapshot_collections_by_js=True
+    )
+
+    snapshot = _snapshot(collection, attributes=['id'])
+
+    assert [element.text for element in snapshot] == ['Alex!', '']
+    assert [element.displayed for element in snapshot] == [True, False]
+    assert [element.attributes for element in snapshot] == [
+        {'id': 'alex'},
+        {'id': 'hidden'},
+    ]
+    [(_, webelements, attributes)] = driver.scripts
+    assert (webelements, attributes) == (['li1', 'li2'], ['id'])
+
+
+def test_collection_queries_use_snapshot_when_turned_on():
+    driver = FakeDriver(
+        script_result=[
+            ['Alex!', True, ['alex']],
+            ['', False, ['hidden']],
+        ]
+    )
+    collection = FakeCollection(
+        ['li1', 'li2'], driver=driver, _snapshot_collections_by_js=True
+    )
+
+    assert query.texts(collection) == ['Alex!', '']
+    assert query.visible_texts(collection) == ['Alex!']
+    assert query.attributes('id')(collection) == ['alex', 'hidden']
+    assert len(driver.scripts) == 3
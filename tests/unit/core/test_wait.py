@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
+
 import pytest
 
-from selene.core.wait import Wait
+from selene.common import fp
+from selene.core.wait import Wait, poll, retry, _budget, _current_deadline
 
 
 # TODO: break down into actual unit tests or move elsewhere as e2e
@@ -158,3 +161,422 @@ def test_simple_waiting_entity_lifecycle__when_fn_is_callable():
     #     assert 'Timed out after 0.5s, while waiting for:' in str(error)
     #     assert 'Entity(None).has attribute defined' in str(error)  # <- THEN
     #     assert 'Reason: AssertionError: attribute is None' in str(error)
+
+
+def test_wait_sleeps_between_attempts_by_poll_schedule():
+    # GIVEN
+    class Entity:
+        def __init__(self):
+            self.checks = 0
+
+        def __str__(self):
+            return 'Entity'
+
+    def has_third_check(entity: Entity):
+        entity.checks += 1
+        if entity.checks < 3:
+            raise AssertionError('not yet')
+        return entity
+
+    delays = []
+    entity = Entity()
+    wait = Wait(
+        entity,
+        at_most=1.0,
+        _poll=lambda attempt: delays.append(attempt) or 0.01,
+    )
+
+    # WHEN
+    wait.for_(has_third_check)
+
+    # THEN
+    assert entity.checks == 3
+    assert delays == [1, 2]
+
+
+def test_wait_never_sleeps_past_deadline_by_poll_schedule():
+    # GIVEN
+    import time
+
+    wait = Wait('Entity', at_most=0.2, _poll=lambda attempt: 10.0)
+    attempts = []
+
+    def never(entity):
+        attempts.append(entity)
+        raise AssertionError('never')
+
+    # WHEN
+    started = time.monotonic()
+    with pytest.raises(AssertionError) as error:
+        wait.for_(never)
+
+    # THEN
+    assert time.monotonic() - started < 1.0
+    assert len(attempts) == 2
+    assert 'Timed out after 0.2s' in str(error.value)
+
+
+def test_wait_counts_attempts_per_call_when_reused_by_nested_call():
+    # GIVEN
+    delays = []
+    wait = Wait(
+        'Entity',
+        at_most=1.0,
+        _poll=lambda attempt: delays.append(attempt) or 0.01,
+    )
+    attempts = []
+
+    def has_third_attempt_waiting_for_nested(entity):
+        wait.for_(lambda entity: entity)
+        attempts.append(entity)
+        if len(attempts) < 3:
+            raise AssertionError('not yet')
+
+    # WHEN
+    wait.for_(has_third_attempt_waiting_for_nested)
+
+    # THEN the nested call did not reset the attempts of the outer one
+    assert delays == [1, 2]
+
+
+def test_wait_keeps_poll_schedule_when_rebuilt():
+    schedule = poll.fixed(0.05)
+    wait = Wait('Entity', at_most=1.0, _poll=schedule)
+
+    assert wait.at_most(2.0)._poll is schedule
+    assert wait.or_fail_with(None)._poll is schedule
+    assert wait.with_(decorator=None)._poll is schedule
+
+
+def test_wait_pauses_between_attempts_instead_of_sleeping():
+    # GIVEN
+    class Entity:
+        def __init__(self):
+            self.checks = 0
+
+        def __str__(self):
+            return 'Entity'
+
+    def has_third_check(entity: Entity):
+        entity.checks += 1
+        if entity.checks < 3:
+            raise AssertionError('not yet')
+        return entity
+
+    pauses = []
+    entity = Entity()
+    wait = Wait(
+        entity,
+        at_most=1.0,
+        _poll=lambda attempt: 10.0,
+        _pause=lambda entity, delay, remaining: pauses.append(
+            (entity, delay, remaining)
+        ),
+    )
+
+    # WHEN
+    wait.for_(has_third_check)
+
+    # THEN never slept the 10s poll delay
+    assert entity.checks == 3
+    assert [paused for paused, _, _ in pauses] == [entity, entity]
+    # AND the delay is limited by the remaining time
+    assert all(0 < delay == remaining <= 1.0 for _, delay, remaining in pauses)
+
+
+def test_wait_pauses_with_zero_delay_when_no_poll_schedule():
+    pauses = []
+    wait = Wait(
+        'Entity',
+        at_most=0.1,
+        _pause=lambda entity, delay, remaining: pauses.append(delay),
+    )
+
+    def never(entity):
+        raise AssertionError('never')
+
+    with pytest.raises(AssertionError):
+        wait.for_(never)
+
+    assert pauses
+    assert set(pauses) == {0.0}
+
+
+def test_wait_keeps_pause_when_rebuilt():
+    def pause(entity, delay, remaining):
+        pass
+
+    wait = Wait('Entity', at_most=1.0, _pause=pause)
+
+    assert wait.at_most(2.0)._pause is pause
+    assert wait.or_fail_with(None)._pause is pause
+    assert wait.with_(decorator=None)._pause is pause
+
+
+def test_poll_schedules():
+    assert [poll.fixed(0.1)(attempt) for attempt in (1, 2, 10)] == [0.1, 0.1, 0.1]
+    assert [poll.backoff(0.1, factor=2, cap=0.5)(n) for n in (1, 2, 3, 4)] == [
+        0.1,
+        0.2,
+        0.4,
+        0.5,
+    ]
+    assert all(0.08 <= poll.backoff(0.1, jitter=0.2)(1) <= 0.12 for _ in range(100))
+    assert [poll.fast_then_slow(0.01, 0.5, fast_attempts=2)(n) for n in (1, 2, 3)] == [
+        0.01,
+        0.01,
+        0.5,
+    ]
+
+
+def test_nested_wait_shares_remaining_budget_of_outer_wait():
+    # GIVEN
+    import time
+
+    inner_timeouts = []
+
+    def has_inner_waited(entity):
+        started = time.monotonic()
+        try:
+            Wait(entity, at_most=5.0).for_(lambda it: fp.raise_(AssertionError('no')))
+        finally:
+            inner_timeouts.append(time.monotonic() - started)
+
+    # WHEN
+    started = time.monotonic()
+    with pytest.raises(AssertionError):
+        Wait('Entity', at_most=0.3).for_(has_inner_waited)
+
+    # THEN inner wait did not start its own 5s timeout
+    assert time.monotonic() - started < 1.0
+    assert all(inner_timeout < 0.5 for inner_timeout in inner_timeouts)
+
+
+def test_nested_wait_cut_short_by_outer_budget_reports_time_actually_spent():
+    # GIVEN
+    inner_failures = []
+
+    def has_inner_waited(entity):
+        try:
+            Wait(entity, at_most=5.0).for_(lambda it: fp.raise_(AssertionError('no')))
+        except AssertionError as error:
+            inner_failures.append(str(error))
+            raise
+
+    # WHEN
+    with pytest.raises(AssertionError) as outer_failure:
+        Wait('Entity', at_most=0.3).for_(has_inner_waited)
+
+    # THEN
+    assert 'Timed out after 0.3s, while waiting for:' in str(outer_failure.value)
+    assert inner_failures
+    assert re.search(
+        r'Timed out after 0\.[0-3]\d\ds of 5\.0s'
+        r' \(the budget of an outer wait ended earlier\), while waiting for:',
+        inner_failures[-1],
+    )
+
+
+def test_budget_narrows_to_earliest_deadline():
+    with _budget(10.0) as outer:
+        with _budget(0.5) as inner:
+            assert inner is not outer
+            assert inner.remaining <= 0.5
+        with _budget(20.0) as inner:
+            assert inner is outer
+    assert _current_deadline.get() is None
+
+
+def test_wait_reports_metrics_of_each_call():
+    # GIVEN
+    events = []
+    checks = []
+
+    def has_third_check(entity):
+        checks.append(entity)
+        if len(checks) < 3:
+            raise AssertionError('not yet')
+
+    wait = Wait('Entity', at_most=1.0, _report=events.append)
+
+    # WHEN
+    wait.for_(has_third_check)
+    with pytest.raises(AssertionError):
+        wait.at_most(0.05).for_(lambda entity: {}['missing'])
+
+    # THEN
+    succeeded, failed = events
+    assert succeeded.entity == 'Entity'
+    assert succeeded.name == 'has_third_check'
+    assert succeeded.attempts == 3
+    assert succeeded.exceptions == {'AssertionError': 2}
+    assert succeeded.succeeded
+    assert not failed.succeeded
+    assert set(failed.exceptions) == {'KeyError'}
+    assert failed.exceptions['KeyError'] == failed.attempts
+
+
+def test_wait_fails_fast_on_not_retriable_exception():
+    # GIVEN
+    import re
+    import time
+
+    hooked = []
+    wait = Wait(
+        'Entity',
+        at_most=5.0,
+        or_fail_with=lambda error: hooked.append(error) or error,
+        _poll=poll.fixed(0.01),
+        _retry=retry.unless_broken(),
+    )
+
+    attempts = []
+
+    def has_invalid_pattern(entity):
+        attempts.append(entity)
+        re.compile('*')
+
+    # WHEN
+    started = time.monotonic()
+    with pytest.raises(AssertionError) as error:
+        wait.for_(has_invalid_pattern)
+
+    # THEN
+    assert time.monotonic() - started < 1.0
+    assert len(attempts) == 1
+    assert hooked == [error.value]
+    assert 'Failed without retrying after ' in str(error.value)
+    assert (
+        ', while waiting for:\n'
+        'Entity.has_invalid_pattern\n'
+        '\n'
+        'Reason: error: nothing to repeat\n'
+    ) in str(error.value)
+
+
+def test_wait_retries_on_retriable_exception_until_passed():
+    # GIVEN
+    attempts = []
+
+    def passed_on_third_attempt(entity):
+        attempts.append(entity)
+        if len(attempts) < 3:
+            raise AssertionError('not yet')
+
+    wait = Wait('Entity', at_most=1.0, _retry=retry.on_transient())
+
+    # WHEN
+    wait.for_(passed_on_third_attempt)
+
+    # THEN
+    assert len(attempts) == 3
+
+
+def test_wait_keeps_retry_policy_when_rebuilt():
+    policy = retry.on_transient()
+    wait = Wait('Entity', at_most=1.0, _retry=policy)
+
+    assert wait.at_most(2.0)._retry is policy
+    assert wait.or_fail_with(None)._retry is policy
+    assert wait.with_(decorator=None)._retry is policy
+
+
+def test_wait_until_fails_fast_on_not_retriable_exception():
+    import time
+
+    wait = Wait('Entity', at_most=5.0, _retry=retry.on_transient())
+
+    def broken(entity):
+        raise TypeError('broken')
+
+    started = time.monotonic()
+    assert wait.until(broken) is False
+    assert time.monotonic() - started < 1.0
+
+
+def test_retry_policies():
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        InvalidSelectorException,
+        JavascriptException,
+        StaleElementReferenceException,
+    )
+    from selene.core.exceptions import ConditionMismatch
+
+    on_transient = retry.on_transient()
+    assert on_transient(StaleElementReferenceException())
+    assert on_transient(ElementClickInterceptedException())
+    assert on_transient(ConditionMismatch())
+    assert on_transient(JavascriptException())
+    assert not on_transient(TypeError())
+    assert retry.on_transient(TypeError)(TypeError())
+
+    unless_broken = retry.unless_broken()
+    assert unless_broken(JavascriptException())
+    assert unless_broken(TypeError())
+    assert not unless_broken(InvalidSelectorException())
+    assert not retry.unless_broken(TypeError)(TypeError())
+
+    assert retry.always()(InvalidSelectorException())
+
+
+def test_default_retry_strategy_fails_fast_on_errors_in_custom_code():
+    import time
+    from selene import Config
+
+    config = Config(
+        timeout=5,
+        save_screenshot_on_failure=False,
+        save_page_source_on_failure=False,
+    )
+    calls = []
+
+    def broken(entity):
+        calls.append(entity)
+        raise TypeError('oops')
+
+    started = time.monotonic()
+    with pytest.raises(AssertionError) as error:
+        config.wait('Entity').for_(broken)
+
+    assert time.monotonic() - started < 1.0
+    assert calls == ['Entity']
+    assert 'Failed without retrying' in str(error.value)
+    assert 'TypeError: oops' in str(error.value)
+
+
+def test_default_retry_strategy_retries_error_thrown_by_js_on_not_visible_element():
+    from selenium.common.exceptions import JavascriptException
+    from selene import Config
+
+    config = Config(
+        timeout=5,
+        save_screenshot_on_failure=False,
+        save_page_source_on_failure=False,
+    )
+    attempts = []
+
+    def click_by_js(entity):
+        attempts.append(entity)
+        if len(attempts) < 3:
+            raise JavascriptException(
+                'javascript error: element <input> is not visible'
+            )
+
+    config.wait('Entity').for_(click_by_js)
+
+    assert attempts == ['Entity'] * 3
+
+
+def test_default_retry_strategy_retries_dead_session_only_if_rebuilt():
+    from selenium.common.exceptions import InvalidSessionIdException
+    from selene import Config
+
+    def policy_of(config):
+        return config._retry_strategy(config)
+
+    assert policy_of(Config(rebuild_not_alive_driver=True))(InvalidSessionIdException())
+    assert not policy_of(Config(rebuild_not_alive_driver=False))(
+        InvalidSessionIdException()
+    )
+    assert not policy_of(Config())(TypeError())
@@ -0,0 +1,83 @@
+# MIT License
+#
+# Copyright (c) 2015-2022 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[2]
+
+# all available after bare `import selene` when everything was imported eagerly
+ATTRIBUTE_PATHS = [
+    'Browser',
+    'Config',
+    'browser',
+    'be.visible',
+    'have.text',
+    'command.js',
+    'query.text',
+    'match.visible',
+    'Element',
+    'Collection',
+    'core.query.text',
+    'core.command.js',
+    'core.condition.Condition',
+    'core.configuration.Config',
+    'core.Element',
+    'support.by.css',
+    'support.conditions.have.text',
+    'support.conditions.be.visible',
+    'support.conditions.not_.visible',
+    'support.shared.browser',
+    'support._logging',
+    'web.Element',
+    'web.Browser',
+    'common',
+    'common.predicate.equals',
+    'common.helpers',
+]
+
+
+@pytest.mark.parametrize('path', ATTRIBUTE_PATHS)
+def test_attribute_path_is_available_after_bare_import_selene(path):
+    # in a fresh interpreter, so nothing is imported yet by other tests
+    code = (
+        'import functools, selene;'
+        f'print(functools.reduce(getattr, {path!r}.split("."), selene))'
+    )
+
+    subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, check=True
+    )
+
+
+def test_absent_attribute_is_reported_as_attribute_error():
+    import selene
+    import selene.support.conditions
+
+    with pytest.raises(AttributeError, match="module 'selene' has no attribute"):
+        getattr(selene, 'absent')
+    with pytest.raises(AttributeError, match="'selene.core' has no attribute"):
+        getattr(selene.core, 'absent')
+    with pytest.raises(AttributeError, match="'selene.support.conditions' has no"):
+        getattr(selene.support.conditions, 'absent')
@@ -0,0 +1,67 @@
+from selene.core.wait import Wait, _WaitEvent
+from selene.support._metrics import WaitMetrics, counting_webdriver_calls
+
+
+def event(entity, duration, exceptions=None, succeeded=True, calls=0):
+    return _WaitEvent(
+        entity=entity,
+        name='click',
+        attempts=sum((exceptions or {}).values()) + (1 if succeeded else 0),
+        duration=duration,
+        succeeded=succeeded,
+        exceptions=exceptions or {},
+        webdriver_calls=calls,
+    )
+
+
+def test_wait_metrics_aggregates_slowest_waits_and_flakiest_locators():
+    metrics = WaitMetrics()
+    metrics(event('#a', 0.1))
+    metrics(event('#b', 2.0, {'AssertionError': 3}, calls=4))
+    metrics(event('#c', 4.0, {'NoSuchElementException': 40}, succeeded=False))
+    metrics(event('#b', 0.5, {'AssertionError': 1}))
+
+    assert [e.entity for e in metrics.slowest(2)] == ['#c', '#b']
+    assert [tuple(f) for f in metrics.flakiest()] == [('#c', 40, 1), ('#b', 4, 2)]
+    report = metrics.report(top=1)
+    assert report.splitlines()[0] == (
+        'waits: 4, failed: 1, total time: 6.600s, webdriver calls: 4'
+    )
+    assert '  4.000s (40 attempts, failed) #c.click' in report
+    assert '  40 failed attempts in 1 waits: #c' in report
+
+    metrics.clear()
+    assert metrics.slowest() == []
+    assert metrics.flakiest() == []
+    assert metrics.report().splitlines()[0] == (
+        'waits: 0, failed: 0, total time: 0.000s, webdriver calls: 0'
+    )
+
+
+def test_wait_metrics_keeps_only_slowest_events_but_counts_all():
+    metrics = WaitMetrics(keep_slowest=2)
+    for duration in [0.3, 0.1, 0.5, 0.2, 0.4]:
+        metrics(event('#a', duration, {'AssertionError': 1}))
+
+    assert [e.duration for e in metrics.slowest(10)] == [0.5, 0.4]
+    assert len(metrics._slowest) == 2
+    assert [tuple(f) for f in metrics.flakiest()] == [('#a', 5, 5)]
+    assert metrics.report().splitlines()[0] == (
+        'waits: 5, failed: 0, total time: 1.500s, webdriver calls: 0'
+    )
+
+
+def test_counted_webdriver_calls_are_reported_per_wait():
+    class FakeDriver:
+        def execute(self, command, params=None):
+            return {'value': command}
+
+    driver = counting_webdriver_calls(FakeDriver())
+    metrics = WaitMetrics()
+
+    Wait(driver, at_most=1.0, _report=metrics).for_(
+        lambda it: it.execute('a') and it.execute('b')
+    )
+
+    [reported] = metrics.slowest()
+    assert reported.webdriver_calls == 2